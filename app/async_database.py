@@ -0,0 +1,423 @@
+try:
+    import aiomysql
+    AIOMYSQL_AVAILABLE = True
+except ImportError:
+    AIOMYSQL_AVAILABLE = False
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from .config import Config
+from .database import _query_cache, _record_timing, _FAILED
+from .query_cache import QueryCache, statement_tables, affected_tables, is_write
+from .query_stats import AsyncTimedCursor, QueryTiming
+
+"""
+비동기(asyncio) 데이터 계층 모듈 - app/database.py 의 비동기 버전
+
+aiomysql 이 설치된 경우에만 사용할 수 있습니다 (pip install aiomysql).
+쿼리 결과 캐시는 동기 데이터 계층과 공유하므로 어느 쪽의 변경이든 양쪽 캐시 결과가 무효화됩니다.
+
+- 커넥션 풀: aiomysql 풀은 이벤트 루프에 묶이므로 이벤트 루프마다 하나씩 생성
+- 작업 단위: async with transaction() 블록 안의 쿼리는 하나의 연결과 트랜잭션 공유 (contextvars 기준)
+  자식 Task 도 작업 단위를 물려받으며, 같은 연결을 쓰므로 동시에 실행한 조회도 차례로 실행됨
+- Flask 비동기 뷰: 요청마다 새 이벤트 루프에서 실행되므로 on_db_loop() 로
+  프로세스 공용 DB 이벤트 루프에서 실행해야 요청 간에 풀을 재사용합니다.
+- 쿼리 계측: 쿼리 지문별 통계와 느린 쿼리 로그(app/query_stats.py)에 동기 쿼리와 함께 기록합니다.
+  DB 이벤트 루프 스레드에서 실행되므로 요청별 쿼리 수/DB 시간(QUERY_LOG_REQUESTS)에는 포함되지 않습니다.
+- 읽기 복제본(app/replicas.py)은 사용하지 않고 모든 조회를 기본 DB 에서 실행합니다.
+  (복제본 풀/지연 점검이 동기 연결 기준이므로, 변경 직후 조회도 항상 최신 데이터를 읽음)
+
+사용법:
+    customer = await execute_query("SELECT * FROM customer WHERE customer_id = %s", (1,), fetch_one=True)
+
+    async with transaction():
+        await execute_write(...)
+"""
+
+_pools = weakref.WeakKeyDictionary()  # 이벤트 루프 -> 풀 생성 Task
+_current = ContextVar("async_unit_of_work", default=None)
+
+_db_loop = None
+_db_loop_lock = threading.Lock()
+
+
+async def _create_pool():
+    db_config = Config.get_db_config()
+    pool_config = Config.get_pool_config()
+
+    pool = await aiomysql.create_pool(
+        host=db_config["host"],
+        port=db_config["port"],
+        user=db_config["user"],
+        password=db_config["password"],
+        db=db_config["database"],
+        minsize=pool_config["size"],
+        maxsize=pool_config["size"] + pool_config["max_overflow"],
+        pool_recycle=pool_config["idle_timeout"],
+        autocommit=True,
+        cursorclass=aiomysql.DictCursor
+    )
+    print("비동기 데이터베이스 풀 생성 성공")
+
+    return pool
+
+async def get_async_pool():
+    """현재 이벤트 루프의 커넥션 풀 반환 (최초 호출 시 Config 기준으로 생성)"""
+    loop = asyncio.get_running_loop()
+    creating = _pools.get(loop)
+
+    if creating is None:
+        # 같은 루프의 동시 호출이 풀을 하나만 만들도록 생성 Task 를 먼저 등록
+        creating = _pools[loop] = loop.create_task(_create_pool())
+
+    try:
+        return await asyncio.shield(creating)
+    except Exception:
+        # 실패한 생성 Task 는 보관하지 않고 다음 호출에서 다시 시도
+        if _pools.get(loop) is creating:
+            del _pools[loop]
+        raise
+
+async def close_async_pool():
+    """현재 이벤트 루프의 커넥션 풀 종료"""
+    creating = _pools.pop(asyncio.get_running_loop(), None)
+
+    if creating is not None and not creating.cancelled() and creating.done() and creating.exception() is None:
+        pool = creating.result()
+        pool.close()
+        await pool.wait_closed()
+
+async def get_async_connection():
+    if not AIOMYSQL_AVAILABLE:
+        print("[INFO] aiomysql 모듈 없음 - 비동기 데이터 계층 사용 불가")
+        return None
+
+    try:
+        pool = await get_async_pool()
+        return await asyncio.wait_for(pool.acquire(), Config.DB_POOL_TIMEOUT)
+
+    except Exception as e:
+        print(f"[ERROR] DB 연결 실패: {e}")
+        return None
+
+async def _release(conn, broken=False):
+    """연결 반납 (문제가 있는 연결은 닫아서 풀에서 제외)"""
+    if broken:
+        conn.close()
+
+    pool = await get_async_pool()
+    pool.release(conn)
+
+
+class AsyncUnitOfWork:
+    """
+    하나의 연결과 하나의 트랜잭션을 공유하는 비동기 작업 단위 (UnitOfWork 의 비동기 버전)
+
+    블록 안에서 asyncio.gather 로 동시에 실행한 조회도 같은 연결을 사용하므로
+    문장은 lock 으로 하나씩 실행됩니다.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.lock = asyncio.Lock()
+        self.failed = False
+        self.written_tables = set()
+
+    async def get_connection(self):
+        """작업 단위 연결 반환 (최초 호출 시 대여 후 트랜잭션 시작)"""
+        if self.connection is None:
+            conn = await get_async_connection()
+            if conn is None:
+                return None
+
+            try:
+                await conn.begin()
+            except Exception as e:
+                print(f"[ERROR] 트랜잭션 시작 실패: {e}")
+                await _release(conn, broken=True)
+                return None
+
+            self.connection = conn
+
+        return self.connection
+
+    async def end(self, commit=True):
+        """커밋(실패 표시가 없을 때) 또는 롤백 후 연결 반납"""
+        conn, self.connection = self.connection, None
+        committed = commit and not self.failed
+
+        if conn is not None:
+            try:
+                if committed:
+                    await conn.commit()
+                else:
+                    await conn.rollback()
+            except Exception:
+                await _release(conn, broken=True)
+                raise
+
+            await _release(conn)
+
+        if committed and self.written_tables:
+            # 커밋 전 다른 요청이 이전 데이터를 다시 캐시했을 수 있으므로 한 번 더 무효화
+            _query_cache.invalidate_tables(self.written_tables)
+
+
+def get_current_async_unit_of_work():
+    """현재 Task(컨텍스트)의 비동기 작업 단위 반환"""
+    return _current.get()
+
+@asynccontextmanager
+async def transaction():
+    """
+    비동기 작업 단위 컨텍스트 (database.transaction 의 비동기 버전)
+
+    이미 작업 단위가 진행 중이면 그 트랜잭션에 참여합니다.
+    """
+    current = _current.get()
+
+    if current is not None:
+        try:
+            yield current
+        except Exception:
+            current.failed = True
+            raise
+        return
+
+    uow = AsyncUnitOfWork()
+    token = _current.set(uow)
+
+    try:
+        yield uow
+    except Exception:
+        uow.failed = True
+        raise
+    finally:
+        _current.reset(token)
+        await uow.end()
+
+async def _run_statement(operation, default=None):
+    """
+    연결 대여/반납과 오류 처리를 공통으로 담당하는 내부 함수 (database._run_statement 의 비동기 버전)
+
+    Args:
+        operation (callable): 커서를 받아 결과를 반환하는 코루틴 함수
+        default: 연결 실패 또는 쿼리 오류 시 반환할 값
+    """
+    uow = _current.get()
+    if uow is None:
+        return await _execute(operation, None, default)
+
+    # asyncio.gather 로 시작한 Task 들은 작업 단위를 함께 물려받으므로
+    # 연결 대여/트랜잭션 시작과 문장 실행을 차례로 처리 (aiomysql 연결은 동시에 사용할 수 없음)
+    async with uow.lock:
+        return await _execute(operation, uow, default)
+
+async def _execute(operation, uow, default):
+    """작업 단위(없으면 None)의 연결 또는 새로 대여한 연결로 문장 실행"""
+    started = time.perf_counter()
+    conn = await uow.get_connection() if uow is not None else await get_async_connection()
+    timing = QueryTiming(acquire=time.perf_counter() - started)
+
+    if conn is None:
+        print("[ERROR] DB 연결 객체 없음.")
+        return default
+
+    failed = broken = False
+
+    try:
+        async with conn.cursor() as cursor:
+            return await operation(_timed_cursor(cursor, timing))
+
+    except aiomysql.IntegrityError as e:
+        failed = True
+        print(f"[ERROR] 무결성 제약 조건 위반: {e}")
+
+    except (aiomysql.OperationalError, aiomysql.InterfaceError) as e:
+        # 연결 자체에 문제가 있으므로 풀에 돌려놓지 않음
+        failed = broken = True
+        print(f"[ERROR] DB 연결 오류: {e}")
+
+    except aiomysql.MySQLError as e:
+        failed = True
+        print(f"[ERROR] SQL 실행 중 오류: {e}")
+
+    except asyncio.CancelledError:
+        # 시간 초과 등으로 취소되면 응답을 다 읽지 못한 연결이므로 재사용하지 않음
+        failed = broken = True
+        raise
+
+    finally:
+        if uow is not None:
+            if failed:
+                uow.failed = True
+                if broken and uow.connection is conn:
+                    uow.connection = None
+                    await _release(conn, broken=True)
+        else:
+            await _release(conn, broken)
+
+        _record_timing(timing)
+
+    return default
+
+def _timed_cursor(cursor, timing):
+    """계측이 켜져 있으면 실행/읽기 시간을 기록하는 커서로 감쌈 (database._timed_cursor 의 비동기 버전)"""
+    return AsyncTimedCursor(cursor, timing) if Config.QUERY_STATS_ENABLED else cursor
+
+def _record_write(query):
+    """변경 문장이 영향을 준 테이블의 캐시 결과 무효화"""
+    tables = affected_tables(query)
+    _query_cache.invalidate_tables(tables)
+
+    uow = _current.get()
+    if uow is not None:
+        uow.written_tables |= tables
+
+def _cacheable(query):
+    """결과 캐시 사용 가능 여부 (커밋 전 변경이 있는 테이블을 읽으면 우회)"""
+    if not Config.QUERY_CACHE_ENABLED:
+        return False
+
+    uow = _current.get()
+    return uow is None or not (uow.written_tables & statement_tables(query))
+
+async def execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+    """
+    SQL 쿼리 실행 함수 (database.execute_query 의 비동기 버전, 인자와 반환값 동일)
+    """
+    async def operation(cursor):
+        await cursor.execute(query, params or ())
+
+        if fetch_one:
+            return await cursor.fetchone()
+        if fetch_all:
+            return list(await cursor.fetchall())
+
+        return None
+
+    default = [] if fetch_all else None
+
+    if is_write(query):
+        result = await _run_statement(operation, default=default)
+        _record_write(query)
+        return result
+
+    if not (cache and (fetch_one or fetch_all) and _cacheable(query)):
+        return await _run_statement(operation, default=default)
+
+    key = QueryCache.make_key(query, params, fetch_one)
+    hit, result = _query_cache.get(key)
+    if hit:
+        return result
+
+    result = await _run_statement(operation, default=_FAILED)
+    if result is _FAILED:
+        return default
+
+    _query_cache.put(key, result, statement_tables(query))
+    return result
+
+async def execute_write(query, params=None):
+    """
+    INSERT / UPDATE / DELETE 실행 후 반영 결과 반환 (database.execute_write 의 비동기 버전)
+
+    Returns:
+        dict or None: {"rowcount": 반영된 행 수, "lastrowid": 생성된 ID}, 실패 시 None
+    """
+    async def operation(cursor):
+        await cursor.execute(query, params or ())
+        return {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+
+    result = await _run_statement(operation)
+    _record_write(query)
+
+    return result
+
+async def iter_query(query, params=None, batch_size=None):
+    """
+    SELECT 결과를 스트리밍으로 한 행씩 반환하는 비동기 제너레이터 (database.iter_query 의 비동기 버전)
+
+    작업 단위와 관계없이 전용 연결을 사용하며, 소비자가 중간에 멈추면 연결을 폐기합니다.
+
+    Example:
+        async for row in iter_query("SELECT * FROM visit"):
+            ...
+    """
+    batch_size = batch_size or Config.DB_STREAM_BATCH_SIZE
+    started = time.perf_counter()
+    conn = await get_async_connection()
+    timing = QueryTiming(acquire=time.perf_counter() - started)
+
+    if conn is None:
+        print("[ERROR] DB 연결 객체 없음.")
+        return
+
+    cursor = None
+    exhausted = broken = False
+
+    try:
+        cursor = _timed_cursor(await conn.cursor(aiomysql.SSDictCursor), timing)
+        await cursor.execute(query, params or ())
+
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                exhausted = True
+                break
+
+            for row in rows:
+                yield row
+
+    except (aiomysql.OperationalError, aiomysql.InterfaceError) as e:
+        broken = True
+        print(f"[ERROR] DB 연결 오류: {e}")
+
+    except aiomysql.MySQLError as e:
+        print(f"[ERROR] SQL 실행 중 오류: {e}")
+
+    finally:
+        if not exhausted:
+            # 읽지 않은 결과가 남은 연결은 재사용할 수 없음
+            broken = True
+
+        if cursor is not None and not broken:
+            try:
+                await cursor.close()
+            except Exception:
+                broken = True
+
+        await _release(conn, broken)
+        _record_timing(timing)
+
+def get_db_loop():
+    """프로세스 공용 DB 이벤트 루프 반환 (최초 호출 시 전용 스레드에서 시작)"""
+    global _db_loop
+
+    if _db_loop is None:
+        with _db_loop_lock:
+            if _db_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="async-db-loop", daemon=True).start()
+                _db_loop = loop
+
+    return _db_loop
+
+async def on_db_loop(coro):
+    """
+    코루틴을 프로세스 공용 DB 이벤트 루프에서 실행하고 결과 대기
+
+    Flask 비동기 뷰는 요청마다 새 이벤트 루프에서 실행되므로, 데이터 계층 호출을
+    이 함수로 감싸야 요청 간에 같은 커넥션 풀을 사용합니다.
+    """
+    loop = get_db_loop()
+
+    if asyncio.get_running_loop() is loop:
+        return await coro
+
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
@@ -0,0 +1,252 @@
+import asyncio
+from datetime import date, datetime
+
+from .async_database import execute_query, iter_query
+from .database import _query_cache
+from .query_cache import statement_tables
+from .pagination import page_query
+from .search import build_matchers, merge_results, search_limit
+from .customer import (ALL_CUSTOMERS_QUERY, CUSTOMERS_PAGE_SELECT, CUSTOMERS_PAGE_COLUMNS, CUSTOMERS_EXPORT_QUERY,
+                       CUSTOMER_BY_ID_QUERY, _birth_month_query, _upcoming_birthdays_query, _filter_upcoming)
+from .visit import (ALL_VISITS_QUERY, VISITS_PAGE_SELECT, VISITS_PAGE_COLUMNS, VISITS_BY_CUSTOMER_QUERY,
+                    VISIT_BY_ID_QUERY, VISITS_BY_DATE_RANGE_QUERY, _recent_visits_query, _visit_period,
+                    _export_visits_query)
+from .payment import (ALL_PAYMENTS_QUERY, PAYMENTS_SELECT, PAYMENTS_PAGE_COLUMNS, PAYMENTS_EXPORT_QUERY,
+                      PAYMENTS_BY_CUSTOMER_QUERY, PAYMENT_METHODS_QUERY, _recent_payments_query,
+                      _has_unknown_method, _apply_method_names)
+from .stats import (TOTAL_VISITS_BY_CUSTOMER_QUERY, TOTAL_PAYMENT_BY_CUSTOMER_QUERY, CUSTOMER_STATISTICS_QUERY,
+                    CUSTOMER_COUNT_QUERY, OVERALL_STATISTICS_QUERY, MONTHLY_SERIES_QUERY,
+                    UNIQUE_CUSTOMERS_BY_MONTH_QUERY, RANGE_STATISTICS_QUERY, _fill_payment_defaults,
+                    _fill_revenue_defaults, _all_customer_statistics_query, _top_customers_query,
+                    _group_top_customers, _month_start, _add_months, _build_monthly_series, _summarize_range,
+                    _recent_months)
+
+"""
+고객/방문/결제/통계 조회 함수의 비동기 버전
+
+각 함수는 같은 이름의 동기 함수와 같은 SQL 과 후처리를 사용하며 반환값도 같습니다.
+(iter_* 는 비동기 제너레이터: async for row in iter_customers())
+여러 조회를 asyncio.gather 로 동시에 실행할 수 있습니다 (customer_detail, dashboard 참고).
+(async with transaction() 블록 안에서는 작업 단위의 연결 하나로 차례로 실행)
+등록/수정/삭제는 일별 집계/고객 요약 갱신을 함께 처리하는 동기 함수를 사용합니다.
+
+결제 수단 이름은 동기 기준 데이터 캐시(app/cache.py) 대신 공용 쿼리 결과 캐시로 읽습니다.
+(기준 데이터 캐시의 loader 는 동기 조회이므로 캐시가 비어 있으면 이벤트 루프를 막음)
+읽기 복제본/요청별 쿼리 집계를 사용하지 않는 점은 app/async_database.py 참고.
+"""
+
+
+async def _fetch_page(select, columns, **options):
+    """키셋 페이지 조회 (pagination.fetch_page 의 비동기 버전)"""
+    query, params, to_page = page_query(select, columns, **options)
+
+    return to_page(await execute_query(query, params, fetch_all=True) or [])
+
+# 고객
+async def get_all_customers():
+    return await execute_query(ALL_CUSTOMERS_QUERY, fetch_all=True)
+
+async def get_customers_page(limit=None, after=None, before=None):
+    return await _fetch_page(CUSTOMERS_PAGE_SELECT, CUSTOMERS_PAGE_COLUMNS, limit=limit, after=after, before=before)
+
+async def iter_customers():
+    async for row in iter_query(CUSTOMERS_EXPORT_QUERY):
+        yield row
+
+async def get_customer_by_customer(customer_id):
+    return await execute_query(CUSTOMER_BY_ID_QUERY, (customer_id,), fetch_one=True)
+
+async def search_customers(search_term, limit=None):
+    # 검색어 종류별 조회를 동시에 실행한 뒤 순위순으로 합침
+    limit = search_limit(limit)
+    results = await asyncio.gather(*(execute_query(query, params, fetch_all=True)
+                                     for query, params in build_matchers(search_term, limit)))
+
+    return merge_results(results, limit)
+
+async def get_customer_by_birth_month(month):
+    query, params = _birth_month_query(month)
+
+    return await execute_query(query, params, fetch_all=True, cache=True)
+
+async def get_upcoming_birthdays(days, today=None):
+    today = today or date.today()
+    query, params, end = _upcoming_birthdays_query(days, today)
+
+    customers = await execute_query(query, params, fetch_all=True, cache=True) or []
+    return _filter_upcoming(customers, today, end)
+
+# 방문
+async def get_visits():
+    return await execute_query(ALL_VISITS_QUERY, fetch_all=True, cache=True)
+
+async def get_recent_visits(limit=None, before=None):
+    query, params = _recent_visits_query(limit, before)
+
+    return await execute_query(query, params, fetch_all=True)
+
+async def get_visits_page(limit=None, after=None, before=None, start_date=None, end_date=None):
+    where, params = _visit_period(start_date, end_date)
+
+    return await _fetch_page(VISITS_PAGE_SELECT, VISITS_PAGE_COLUMNS, descending=True, where=where, params=params,
+                             limit=limit, after=after, before=before)
+
+async def iter_visits(start_date=None, end_date=None):
+    query, params = _export_visits_query(start_date, end_date)
+
+    async for row in iter_query(query, params):
+        yield row
+
+async def get_visits_by_customer(customer_id):
+    return await execute_query(VISITS_BY_CUSTOMER_QUERY, (customer_id,), fetch_all=True)
+
+async def get_visit_by_visit_id(visit_id):
+    return await execute_query(VISIT_BY_ID_QUERY, (visit_id,), fetch_one=True)
+
+async def get_visits_by_date_range(start_date, end_date):
+    return await execute_query(VISITS_BY_DATE_RANGE_QUERY, (start_date, end_date), fetch_all=True)
+
+# 결제
+async def get_payment_methods():
+    methods = await execute_query(PAYMENT_METHODS_QUERY, fetch_all=True, cache=True) or []
+    return [dict(method) for method in methods]
+
+async def get_payment_method_names():
+    methods = await execute_query(PAYMENT_METHODS_QUERY, fetch_all=True, cache=True) or []
+    return {method["method_code"]: method["method_name"] for method in methods}
+
+async def _with_method_names(payments, names=None):
+    """결제 기록에 결제 수단 이름 추가 (payment._with_method_names 의 비동기 버전)"""
+    names = await get_payment_method_names() if names is None else names
+
+    if _has_unknown_method(payments, names):
+        # 캐시한 뒤 추가된 결제 수단이면 캐시 결과를 버리고 한 번 다시 읽음
+        _query_cache.invalidate_tables(statement_tables(PAYMENT_METHODS_QUERY))
+        names.update(await get_payment_method_names())
+
+    return _apply_method_names(payments, names)
+
+async def get_all_payments():
+    payments, names = await asyncio.gather(
+        execute_query(ALL_PAYMENTS_QUERY, fetch_all=True),
+        get_payment_method_names()
+    )
+    return await _with_method_names(payments, names)
+
+async def get_payments_by_customer(customer_id):
+    payments, names = await asyncio.gather(
+        execute_query(PAYMENTS_BY_CUSTOMER_QUERY, (customer_id,), fetch_all=True),
+        get_payment_method_names()
+    )
+    return await _with_method_names(payments, names)
+
+async def get_recent_payments(limit=None, before=None):
+    query, params = _recent_payments_query(limit, before)
+
+    payments, names = await asyncio.gather(
+        execute_query(query, params, fetch_all=True),
+        get_payment_method_names()
+    )
+    return await _with_method_names(payments, names)
+
+async def get_payments_page(limit=None, after=None, before=None):
+    page, names = await asyncio.gather(
+        _fetch_page(PAYMENTS_SELECT, PAYMENTS_PAGE_COLUMNS, descending=True, limit=limit, after=after, before=before),
+        get_payment_method_names()
+    )
+    await _with_method_names(page["items"], names)
+
+    return page
+
+async def iter_all_payments():
+    names = await get_payment_method_names()
+    async for row in iter_query(PAYMENTS_EXPORT_QUERY):
+        yield (await _with_method_names([row], names))[0]
+
+# 통계
+async def get_total_visits_by_customer(customer_id):
+    result = await execute_query(TOTAL_VISITS_BY_CUSTOMER_QUERY, (customer_id,), fetch_one=True)
+
+    return result["total_visits"] if result else 0
+
+async def get_total_payment_by_customer(customer_id):
+    result = await execute_query(TOTAL_PAYMENT_BY_CUSTOMER_QUERY, (customer_id,), fetch_one=True)
+
+    return result["total_amount"] if result and result["total_amount"] else 0
+
+async def get_customer_statistics(customer_id):
+    result = await execute_query(CUSTOMER_STATISTICS_QUERY, (customer_id,), fetch_one=True)
+
+    return _fill_payment_defaults(result)
+
+async def get_all_customer_statistics(limit=None, page=1, sort="name", order="asc"):
+    query, params, result = _all_customer_statistics_query(limit, page, sort, order)
+
+    items, total = await asyncio.gather(
+        execute_query(query, params, fetch_all=True),
+        execute_query(CUSTOMER_COUNT_QUERY, fetch_one=True)
+    )
+    return dict(result, items=items, total=total["total"] if total else 0)
+
+async def get_top_customers(limit=1):
+    query, params = _top_customers_query(limit)
+
+    return _group_top_customers(await execute_query(query, params, fetch_all=True, cache=True) or [])
+
+async def get_overall_statistics():
+    result = await execute_query(OVERALL_STATISTICS_QUERY, fetch_one=True, cache=True)
+    if result:
+        _fill_revenue_defaults(result)
+
+    return result
+
+async def get_monthly_series(start, end):
+    start, end = _month_start(start), _month_start(end)
+
+    rows, customers = await asyncio.gather(
+        execute_query(MONTHLY_SERIES_QUERY, (start.date(), end.date()), fetch_all=True, cache=True),
+        execute_query(UNIQUE_CUSTOMERS_BY_MONTH_QUERY, (start, end), fetch_all=True, cache=True)
+    )
+    return _build_monthly_series(start, end, rows or [], customers or [])
+
+async def get_monthly_statistics(year, month):
+    start = datetime(int(year), int(month), 1)
+    series = await get_monthly_series(start, _add_months(start, 1))
+
+    return series[0]["stats"] if series else None
+
+async def get_range_statistics(start_date, end_date):
+    rows = await execute_query(RANGE_STATISTICS_QUERY, (start_date, end_date), fetch_all=True, cache=True)
+
+    return _summarize_range(rows or [])
+
+async def get_recent_monthly_series(months=6, today=None):
+    return list(reversed(await get_monthly_series(*_recent_months(months, today))))
+
+# 화면 단위 조회
+async def customer_detail(customer_id):
+    """고객 상세 화면 데이터 (고객, 통계, 방문, 결제를 동시에 조회)"""
+    customer, stats, visits, payments = await asyncio.gather(
+        get_customer_by_customer(customer_id),
+        get_customer_statistics(customer_id),
+        get_visits_by_customer(customer_id),
+        get_payments_by_customer(customer_id)
+    )
+
+    return {"customer": customer, "stats": stats, "visits": visits, "payments": payments}
+
+async def dashboard(birthday_window_days, recent_limit=None):
+    """대시보드 화면 데이터 (전체 통계, 다가오는 생일, 최근 방문/결제를 동시에 조회)"""
+    overall_stats, birth_day_customers, recent_visits, recent_payments = await asyncio.gather(
+        get_overall_statistics(),
+        get_upcoming_birthdays(birthday_window_days),
+        get_recent_visits(recent_limit),
+        get_recent_payments(recent_limit)
+    )
+
+    return {
+        "overall_stats": overall_stats or {},
+        "birth_day_customers": birth_day_customers,
+        "recent_visits": recent_visits,
+        "recent_payments": recent_payments
+    }
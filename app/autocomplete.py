@@ -0,0 +1,251 @@
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from .config import Config
+from .database import iter_query
+from .search import search_customers
+
+"""
+고객 자동완성 모듈
+
+고객 이름과 전화번호를 정렬된 키 배열(bisect)로 메모리에 보관하여
+입력 중인 앞글자로 고객을 바로 찾습니다.
+
+- 최초 조회 시 DB에서 한 번 읽어 생성하고(지연 생성), 고객 등록/수정/삭제 시
+  커밋 후 해당 고객의 키만 갱신합니다.
+- 다른 프로세스(워커)의 변경은 AUTOCOMPLETE_REFRESH_SECONDS 주기로 전체 재생성하여 반영합니다.
+- 재생성(DB 읽기/정렬)은 잠금 밖에서 한 스레드만 실행하고 완성된 색인을 잠금 안에서 교체합니다.
+  재생성 중 다른 요청은 이전 색인으로, 최초 생성 중이면 DB 고객 검색(app/search.py)으로 응답합니다.
+
+검색 키:
+    이름 전체 (예: 홍길동), 성을 뺀 이름 (예: 길동),
+    전화번호 숫자 전체 (예: 01012345678), 전화번호 뒷자리 4자리 (예: 5678)
+"""
+
+PHONE_SUFFIX_LENGTH = 4
+
+
+def _normalize(text):
+    return re.sub(r"\s+", "", text or "").lower()
+
+def _keys_for(customer):
+    """고객 한 명의 검색 키 목록"""
+    keys = set()
+
+    name = _normalize(customer.get("name"))
+    if name:
+        keys.add(name)
+        # 한글 이름은 대부분 한 글자 성이므로 이름만으로도 찾을 수 있도록 함
+        if len(name) >= 3:
+            keys.add(name[1:])
+
+    digits = re.sub(r"\D", "", customer.get("phone") or "")
+    if digits:
+        keys.add(digits)
+        if len(digits) > PHONE_SUFFIX_LENGTH:
+            keys.add(digits[-PHONE_SUFFIX_LENGTH:])
+
+    return keys
+
+
+def _build(customers):
+    """전체 고객으로 (정렬된 키 배열, 고객 ID -> 고객) 생성"""
+    entries, table = [], {}
+
+    for customer in customers:
+        record = {"customer_id": customer["customer_id"], "name": customer["name"],
+                  "phone": customer.get("phone")}
+        table[record["customer_id"]] = record
+        entries.extend((key, record["customer_id"]) for key in _keys_for(record))
+
+    entries.sort()
+    return entries, table
+
+
+class CustomerPrefixIndex:
+    """
+    정렬된 (키, 고객 ID) 배열 기반 앞글자 검색 색인 (스레드 안전)
+
+    Args:
+        loader (callable, optional): 전체 고객 목록을 반환하는 함수
+        refresh_seconds (int, optional): 전체 재생성 주기 (초)
+        fallback (callable, optional): 최초 생성 중 검색을 대신할 함수 (prefix, limit) -> 고객 목록
+    """
+
+    def __init__(self, loader=None, refresh_seconds=None, fallback=None):
+        self._loader = loader
+        self._refresh_seconds = refresh_seconds
+        self._fallback = fallback
+        self._lock = threading.RLock()
+        self._entries = []    # (키, 고객 ID) 정렬 배열
+        self._customers = {}  # 고객 ID -> {"customer_id", "name", "phone"}
+        self._loaded_at = None
+        self._stale = False       # invalidate() 후 다음 검색에서 재생성
+        self._generation = 0      # invalidate() 마다 증가 (재생성 중 무효화되면 결과를 버림)
+        self._rebuilding = False
+        self._changes = None      # 재생성 중 들어온 add/remove (교체 후 다시 적용)
+
+    def _ensure_loaded(self):
+        """
+        필요하면 색인 재생성 (DB 읽기/정렬은 잠금 밖에서 한 스레드만 실행)
+
+        Returns:
+            bool: 검색할 색인이 있으면 True (최초 생성을 다른 스레드가 진행 중이면 False)
+        """
+        with self._lock:
+            loaded = self._loaded_at is not None
+            expired = loaded and (self._stale or (self._refresh_seconds and
+                                                  time.monotonic() - self._loaded_at > self._refresh_seconds))
+
+            # 재생성 중이면 기다리지 않고 이전 색인 사용
+            if (loaded and not expired) or self._rebuilding:
+                return loaded
+
+            self._rebuilding = True
+            self._changes = []
+            generation = self._generation
+
+        try:
+            entries, table = _build(self._loader() if self._loader else [])
+        except Exception:
+            with self._lock:
+                self._rebuilding = False
+                self._changes = None
+            raise
+
+        with self._lock:
+            self._rebuilding = False
+            changes, self._changes = self._changes, None
+
+            if generation != self._generation:
+                # 읽는 중 전체 무효화(일괄 등록 등) - 이 결과는 버리고 다음 검색에서 다시 생성
+                return loaded
+
+            self._swap(entries, table)
+            for change in changes:
+                change()
+
+        return True
+
+    def _swap(self, entries, table):
+        self._entries = entries
+        self._customers = table
+        self._loaded_at = time.monotonic()
+        self._stale = False
+
+    def load(self, customers):
+        """전체 고객으로 색인 재생성"""
+        entries, table = _build(customers)
+
+        with self._lock:
+            self._swap(entries, table)
+
+    def invalidate(self):
+        """다음 검색 시 전체 재생성 (재생성 전까지는 현재 색인 사용)"""
+        with self._lock:
+            self._stale = True
+            self._generation += 1
+
+    def add(self, customer):
+        """고객 추가 또는 갱신 (색인이 아직 생성되지 않았으면 생성 시 DB에서 읽으므로 무시)"""
+        record = {"customer_id": customer["customer_id"], "name": customer["name"],
+                  "phone": customer.get("phone")}
+
+        with self._lock:
+            # 재생성이 읽은 DB 결과에 이 변경이 빠졌을 수 있으므로 교체 후 다시 적용
+            if self._changes is not None:
+                self._changes.append(lambda: self._add(record))
+
+            if self._loaded_at is not None:
+                self._add(record)
+
+    def _add(self, record):
+        self._remove(record["customer_id"])
+
+        self._customers[record["customer_id"]] = record
+        for key in _keys_for(record):
+            insort(self._entries, (key, record["customer_id"]))
+
+    def remove(self, customer_id):
+        """고객 제거"""
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append(lambda: self._remove(customer_id))
+
+            self._remove(customer_id)
+
+    def _remove(self, customer_id):
+        record = self._customers.pop(customer_id, None)
+        if record is None:
+            return
+
+        for key in _keys_for(record):
+            position = bisect_left(self._entries, (key, customer_id))
+            if position < len(self._entries) and self._entries[position] == (key, customer_id):
+                del self._entries[position]
+
+    def search(self, prefix, limit=10):
+        """
+        앞글자가 일치하는 고객 최대 limit 명 (키 사전순, 일치 키가 짧을수록 먼저)
+
+        Returns:
+            list: [{"customer_id", "name", "phone"}]
+        """
+        prefix = _normalize(prefix)
+        # 010-1234 처럼 구분자를 넣어 입력한 전화번호는 숫자만 비교
+        if re.fullmatch(r"[\d\-.()+]+", prefix):
+            prefix = re.sub(r"\D", "", prefix)
+
+        if not prefix:
+            return []
+
+        if not self._ensure_loaded():
+            return self._fallback(prefix, limit) if self._fallback else []
+
+        with self._lock:
+            results, seen = [], set()
+            position = bisect_left(self._entries, (prefix,))
+
+            while position < len(self._entries) and len(results) < limit:
+                key, customer_id = self._entries[position]
+                if not key.startswith(prefix):
+                    break
+
+                if customer_id not in seen:
+                    seen.add(customer_id)
+                    results.append(dict(self._customers[customer_id]))
+
+                position += 1
+
+            return results
+
+    def __len__(self):
+        with self._lock:
+            return len(self._customers)
+
+
+def _load_customers():
+    return iter_query("SELECT customer_id, name, phone FROM customer")
+
+def _search_customers(prefix, limit):
+    # 최초 색인 생성 중에는 인덱스를 사용하는 DB 고객 검색으로 응답
+    return [{"customer_id": customer["customer_id"], "name": customer["name"], "phone": customer["phone"]}
+            for customer in search_customers(prefix, limit)]
+
+customer_index = CustomerPrefixIndex(_load_customers, Config.AUTOCOMPLETE_REFRESH_SECONDS, _search_customers)
+
+def autocomplete_customers(prefix, limit=None):
+    """
+    고객 자동완성 (이름 / 성을 뺀 이름 / 전화번호 / 전화번호 뒷자리 앞글자 일치)
+
+    Args:
+        prefix (str): 입력 중인 검색어
+        limit (int, optional): 최대 결과 수 (기본값: Config.AUTOCOMPLETE_LIMIT)
+
+    Returns:
+        list: [{"customer_id", "name", "phone"}]
+    """
+    limit = max(1, min(limit or Config.AUTOCOMPLETE_LIMIT, Config.PAGE_SIZE_MAX))
+    return customer_index.search(prefix, limit)
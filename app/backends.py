@@ -0,0 +1,95 @@
+try:
+    import mysql.connector
+    MYSQL_AVAILABLE = True
+except ImportError:
+    print("[WARNING] MySQL 모듈이 설치되지 않았습니다. 내장 SQLite 데모 모드로 실행됩니다.")
+    MYSQL_AVAILABLE = False
+
+import sqlite3
+
+from .config import Config
+from . import sqlite_backend
+
+"""
+DB 백엔드 선택 모듈
+
+데이터 계층(app/database.py)이 사용할 드라이버를 Config.DB_BACKEND 로 선택합니다.
+백엔드는 연결 생성과 오류 분류만 담당하고, 커넥션 풀/작업 단위/쿼리 실행/캐시는 공용입니다.
+
+- mysql: mysql.connector (운영)
+- sqlite: 내장 SQLite (app/sqlite_backend.py) - 서버 없이 데모/로컬 테스트/벤치마크 실행
+- 비워 두면 MySQL 드라이버가 설치되어 있으면 mysql, 없으면 sqlite
+"""
+
+
+class Backend:
+    """
+    DB 드라이버별 연결 함수와 오류 분류
+
+    Args:
+        name (str): 백엔드 이름
+        connect (callable): 연결 설정(생략 시 기본 DB)을 받아 새 연결을 반환하는 함수
+        error (type): 드라이버 오류 기본 클래스
+        integrity_error (type): 무결성 제약 조건 위반 오류
+        connection_errors (tuple): 연결을 풀에 돌려놓지 않고 폐기해야 하는 오류
+        supports_replicas (bool): 읽기 복제본(app/replicas.py) 사용 가능 여부
+    """
+
+    def __init__(self, name, connect, error, integrity_error, connection_errors=(), supports_replicas=False):
+        self.name = name
+        self.connect = connect
+        self.Error = error
+        self.IntegrityError = integrity_error
+        self.connection_errors = tuple(connection_errors)
+        self.supports_replicas = supports_replicas
+
+
+def _mysql_backend():
+    if not MYSQL_AVAILABLE:
+        raise ValueError("mysql 백엔드에는 mysql-connector-python 이 필요합니다. (DB_BACKEND=sqlite 로 내장 DB 사용 가능)")
+
+    return Backend(
+        "mysql",
+        lambda db_config=None: mysql.connector.connect(**(db_config or Config.get_db_config())),
+        mysql.connector.Error,
+        mysql.connector.IntegrityError,
+        (mysql.connector.OperationalError, mysql.connector.InterfaceError),
+        supports_replicas=True
+    )
+
+def _sqlite_backend():
+    # SQLite 연결은 끊어지지 않으므로(같은 프로세스 안의 파일) 폐기할 연결 오류가 없음
+    return Backend(
+        "sqlite",
+        lambda db_config=None: sqlite_backend.connect(Config.SQLITE_PATH),
+        sqlite3.Error,
+        sqlite3.IntegrityError
+    )
+
+BACKENDS = {
+    "mysql": _mysql_backend,
+    "sqlite": _sqlite_backend,
+}
+
+_backends = {}
+
+def default_backend_name():
+    """DB_BACKEND 를 비웠을 때 사용할 백엔드 이름"""
+    return "mysql" if MYSQL_AVAILABLE else "sqlite"
+
+def get_backend(name=None):
+    """
+    이름(생략 시 Config.DB_BACKEND)에 해당하는 백엔드 반환
+
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 드라이버가 설치되지 않은 경우
+    """
+    name = (name or Config.DB_BACKEND or default_backend_name()).lower()
+
+    backend = _backends.get(name)
+    if backend is None:
+        if name not in BACKENDS:
+            raise ValueError(f"알 수 없는 DB 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+        backend = _backends[name] = BACKENDS[name]()
+
+    return backend
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from .config import Config
+
+"""
+기준 데이터 캐시 모듈
+
+결제수단처럼 거의 바뀌지 않는 기준 데이터를 메모리에 보관합니다.
+항목마다 DB에서 읽는 함수(loader)를 등록해 두면 첫 조회 또는 TTL 만료 시에만 다시 읽습니다.
+
+사용법:
+    reference_cache.register("payment_methods", _load_payment_methods)
+    reference_cache.get("payment_methods")
+    reference_cache.invalidate("payment_methods")  # 기준 데이터 변경 후 즉시 반영
+"""
+
+
+class ReferenceCache:
+    """
+    이름별 loader 결과를 TTL 동안 보관하는 스레드 안전 캐시
+
+    loader 결과가 비어 있으면(DB 연결 실패 등) 보관하지 않고 다음 조회 때 다시 읽습니다.
+    loader 는 캐시 잠금 밖에서 실행하며, 항목별 잠금으로 같은 항목은 한 스레드만 읽습니다.
+    (느린 조회가 다른 항목의 조회/무효화를 막지 않음)
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._loaders = {}
+        self._loading = {}  # 이름 -> 항목별 읽기 잠금
+        self._entries = {}  # 이름 -> (값, 만료 시각)
+        self._generations = {}  # 이름 -> 무효화 횟수 (읽는 중 무효화된 결과는 보관하지 않음)
+        self._hits = 0
+        self._misses = 0
+
+    def register(self, name, loader, ttl=None):
+        """기준 데이터 항목 등록 (ttl 생략 시 기본 TTL)"""
+        self._loaders[name] = (loader, ttl)
+
+    def _cached(self, name):
+        """(적중 여부, 값) 반환 - 잠금 안에서 확인"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[1] > time.monotonic():
+                self._hits += 1
+                return True, entry[0]
+
+            return False, None
+
+    def get(self, name):
+        """캐시된 값 반환 (없거나 만료되었으면 loader 로 다시 읽음)"""
+        loader, ttl = self._loaders[name]
+
+        hit, value = self._cached(name)
+        if hit:
+            return value
+
+        with self._lock:
+            loading = self._loading.setdefault(name, threading.Lock())
+
+        # 같은 항목을 여러 요청이 동시에 읽지 않도록 항목별 잠금 안에서 한 번만 조회
+        with loading:
+            # 기다리는 동안 다른 스레드가 읽어 두었으면 그 값 사용
+            hit, value = self._cached(name)
+            if hit:
+                return value
+
+            with self._lock:
+                self._misses += 1
+                generation = self._generations.get(name, 0)
+
+            value = loader()
+
+            if value:
+                with self._lock:
+                    if self._generations.get(name, 0) == generation:
+                        self._entries[name] = (value, time.monotonic() + (ttl or self.ttl))
+
+            return value
+
+    def invalidate(self, name=None):
+        """항목(생략 시 전체) 무효화 - 다음 조회 시 DB에서 다시 읽음"""
+        with self._lock:
+            names = list(self._loaders) if name is None else [name]
+            for key in names:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def warm_up(self, names=None):
+        """등록된 항목(또는 names)을 미리 읽어 둠"""
+        for name in names or list(self._loaders):
+            self.invalidate(name)
+            if not self.get(name):
+                print(f"[ERROR] 기준 데이터 미리 읽기 실패: {name}")
+
+    def stats(self):
+        """캐시 항목과 적중/미적중 횟수 반환"""
+        with self._lock:
+            return {
+                "entries": sorted(self._entries),
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+
+reference_cache = ReferenceCache(Config.REFERENCE_CACHE_TTL)
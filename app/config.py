@@ -6,6 +6,14 @@ load_dotenv()
 
 class Config:
 
+    # 세션 쿠키 서명 키 (비우면 프로세스마다 임의로 생성하므로 다른 워커/재시작 후에는 세션이 유지되지 않음)
+    # DB_REPLICAS 사용 시 필수: 변경 직후 기본 DB 에서 조회할 기한을 세션에 보관
+    SECRET_KEY = os.getenv("SECRET_KEY", "")
+
+    # DB 백엔드 (mysql / sqlite, 비우면 MySQL 드라이버가 설치되어 있으면 mysql, 없으면 sqlite)
+    DB_BACKEND = os.getenv("DB_BACKEND", "")
+    SQLITE_PATH = os.getenv("SQLITE_PATH", ":memory:")  # SQLite DB 파일 (:memory: 는 프로세스 전용 임시 DB)
+
     # 데이터베이스 설정
     DB_HOST = os.getenv("DB_HOST", "localhost")
     DB_PORT = int(os.getenv("DB_PORT", 3306))
@@ -13,6 +21,71 @@ class Config:
     DB_PASSWORD = os.getenv("DB_PASSWORD", "1234")
     DB_NAME = os.getenv("DB_NAME", "crm_db")
 
+    # 커넥션 풀 설정
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))                  # 유지할 유휴 연결 수
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", 10))  # 풀 크기를 넘어 추가로 열 수 있는 연결 수
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))         # 연결 대기 최대 시간 (초)
+    DB_POOL_IDLE_TIMEOUT = int(os.getenv("DB_POOL_IDLE_TIMEOUT", 300)) # 유휴 연결 폐기 기준 시간 (초)
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 대여 시 연결 상태 확인
+
+    # 읽기 복제본 (쉼표로 구분한 host[:port] 목록, 비우면 모든 조회를 기본 DB 에서 실행)
+    DB_REPLICAS = os.getenv("DB_REPLICAS", "")
+    DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", 5))                # 허용 복제 지연 (초)
+    DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", 10)) # 상태/지연 점검 주기 (초)
+    DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 10))  # 변경 후 기본 DB 에서 조회할 시간 (초)
+
+    # 쿼리 실행 계측 (app/query_stats.py)
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+    SLOW_QUERY_SECONDS = float(os.getenv("SLOW_QUERY_SECONDS", 0.5))   # 느린 쿼리 기준 (초, 0 이면 기록 안 함)
+    SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "")                   # 느린 쿼리를 추가로 기록할 파일 (비우면 출력만)
+    QUERY_LOG_REQUESTS = os.getenv("QUERY_LOG_REQUESTS", "false").lower() == "true"  # 요청마다 쿼리 수/DB 시간 출력
+    QUERY_REPEAT_WARN = int(os.getenv("QUERY_REPEAT_WARN", 10))        # 한 요청에서 같은 쿼리가 이 횟수 이상이면 경고 (0 이면 끔)
+
+    # 일괄 등록 시 한 번에 INSERT 할 행 수
+    DB_BULK_CHUNK_SIZE = int(os.getenv("DB_BULK_CHUNK_SIZE", 1000))
+
+    # CSV 가져오기 시 한 번에 읽어 등록할 행 수
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 5000))
+
+    # 스트리밍 조회 시 한 번에 읽을 행 수
+    DB_STREAM_BATCH_SIZE = int(os.getenv("DB_STREAM_BATCH_SIZE", 1000))
+
+    # 대시보드 / 생일 마케팅 내보내기의 다가오는 생일 조회 기간 (일)
+    BIRTHDAY_WINDOW_DAYS = int(os.getenv("BIRTHDAY_WINDOW_DAYS", 30))
+
+    # 고객 검색 최대 결과 수
+    SEARCH_LIMIT = int(os.getenv("SEARCH_LIMIT", 50))
+
+    # 고객 자동완성 최대 결과 수 / 메모리 색인 전체 재생성 주기 (초, 다른 워커의 변경 반영)
+    AUTOCOMPLETE_LIMIT = int(os.getenv("AUTOCOMPLETE_LIMIT", 10))
+    AUTOCOMPLETE_REFRESH_SECONDS = int(os.getenv("AUTOCOMPLETE_REFRESH_SECONDS", 300))
+
+    # 기준 데이터(결제 수단 등) 캐시 유지 시간 (초) / 앱 시작 시 미리 읽기 여부
+    REFERENCE_CACHE_TTL = int(os.getenv("REFERENCE_CACHE_TTL", 3600))
+    REFERENCE_CACHE_WARM_UP = os.getenv("REFERENCE_CACHE_WARM_UP", "true").lower() == "true"
+
+    # 쿼리 결과 캐시 (execute_query(..., cache=True) 조회만 대상)
+    QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"
+    QUERY_CACHE_MAX_BYTES = int(os.getenv("QUERY_CACHE_MAX_BYTES", 32 * 1024 * 1024))  # 결과 크기 합 상한
+    QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", 60))                          # 결과 유지 시간 (초)
+
+    # 목록 페이지 크기
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 200))
+
+    # 대시보드 최근 방문/결제 건수
+    RECENT_LIMIT = int(os.getenv("RECENT_LIMIT", 5))
+
+    # 화면별 독립 조회 병렬 실행 (app/fanout.py)
+    FANOUT_WORKERS = int(os.getenv("FANOUT_WORKERS", 8))      # 작업 스레드 수 (프로세스 공용)
+    FANOUT_TIMEOUT = float(os.getenv("FANOUT_TIMEOUT", 5))    # 조회별 기본 대기 시간 (초)
+
+    # 라우트/데이터 계층 함수별 메트릭 수집, /metrics 노출 (app/metrics.py)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # 비동기 뷰(/async) 등록 여부 (requirements-async.txt 설치 필요)
+    ASYNC_VIEWS_ENABLED = os.getenv("ASYNC_VIEWS_ENABLED", "true").lower() == "true"
+
     @classmethod
     def get_db_config(cls):
         # 데이터베이스 연결 설정 반환
@@ -23,4 +96,29 @@ class Config:
             "password": cls.DB_PASSWORD,
             "database": cls.DB_NAME,
             "autocommit": True  # 자동 커밋 활성화
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def get_replica_configs(cls):
+        # 복제본별 연결 설정 목록 반환 (계정/DB 이름은 기본 DB 와 동일)
+        configs = []
+        for endpoint in cls.DB_REPLICAS.split(","):
+            endpoint = endpoint.strip()
+            if not endpoint:
+                continue
+
+            host, _, port = endpoint.partition(":")
+            configs.append(dict(cls.get_db_config(), host=host, port=int(port) if port else cls.DB_PORT))
+
+        return configs
+
+    @classmethod
+    def get_pool_config(cls):
+        # 커넥션 풀 설정 반환
+        return {
+            "size": cls.DB_POOL_SIZE,
+            "max_overflow": cls.DB_POOL_MAX_OVERFLOW,
+            "timeout": cls.DB_POOL_TIMEOUT,
+            "idle_timeout": cls.DB_POOL_IDLE_TIMEOUT,
+            "pre_ping": cls.DB_POOL_PRE_PING
+        }
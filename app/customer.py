@@ -1,10 +1,20 @@
-from .database import execute_query
+import calendar
+from datetime import date, timedelta
+
+from . import search
+from .autocomplete import customer_index
+from .database import execute_query, execute_write, iter_query, bulk_insert, after_commit, transaction
+from .rollup import days_of_customer, refresh_daily_stats
+from .pagination import fetch_page
+from .validators import GENDERS, require, optional_text, parse_date
+from .metrics import timed
 
 """
 고객 관리 모듈
 """
 
 # 고객 등록
+@timed
 def create_customer(customer_data):
     query = """
     INSERT INTO customer (name, phone, birth_date, gender, memo)
@@ -20,8 +30,13 @@ def create_customer(customer_data):
     )
 
     try:
-        execute_query(query, values)
+        result = execute_write(query, values)
         print(f"고객 등록 성공: {customer_data['name']}")
+
+        if result:
+            customer = {"customer_id": result["lastrowid"], "name": customer_data["name"],
+                        "phone": customer_data["phone"]}
+            after_commit(lambda: customer_index.add(customer))
        
         return True
     
@@ -30,34 +45,101 @@ def create_customer(customer_data):
         
         return False
 
-# 전체 고객 조회
-def get_all_customers():
-    query = "SELECT * FROM customer ORDER BY name"
-    
-    result = execute_query(query, fetch_all=True)
-    return result if result is not None else []
+# 고객 일괄 등록용 파라미터 변환 (잘못된 값은 ValueError)
+def _customer_values(customer_data):
+    birth_date = customer_data.get("birth_date")
+    gender = optional_text(customer_data.get("gender"), "gender")
 
-def get_customer_by_customer(customer_id):
-    query = """
-    SELECT * FROM customer
-    WHERE customer_id = %s
+    if gender is not None and gender not in GENDERS:
+        raise ValueError(f"gender 값이 올바르지 않습니다: {gender}")
+
+    return (
+        optional_text(require(customer_data, "name"), "name", 20),
+        optional_text(customer_data.get("phone"), "phone", 20),
+        parse_date(birth_date, "birth_date") if birth_date else None,
+        gender,
+        optional_text(customer_data.get("memo"), "memo")
+    )
+
+# 고객 일괄 등록
+@timed
+def create_customers_bulk(customers, chunk_size=None):
     """
+    여러 고객을 청크 단위 다중 행 INSERT로 등록
 
-    return execute_query(query, (customer_id,), fetch_one=True)
+    Args:
+        customers (iterable): create_customer 와 같은 형태의 고객 데이터
+        chunk_size (int, optional): 청크 크기 (기본값: Config.DB_BULK_CHUNK_SIZE)
 
-# 고객 검색
-def search_customers(search_term):
+    Returns:
+        dict: {"ids": 입력 순서대로 생성된 고객 ID (실패 시 None),
+               "errors": [{"index": 입력 순번, "error": 오류 메시지}]}
+    """
     query = """
-    SELECT * FROM customer
-    WHERE name LIKE %s OR phone LIKE %s OR birth_date LIKE %s
+    INSERT INTO customer (name, phone, birth_date, gender, memo)
+    VALUES (%s, %s, %s, %s, %s)
     """
 
-    keywords = f"%{search_term}%"
+    result = bulk_insert(query, customers, _customer_values, chunk_size)
+    print(f"고객 일괄 등록: 성공 {len(result['ids']) - len(result['errors'])}건, 실패 {len(result['errors'])}건")
+
+    # 대량 등록은 건별 갱신보다 다음 조회 시 전체 재생성이 빠름
+    after_commit(customer_index.invalidate)
+
+    return result
+
+# 전체 고객 쿼리 (app/async_queries.py 와 공용)
+ALL_CUSTOMERS_QUERY = "SELECT * FROM customer ORDER BY name"
 
-    result = execute_query(query, (keywords, keywords, keywords), fetch_all=True)
+# 전체 고객 조회
+@timed
+def get_all_customers():
+    result = execute_query(ALL_CUSTOMERS_QUERY, fetch_all=True)
     return result if result is not None else []
+
+# 고객 목록 페이지 쿼리와 키셋 컬럼 (app/async_queries.py 와 공용)
+CUSTOMERS_PAGE_SELECT = "SELECT * FROM customer"
+CUSTOMERS_PAGE_COLUMNS = [("name", "name"), ("customer_id", "customer_id")]
+
+# 고객 목록 페이지 조회 (이름순, 키셋 페이지네이션)
+@timed
+def get_customers_page(limit=None, after=None, before=None):
+    """
+    Args:
+        limit (int, optional): 페이지 크기
+        after (str, optional): 다음 페이지 커서
+        before (str, optional): 이전 페이지 커서
+
+    Returns:
+        dict: {"items", "next_cursor", "prev_cursor", "limit"}
+    """
+    return fetch_page(CUSTOMERS_PAGE_SELECT, CUSTOMERS_PAGE_COLUMNS, limit=limit, after=after, before=before)
+
+# 전체 고객 내보내기 쿼리 (app/async_queries.py 와 공용)
+CUSTOMERS_EXPORT_QUERY = "SELECT * FROM customer ORDER BY customer_id"
+
+# 전체 고객 스트리밍 조회 (내보내기용)
+@timed
+def iter_customers():
+    yield from iter_query(CUSTOMERS_EXPORT_QUERY)
+
+# 고객 단건 조회 쿼리 (app/async_queries.py 와 공용)
+CUSTOMER_BY_ID_QUERY = """
+SELECT * FROM customer
+WHERE customer_id = %s
+"""
+
+@timed
+def get_customer_by_customer(customer_id):
+    return execute_query(CUSTOMER_BY_ID_QUERY, (customer_id,), fetch_one=True)
+
+# 고객 검색 (이름 ngram / 전화번호 / 생년월일, 순위순, 최대 limit 건)
+@timed
+def search_customers(search_term, limit=None):
+    return search.search_customers(search_term, limit)
     
 # 고객 정보 수정
+@timed
 def update_customer(customer_data):
     query = """
     UPDATE customer
@@ -74,8 +156,13 @@ def update_customer(customer_data):
     )
 
     try:
-        execute_query(query, values)
+        result = execute_write(query, values)
         print(f"고객 정보 수정 성공: {customer_data['name']}")
+
+        if result:
+            customer = {"customer_id": int(customer_data["customer_id"]), "name": customer_data["name"],
+                        "phone": customer_data["phone"]}
+            after_commit(lambda: customer_index.add(customer))
     
         return True
     
@@ -85,13 +172,22 @@ def update_customer(customer_data):
         return False
 
 # 고객 삭제
+@timed
 def delete_customer(customer_id):
     query = "DELETE FROM customer WHERE customer_id = %s"
     
     try:
-        execute_query(query, (customer_id,))
+        # 연쇄 삭제되는 방문/결제의 일별 집계도 함께 갱신
+        with transaction():
+            days = days_of_customer(customer_id)
+            result = execute_write(query, (customer_id,))
+            refresh_daily_stats(days)
+
         print(f"고객 삭제 성공: {customer_id}")
 
+        if result:
+            after_commit(lambda: customer_index.remove(int(customer_id)))
+
         return True
     
     except Exception as e:
@@ -99,13 +195,103 @@ def delete_customer(customer_id):
         
         return False
     
+# 생일(월/일)을 birth_mmdd 컬럼 값(월 * 100 + 일)으로 변환
+def _mmdd(day):
+    return day.month * 100 + day.day
+
 # 특정 월에 생일인 고객 조회
+@timed
 def get_customer_by_birth_month(month):
+    query, params = _birth_month_query(month)
+
+    result = execute_query(query, params, fetch_all=True, cache=True)
+    return result if result is not None else []
+
+# 생일 월 조회 쿼리와 파라미터 (app/async_queries.py 와 공용)
+def _birth_month_query(month):
+    # birth_mmdd 인덱스 범위 조회 (MONTH(birth_date) 조건은 풀 스캔)
     query = """
     SELECT * FROM customer
-    WHERE MONTH(birth_date) = %s
-    ORDER BY DAY(birth_date), name
+    WHERE birth_mmdd BETWEEN %s AND %s
+    ORDER BY birth_mmdd, name
+    """
+
+    month = int(month)
+    return query, (month * 100 + 1, month * 100 + 31)
+
+# 다가오는 생일 고객 조회
+@timed
+def get_upcoming_birthdays(days, today=None):
     """
+    오늘부터 days 일 이내에 생일이 있는 고객 조회
+
+    연말을 넘어가는 기간은 (오늘 ~ 12/31), (1/1 ~ 종료일) 두 범위로 나누어
+    birth_mmdd 인덱스 범위 조회로 처리합니다. 2월 29일생은 평년에는 2월 28일 다음 날
+    (3월 1일)이 포함된 기간에 조회됩니다.
+
+    Args:
+        days (int): 조회 기간 (0이면 오늘 생일만)
+        today (date, optional): 기준일 (기본값: 오늘)
+
+    Returns:
+        list: 고객 목록 (다가오는 순서), 각 행에 next_birthday, days_until 추가
+    """
+    today = today or date.today()
+    query, params, end = _upcoming_birthdays_query(days, today)
+
+    customers = execute_query(query, params, fetch_all=True, cache=True) or []
+    return _filter_upcoming(customers, today, end)
+
+# 다가오는 생일 조회 쿼리, 파라미터, 기간 종료일 (app/async_queries.py 와 공용)
+def _upcoming_birthdays_query(days, today):
+    days = max(0, min(int(days), 365))
+    end = today + timedelta(days=days)
+
+    start_mmdd, end_mmdd = _mmdd(today), _mmdd(end)
+
+    # 평년 3월 1일에 시작하면 2월 29일생도 포함 (평년에는 3월 1일에 생일 처리)
+    if start_mmdd == 301 and not calendar.isleap(today.year):
+        start_mmdd = 229
+
+    if days >= 365:
+        ranges = [(101, 1231)]
+    elif today.year == end.year:
+        ranges = [(start_mmdd, end_mmdd)]
+    else:
+        ranges = [(start_mmdd, 1231), (101, end_mmdd)]
+
+    conditions = " OR ".join(["birth_mmdd BETWEEN %s AND %s"] * len(ranges))
+    query = f"""
+    SELECT * FROM customer
+    WHERE {conditions}
+    ORDER BY birth_mmdd, name
+    """
+
+    params = tuple(value for bounds in ranges for value in bounds)
+    return query, params, end
+
+# 조회한 고객 중 기간 안에 생일이 있는 고객 (다가오는 순서, next_birthday / days_until 추가)
+def _filter_upcoming(customers, today, end):
+    upcoming = []
+    for customer in customers:
+        next_birthday = _next_birthday(customer["birth_date"], today)
+        if next_birthday <= end:
+            upcoming.append(dict(customer, next_birthday=next_birthday,
+                                 days_until=(next_birthday - today).days))
+
+    upcoming.sort(key=lambda customer: (customer["days_until"], customer["name"]))
+    return upcoming
+
+# 기준일 이후(당일 포함) 다음 생일 (평년의 2/29 생일은 3/1)
+def _next_birthday(birth_date, today):
+    for year in (today.year, today.year + 1):
+        try:
+            birthday = date(year, birth_date.month, birth_date.day)
+        except ValueError:
+            birthday = date(year, 3, 1)
+
+        if birthday >= today:
+            return birthday
+
+    return birthday
 
-    result = execute_query(query, (month,), fetch_all=True)
-    return result if result is not None else []
\ No newline at end of file
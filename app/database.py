@@ -1,29 +1,760 @@
-try:
-    import mysql.connector
-    MYSQL_AVAILABLE = True
-except ImportError:
-    print("[WARNING] MySQL 모듈이 설치되지 않았습니다. 데모 모드로 실행됩니다.")
-    MYSQL_AVAILABLE = False
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 
+from flask import request, session
+
+from .backends import MYSQL_AVAILABLE, get_backend
 from .config import Config
+from .query_cache import QueryCache, statement_tables, affected_tables, is_write
+from .query_stats import QueryStats, QueryTiming, RequestQueries, TimedCursor
+from .replicas import ReplicaRouter
+
+if MYSQL_AVAILABLE:
+    import mysql.connector  # 복제본 상태 조회 (MySQL 전용)
+
+
+class PoolTimeoutError(Exception):
+    """풀에서 제한 시간 안에 연결을 얻지 못한 경우"""
+
+
+class PooledConnection:
+    """
+    풀에서 대여한 연결 래퍼
+
+    close() 호출 시 실제 소켓을 닫지 않고 풀에 반납하므로
+    기존 코드의 conn.close() 패턴을 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        """연결을 풀에 반납"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.release(raw)
+
+    def invalidate(self):
+        """끊어졌거나 상태를 알 수 없는 연결을 풀에 돌려놓지 않고 폐기"""
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.release(raw, discard=True)
+
+
+class ConnectionPool:
+    """
+    스레드 안전 커넥션 풀
+
+    Args:
+        connect (callable): 새 연결을 생성하는 함수
+        size (int): 유지할 유휴 연결 수
+        max_overflow (int): size를 넘어 추가로 열 수 있는 연결 수
+        timeout (float): 연결이 모두 사용 중일 때 대기할 최대 시간 (초)
+        idle_timeout (int): 이 시간(초) 이상 유휴 상태인 연결은 폐기 후 재생성
+        pre_ping (bool): 대여 시 연결 상태 확인 여부
+    """
+
+    def __init__(self, connect, size=5, max_overflow=10, timeout=30,
+                 idle_timeout=300, pre_ping=True):
+        self._connect = connect
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.pre_ping = pre_ping
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (연결, 반납 시각)
+        self._in_use = 0
+
+        # 통계
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+
+    def acquire(self):
+        """연결 대여 (풀이 가득 찬 경우 timeout 만큼 대기)"""
+        started = time.perf_counter()
+        deadline = started + self.timeout
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    raw, released_at = self._idle.pop()  # 가장 최근에 반납된 연결부터 사용
+                    break
+
+                if self._in_use < self.size + self.max_overflow:
+                    raw, released_at = None, None
+                    break
+
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"{self.timeout}초 안에 사용 가능한 DB 연결이 없습니다. (사용 중: {self._in_use})"
+                    )
+                self._cond.wait(remaining)
+
+            self._in_use += 1
+
+        try:
+            if raw is not None and not self._is_usable(raw, released_at):
+                self._close_raw(raw)
+                raw = None
+
+            if raw is None:
+                raw = self._connect()
+                with self._cond:
+                    self._created += 1
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        waited = time.perf_counter() - started
+        with self._cond:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        return PooledConnection(self, raw)
+
+    def release(self, raw, discard=False):
+        """연결 반납 (유휴 연결이 size를 넘으면 overflow 연결로 보고 닫음)"""
+        with self._cond:
+            self._in_use -= 1
+            keep = not discard and len(self._idle) < self.size
+            if keep:
+                self._idle.append((raw, time.monotonic()))
+            self._cond.notify()
+
+        if not keep:
+            self._close_raw(raw)
+
+    def _is_usable(self, raw, released_at):
+        if self.idle_timeout and time.monotonic() - released_at > self.idle_timeout:
+            return False
+
+        if self.pre_ping:
+            try:
+                return raw.is_connected()
+            except Exception:
+                return False
+
+        return True
+
+    def _close_raw(self, raw):
+        with self._cond:
+            self._discarded += 1
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def dispose(self):
+        """유휴 연결을 모두 닫음 (사용 중인 연결은 반납 시 정상 처리)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+
+        for raw, _ in idle:
+            self._close_raw(raw)
+
+    def stats(self):
+        """풀 상태 및 대기 시간 통계 반환"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "wait_time_total": round(self._wait_total, 6),
+                "wait_time_avg": round(self._wait_total / self._checkouts, 6) if self._checkouts else 0.0,
+                "wait_time_max": round(self._wait_max, 6),
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "discarded": self._discarded
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _create_raw_connection(db_config=None):
+    connection = get_backend().connect(db_config)
+    print("데이터베이스 연결 성공")
+
+    return connection
+
+def get_pool():
+    """프로세스 공용 커넥션 풀 반환 (최초 호출 시 Config 기준으로 생성)"""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(_create_raw_connection, **Config.get_pool_config())
+
+    return _pool
+
+def close_pool():
+    """커넥션 풀과 복제본 풀 폐기 (설정 변경 후 다음 호출에서 새로 생성됨)"""
+    global _pool, _router, _router_loaded
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.dispose()
+        if _router is not None:
+            _router.dispose()
+        _pool = None
+        _router, _router_loaded = None, False
+
+_router = None
+_router_loaded = False
+
+def _replica_lag(pool):
+    """복제본의 복제 지연(초) 조회 (복제가 멈췄으면 None, 복제 설정이 없는 서버는 0)"""
+    conn = pool.acquire()
+
+    try:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("SHOW REPLICA STATUS")
+        except mysql.connector.ProgrammingError:
+            # MySQL 8.0.22 이전
+            cursor.execute("SHOW SLAVE STATUS")
+        status = cursor.fetchone()
+        cursor.close()
+    except Exception:
+        conn.invalidate()
+        raise
+
+    conn.close()
+
+    if status is None:
+        return 0.0
+
+    lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+    return float(lag) if lag is not None else None
+
+def get_replica_router():
+    """읽기 복제본 선택기 반환 (Config.DB_REPLICAS 가 비어 있으면 None)"""
+    global _router, _router_loaded
+
+    if not _router_loaded:
+        with _pool_lock:
+            if not _router_loaded:
+                configs = Config.get_replica_configs() if get_backend().supports_replicas else []
+                if configs:
+                    replicas = [
+                        (f"{config['host']}:{config['port']}",
+                         ConnectionPool(lambda config=config: _create_raw_connection(config), **Config.get_pool_config()))
+                        for config in configs
+                    ]
+                    _router = ReplicaRouter(replicas, _replica_lag,
+                                            Config.DB_REPLICA_MAX_LAG, Config.DB_REPLICA_CHECK_INTERVAL)
+                _router_loaded = True
+
+    return _router
+
+def get_replica_stats():
+    """복제본별 상태/지연/조회 횟수 반환 (복제본이 없으면 빈 딕셔너리)"""
+    router = get_replica_router()
+    return router.stats() if router is not None else {}
+
+def get_pool_stats():
+    """커넥션 풀 통계 반환 (사용 중, 유휴, 대기 시간 등)"""
+    return get_pool().stats()
 
 def get_connection():
-    if not MYSQL_AVAILABLE:
-        print("[INFO] MySQL 모듈 없음 - 데모 모드")
-        return None
-        
     try:
-        db_config = Config.get_db_config()
-        connection = mysql.connector.connect(**db_config)
-        print("데이터베이스 연결 성공")
-        
-        return connection
-    
+        return get_pool().acquire()
+
     except Exception as e:
         print(f"[ERROR] DB 연결 실패: {e}")
         return None
 
-def execute_query(query, params=None, fetch_one=False, fetch_all=False):
+class UnitOfWork:
+    """
+    하나의 연결과 하나의 트랜잭션을 공유하는 작업 단위
+
+    첫 쿼리 실행 시점에 풀에서 연결을 빌려 트랜잭션을 시작하고,
+    end() 호출 시 한 번만 커밋 또는 롤백한 뒤 연결을 반납합니다.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.failed = False
+        self.on_commit = []
+        self.written_tables = set()  # 커밋 전 변경한 테이블 (결과 캐시 우회용)
+
+    def get_connection(self):
+        """작업 단위 연결 반환 (최초 호출 시 대여 후 트랜잭션 시작)"""
+        if self.connection is None:
+            conn = get_connection()
+            if conn is None:
+                return None
+
+            try:
+                conn.start_transaction()
+            except Exception as e:
+                print(f"[ERROR] 트랜잭션 시작 실패: {e}")
+                conn.invalidate()
+                return None
+
+            self.connection = conn
+
+        return self.connection
+
+    def end(self, commit=True):
+        """커밋(실패 표시가 없을 때) 또는 롤백 후 연결 반납, 커밋 시 after_commit 콜백 실행"""
+        conn, self.connection = self.connection, None
+        callbacks, self.on_commit = self.on_commit, []
+        committed = commit and not self.failed
+
+        if conn is not None:
+            try:
+                if committed:
+                    conn.commit()
+                else:
+                    conn.rollback()
+            except Exception:
+                conn.invalidate()
+                raise
+
+            conn.close()
+
+        if committed:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"[ERROR] 커밋 후 처리 실패: {e}")
+
+
+_local = threading.local()
+
+def get_current_unit_of_work():
+    """현재 스레드(요청)에 바인딩된 작업 단위 반환"""
+    return getattr(_local, "unit_of_work", None)
+
+def after_commit(callback):
+    """
+    현재 작업 단위가 커밋된 뒤 callback 실행 (작업 단위 밖이면 즉시 실행)
+
+    롤백된 변경이 메모리 색인/캐시 등에 반영되지 않도록 할 때 사용합니다.
+    """
+    uow = get_current_unit_of_work()
+
+    if uow is None:
+        callback()
+    else:
+        uow.on_commit.append(callback)
+
+@contextmanager
+def transaction():
+    """
+    작업 단위 컨텍스트
+
+    블록 안의 모든 execute_query 호출이 하나의 연결과 트랜잭션을 공유하며,
+    정상 종료 시 커밋, 예외 발생 시 롤백됩니다.
+    이미 작업 단위가 진행 중이면(예: Flask 요청 안) 그 트랜잭션에 참여합니다.
+
+    Example:
+        with transaction():
+            create_visit(customer_id, visit_data)
+            create_payment(visit_id, payment_data)
+    """
+    current = get_current_unit_of_work()
+    # 명시적 트랜잭션 안의 조회는 이어지는 변경의 근거가 되므로 복제본으로 보내지 않음
+    _local.transaction_depth = getattr(_local, "transaction_depth", 0) + 1
+
+    if current is not None:
+        try:
+            yield current
+        except Exception:
+            current.failed = True
+            raise
+        finally:
+            _local.transaction_depth -= 1
+        return
+
+    uow = UnitOfWork()
+    _local.unit_of_work = uow
+
+    try:
+        yield uow
+    except Exception:
+        uow.failed = True
+        raise
+    finally:
+        _local.transaction_depth -= 1
+        _local.unit_of_work = None
+        uow.end()
+
+@contextmanager
+def detached():
+    """
+    현재 작업 단위에서 잠시 벗어나는 컨텍스트
+
+    블록 안의 쿼리와 transaction() 은 요청 트랜잭션과 별개로 실행/커밋됩니다.
+    대량 가져오기처럼 청크마다 독립적으로 커밋해야 하는 작업에 사용합니다.
+    """
+    current = get_current_unit_of_work()
+    _local.unit_of_work = None
+
+    try:
+        yield
+    finally:
+        _local.unit_of_work = current
+
+@contextmanager
+def capture_queries():
+    """
+    블록 안의 execute_query / iter_query 호출을 실행하지 않고 기록만 하는 컨텍스트
+
+    실행 계획(EXPLAIN) 점검처럼 각 함수가 보내는 SQL만 필요할 때 사용합니다.
+
+    Yields:
+        list: (쿼리, 파라미터) 목록
+    """
+    captured = []
+    _local.captured = captured
+
+    try:
+        yield captured
+    finally:
+        _local.captured = None
+
+def is_capturing():
+    """현재 스레드가 capture_queries() 블록 안인지 여부"""
+    return getattr(_local, "captured", None) is not None
+
+_query_stats = QueryStats(Config.SLOW_QUERY_SECONDS, Config.SLOW_QUERY_LOG or None)
+
+def get_query_stats(top=20):
+    """쿼리 지문별 실행 통계 반환 (총 실행 시간이 큰 순서로 top 개, 느린 쿼리 수 포함)"""
+    return dict(_query_stats.stats(top), enabled=Config.QUERY_STATS_ENABLED)
+
+def clear_query_stats():
+    """쿼리 실행 통계 초기화"""
+    _query_stats.clear()
+
+def current_request_queries():
+    """현재 스레드가 기록 중인 요청별 쿼리 집계 (요청 밖이면 None)"""
+    return getattr(_local, "request_queries", None)
+
+@contextmanager
+def track_request_queries(queries):
+    """
+    블록 안의 쿼리를 지정한 요청별 집계에도 기록하는 컨텍스트 (병렬 조회 작업 스레드용)
+
+    Args:
+        queries (RequestQueries): 요청 스레드의 current_request_queries() (None 이면 그대로 실행)
+    """
+    if queries is None:
+        yield
+        return
+
+    previous = current_request_queries()
+    _local.request_queries = queries
+
+    try:
+        yield
+    finally:
+        _local.request_queries = previous
+
+def _timed_cursor(cursor, timing):
+    """계측이 켜져 있으면 실행/읽기 시간을 기록하는 커서로 감쌈"""
+    return TimedCursor(cursor, timing) if Config.QUERY_STATS_ENABLED else cursor
+
+def _record_timing(timing):
+    """실행이 끝난 쿼리의 시간을 전체 통계와 요청별 집계에 기록"""
+    if not Config.QUERY_STATS_ENABLED or timing.query is None:
+        return
+
+    _query_stats.record(timing)
+
+    queries = current_request_queries()
+    if queries is not None:
+        queries.add(timing)
+
+def read_your_writes_deadline():
+    """이 시각(time.time())까지 현재 스레드의 조회는 기본 DB 에서 실행 (최근 변경/prefer_primary 기준)"""
+    written_at = getattr(_local, "written_at", None)
+    deadline = getattr(_local, "primary_until", 0.0)
+
+    if written_at is not None:
+        deadline = max(deadline, written_at + Config.DB_READ_YOUR_WRITES_SECONDS)
+
+    return deadline
+
+@contextmanager
+def prefer_primary(until=None):
+    """
+    블록 안의 조회를 복제본 대신 기본 DB 에서 실행하는 컨텍스트
+
+    Args:
+        until (float, optional): 이 시각(time.time())까지만 적용 (생략 시 블록 전체)
+    """
+    previous = getattr(_local, "primary_until", 0.0)
+    _local.primary_until = max(previous, float("inf") if until is None else until)
+
+    try:
+        yield
+    finally:
+        _local.primary_until = previous
+
+_LOCKING_READ = ("FOR UPDATE", "FOR SHARE", "LOCK IN SHARE MODE")
+
+def _choose_replica(query):
+    """
+    조회를 보낼 복제본 반환 (기본 DB 에서 실행해야 하면 None)
+
+    복제본 대상: 잠금 없는 SELECT 중 명시적 트랜잭션 밖이고, 요청 트랜잭션이 아직 연결을
+    쓰지 않았으며, 최근 변경(read-your-writes 기간)이 없는 경우
+    """
+    if getattr(_local, "transaction_depth", 0) or time.time() < read_your_writes_deadline():
+        return None
+
+    uow = get_current_unit_of_work()
+    if uow is not None and (uow.connection is not None or uow.written_tables):
+        return None
+
+    statement = query.lstrip().upper()
+    if not statement.startswith("SELECT") or any(lock in statement for lock in _LOCKING_READ):
+        return None
+
+    router = get_replica_router()
+    return router.choose() if router is not None else None
+
+def _acquire_replica(replica):
+    """복제본 연결 대여 (실패하면 복제본을 제외하고 None)"""
+    try:
+        return replica.pool.acquire()
+    except Exception as e:
+        get_replica_router().mark_failed(replica, e)
+        return None
+
+def init_app(app):
+    """Flask 요청마다 작업 단위를 하나씩 바인딩"""
+
+    if Config.DB_REPLICAS and not Config.SECRET_KEY:
+        # 변경 직후 기본 DB 조회 기한은 서명된 세션 쿠키에 보관하므로 워커/재시작 간에 같은 키가 필요
+        print("[ERROR] DB_REPLICAS 사용 시 SECRET_KEY 필요 - 다른 워커/재시작 후 요청에서 변경 직후 조회가 복제본으로 갈 수 있음")
+
+    @app.before_request
+    def _begin_unit_of_work():
+        _local.unit_of_work = UnitOfWork()
+        _local.request_queries = RequestQueries() if Config.QUERY_STATS_ENABLED else None
+        _local.written_at = None
+        # 이전 요청에서 변경한 사용자는 복제본이 따라올 때까지 기본 DB 에서 조회 (read-your-writes)
+        _local.primary_until = session.get("db_primary_until", 0.0) if get_replica_router() else 0.0
+
+    @app.after_request
+    def _commit_unit_of_work(response):
+        uow = get_current_unit_of_work()
+        _local.unit_of_work = None
+
+        if uow is not None:
+            wrote = bool(uow.written_tables)
+            # 응답 전송 전에 커밋하여 리다이렉트 이후 조회에서 변경 내용이 보이도록 함
+            uow.end(commit=response.status_code < 500)
+
+            if wrote and get_replica_router():
+                session["db_primary_until"] = time.time() + Config.DB_READ_YOUR_WRITES_SECONDS
+
+        queries = current_request_queries()
+        _local.request_queries = None
+
+        if queries is not None:
+            _report_request_queries(request, response, queries)
+
+        return response
+
+    @app.teardown_request
+    def _rollback_unit_of_work(exc):
+        uow = get_current_unit_of_work()
+        _local.unit_of_work = None
+        _local.request_queries = None
+
+        if uow is not None:
+            try:
+                uow.end(commit=False)
+            except Exception as e:
+                print(f"[ERROR] 트랜잭션 롤백 실패: {e}")
+
+def _report_request_queries(request, response, queries):
+    """요청별 쿼리 수/DB 시간을 응답 헤더에 기록하고, 같은 쿼리가 반복되면(N+1 의심) 경고"""
+    db_time_ms = queries.db_time * 1000
+
+    response.headers["X-DB-Queries"] = str(queries.count)
+    response.headers["X-DB-Time"] = f"{db_time_ms:.1f}"
+    # 브라우저 개발자 도구의 Timing 탭에 표시
+    response.headers.add("Server-Timing", f'db;dur={db_time_ms:.1f};desc="{queries.count} queries"')
+
+    if Config.QUERY_LOG_REQUESTS:
+        print(f"[INFO] {request.method} {request.path} ({request.endpoint}): "
+              f"쿼리 {queries.count}건, DB {db_time_ms:.1f}ms")
+
+    if Config.QUERY_REPEAT_WARN:
+        for key, count in queries.repeated(Config.QUERY_REPEAT_WARN):
+            print(f"[WARNING] 같은 쿼리 {count}회 반복 - N+1 의심 ({request.endpoint}): {key}")
+
+def _run_statement(operation, default=None, query=None):
+    """
+    연결 대여/반납과 오류 처리를 공통으로 담당하는 내부 함수
+
+    Args:
+        operation (callable): 커서를 받아 결과를 반환하는 함수
+        default: 연결 실패 또는 쿼리 오류 시 반환할 값
+        query (str, optional): 읽기 조회이면 SQL (복제본으로 보낼 수 있는지 판단)
+
+    Returns:
+        operation의 반환값 또는 default
+    """
+    replica = _choose_replica(query) if query is not None else None
+    if replica is not None:
+        result = _run_on_replica(replica, operation, default)
+        if result is not _FALLBACK:
+            return result
+
+    uow = get_current_unit_of_work()
+    started = time.perf_counter()
+    conn = uow.get_connection() if uow is not None else get_connection()
+    timing = QueryTiming(acquire=time.perf_counter() - started)
+
+    if conn is None:
+        print("[ERROR] DB 연결 객체 없음.")
+        return default
+
+    backend = get_backend()
+    cursor = None
+    failed = broken = False
+
+    try:
+        cursor = _timed_cursor(conn.cursor(dictionary=True), timing)  # 결과를 딕셔너리 형태로 반환
+        return operation(cursor)
+
+    except backend.IntegrityError as e:
+        failed = True
+        print(f"[ERROR] 무결성 제약 조건 위반: {e}")
+
+    except backend.connection_errors as e:
+        # 연결 자체에 문제가 있으므로 풀에 돌려놓지 않음
+        failed = broken = True
+        print(f"[ERROR] DB 연결 오류: {e}")
+
+    except backend.Error as e:
+        failed = True
+        print(f"[ERROR] SQL 실행 중 오류: {e}")
+
+    finally:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                failed = broken = True
+
+        if uow is not None:
+            # 작업 단위 연결은 종료 시점에 한 번만 커밋/롤백 후 반납
+            if failed:
+                uow.failed = True
+        elif broken:
+            conn.invalidate()
+        else:
+            conn.close()
+
+        _record_timing(timing)
+
+    return default
+
+_FALLBACK = object()
+
+def _run_on_replica(replica, operation, default):
+    """복제본에서 조회 (연결 오류면 복제본을 제외하고 _FALLBACK 반환 - 기본 DB 에서 다시 실행)"""
+    started = time.perf_counter()
+    conn = _acquire_replica(replica)
+    if conn is None:
+        return _FALLBACK
+
+    timing = QueryTiming(acquire=time.perf_counter() - started, replica=replica.name)
+    backend = get_backend()
+    cursor = None
+    broken = False
+
+    try:
+        cursor = _timed_cursor(conn.cursor(dictionary=True), timing)
+        return operation(cursor)
+
+    except backend.connection_errors as e:
+        broken = True
+        get_replica_router().mark_failed(replica, e)
+        return _FALLBACK
+
+    except backend.Error as e:
+        print(f"[ERROR] SQL 실행 중 오류: {e}")
+        return default
+
+    finally:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                broken = True
+
+        if broken:
+            conn.invalidate()
+        else:
+            conn.close()
+
+        _record_timing(timing)
+
+_query_cache = QueryCache(Config.QUERY_CACHE_MAX_BYTES, Config.QUERY_CACHE_TTL)
+_FAILED = object()
+
+def get_query_cache_stats():
+    """쿼리 결과 캐시 통계 반환 (적중, 미적중, LRU 제거, 무효화, 크기)"""
+    return dict(_query_cache.stats(), enabled=Config.QUERY_CACHE_ENABLED)
+
+def clear_query_cache():
+    """쿼리 결과 캐시 비우기 (데이터 계층 밖에서 데이터를 변경한 경우)"""
+    _query_cache.clear()
+
+def _record_write(query):
+    """변경 문장이 영향을 준 테이블의 캐시 결과 무효화"""
+    tables = affected_tables(query)
+    _query_cache.invalidate_tables(tables)
+
+    # 이 스레드는 잠시 복제본 대신 기본 DB 에서 조회 (read-your-writes)
+    _local.written_at = time.time()
+
+    uow = get_current_unit_of_work()
+    if uow is not None:
+        uow.written_tables |= tables
+        # 커밋 전 다른 스레드가 이전 데이터를 다시 캐시했을 수 있으므로 커밋 후 한 번 더 무효화
+        after_commit(lambda: _query_cache.invalidate_tables(tables))
+
+def _cacheable(query):
+    """결과 캐시 사용 가능 여부 (커밋 전 변경이 있는 테이블을 읽으면 우회)"""
+    if not Config.QUERY_CACHE_ENABLED:
+        return False
+
+    uow = get_current_unit_of_work()
+    return uow is None or not (uow.written_tables & statement_tables(query))
+
+def execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
     """
     SQL 쿼리 실행 함수
 
@@ -32,46 +763,285 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False):
         params (tuple, optional): 쿼리 파라미터 (기본값: None)
         fetch_one (bool): 단건 결과 반환 여부 (기본값: False)
         fetch_all (bool): 여러건 결과 반환 여부 (기본값: False)
-    
+        cache (bool): SELECT 결과 캐시 사용 여부 (기본값: False)
+
     Returns:
         dict or list or None: 쿼리 결과
-    """
-    conn = get_connection()
 
-    if conn is None:
-        print("[ERROR] DB 연결 객체 없음.")
-        # 안전한 기본값 반환
-        if fetch_all:
-            return []
-        elif fetch_one:
-            return None
-        return None
+    Note:
+        작업 단위(transaction() 또는 Flask 요청) 안에서 호출되면 해당 연결과
+        트랜잭션을 공유하고, 오류 발생 시 작업 단위 전체가 롤백됩니다.
+        변경 문장(INSERT/UPDATE/DELETE)은 해당 테이블의 캐시 결과를 무효화합니다.
+    """
+    captured = getattr(_local, "captured", None)
+    if captured is not None:
+        captured.append((query, params))
+        return [] if fetch_all else None
 
-    try:
-        cursor = conn.cursor(dictionary=True)  # 결과를 딕셔너리 형태로 반환
+    def operation(cursor):
         cursor.execute(query, params or ())
-        
+
         result = None
 
         if fetch_one:
             result = cursor.fetchone()
         elif fetch_all:
             result = cursor.fetchall()
-        
+
         return result
-    
-    except mysql.connector.IntegrityError as e:
-        print(f"[ERROR] 무결성 제약 조건 위반: {e}")
 
-    except mysql.connector.Error as e:
+    default = [] if fetch_all else None
+
+    if is_write(query):
+        result = _run_statement(operation, default=default)
+        _record_write(query)
+        return result
+
+    # 결과를 읽는 조회만 복제본 대상
+    read_query = query if (fetch_one or fetch_all) else None
+
+    if not (cache and (fetch_one or fetch_all) and _cacheable(query)):
+        # 안전한 기본값 반환
+        return _run_statement(operation, default=default, query=read_query)
+
+    key = QueryCache.make_key(query, params, fetch_one)
+    hit, result = _query_cache.get(key)
+    if hit:
+        return result
+
+    result = _run_statement(operation, default=_FAILED, query=read_query)
+    if result is _FAILED:
+        # 오류로 대신 반환하는 기본값은 보관하지 않음
+        return default
+
+    _query_cache.put(key, result, statement_tables(query))
+    return result
+
+def iter_query(query, params=None, batch_size=None):
+    """
+    SELECT 결과를 스트리밍으로 한 행씩 반환하는 제너레이터
+
+    버퍼링하지 않는 커서로 실행하고 fetchmany 로 batch_size 만큼씩 읽으므로
+    결과 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        query (str): 실행할 SQL 쿼리
+        params (tuple, optional): 쿼리 파라미터 (기본값: None)
+        batch_size (int, optional): 한 번에 읽을 행 수 (기본값: Config.DB_STREAM_BATCH_SIZE)
+
+    Yields:
+        dict: 결과 행
+
+    Note:
+        스트리밍 중에는 연결을 다른 쿼리에 쓸 수 없으므로 작업 단위와 관계없이
+        전용 연결을 사용합니다. 소비자가 중간에 멈추면(break, close, 가비지 컬렉션)
+        남은 결과를 모두 읽는 대신 연결을 폐기하여 즉시 풀 자리를 돌려줍니다.
+    """
+    captured = getattr(_local, "captured", None)
+    if captured is not None:
+        captured.append((query, params))
+        return
+
+    batch_size = batch_size or Config.DB_STREAM_BATCH_SIZE
+    # 내보내기 등 대량 조회는 가능하면 복제본에서 실행
+    replica = _choose_replica(query)
+    started = time.perf_counter()
+    conn = _acquire_replica(replica) if replica is not None else None
+    if conn is None:
+        replica = None
+        conn = get_connection()
+
+    if conn is None:
+        print("[ERROR] DB 연결 객체 없음.")
+        return
+
+    # 결과를 읽는 시간은 소비자가 행을 처리하는 시간을 빼고 fetchmany 호출만 합산
+    timing = QueryTiming(acquire=time.perf_counter() - started, replica=replica.name if replica else None)
+    backend = get_backend()
+    cursor = None
+    exhausted = broken = False
+
+    try:
+        cursor = _timed_cursor(conn.cursor(dictionary=True, buffered=False), timing)
+        cursor.execute(query, params or ())
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                exhausted = True
+                break
+
+            yield from rows
+
+    except backend.connection_errors as e:
+        broken = True
+        print(f"[ERROR] DB 연결 오류: {e}")
+        if replica is not None:
+            get_replica_router().mark_failed(replica, e)
+
+    except backend.Error as e:
         print(f"[ERROR] SQL 실행 중 오류: {e}")
-    
-    except mysql.connector.Exceptions as e:
-        print(f"[ERROR] 알 수 없는 예외 발생: {e}")
 
     finally:
-        cursor.close()
-        conn.close()
+        if not exhausted:
+            # 읽지 않은 결과가 남은 연결은 재사용할 수 없음
+            broken = True
+
+        if cursor is not None and not broken:
+            try:
+                cursor.close()
+            except Exception:
+                broken = True
+
+        if broken:
+            conn.invalidate()
+        else:
+            conn.close()
+
+        _record_timing(timing)
+
+def execute_write(query, params=None):
+    """
+    INSERT / UPDATE / DELETE 실행 후 반영 결과 반환
+
+    Args:
+        query (str): 실행할 SQL 쿼리
+        params (tuple, optional): 쿼리 파라미터
+
+    Returns:
+        dict or None: {"rowcount": 반영된 행 수, "lastrowid": 생성된 ID}
+                      실패 시 None
+    """
+    captured = getattr(_local, "captured", None)
+    if captured is not None:
+        captured.append((query, params))
+        return None
+
+    def operation(cursor):
+        cursor.execute(query, params or ())
+        return {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+
+    result = _run_statement(operation)
+    _record_write(query)
+
+    return result
+
+def execute_many(query, seq_params):
+    """
+    같은 쿼리를 여러 파라미터로 한 번에 실행 (executemany)
+
+    INSERT ... VALUES 쿼리는 드라이버가 다중 행 INSERT 한 문장으로 묶어 전송합니다.
+
+    Args:
+        query (str): 실행할 SQL 쿼리
+        seq_params (list): 파라미터 튜플 목록
+
+    Returns:
+        dict or None: {"rowcount": 반영된 행 수, "lastrowid": 첫 번째로 생성된 ID}
+                      실패 시 None
+    """
+    def operation(cursor):
+        cursor.executemany(query, seq_params)
+        return {"rowcount": cursor.rowcount, "lastrowid": cursor.lastrowid}
+
+    result = _run_statement(operation)
+    _record_write(query)
+
+    return result
+
+def bulk_insert(query, records, to_values, chunk_size=None, on_chunk=None):
+    """
+    여러 건을 검증 후 청크 단위 다중 행 INSERT로 등록
+
+    청크마다 하나의 트랜잭션으로 실행되며, 검증에 실패한 행이나 실패한 청크는
+    오류 목록에 기록하고 나머지는 계속 진행합니다.
+    이미 작업 단위(Flask 요청 등) 안이면 모든 청크가 그 트랜잭션을 공유하므로
+    한 청크라도 실패하면 전체가 롤백됩니다.
+
+    Args:
+        query (str): INSERT ... VALUES (%s, ...) 쿼리
+        records (iterable): 등록할 데이터 (딕셔너리)
+        to_values (callable): 데이터를 파라미터 튜플로 변환 (잘못된 데이터는 ValueError)
+        chunk_size (int, optional): 청크 크기 (기본값: Config.DB_BULK_CHUNK_SIZE)
+        on_chunk (callable, optional): 청크의 생성 ID 목록을 받아 같은 트랜잭션 안에서 실행할 함수
+                                       (집계 갱신 등, 실패하면 청크와 함께 롤백)
+
+    Returns:
+        dict: {"ids": 입력 순서대로 생성된 ID (실패한 행은 None),
+               "errors": [{"index": 입력 순번, "error": 오류 메시지}]}
+
+    Note:
+        다중 행 INSERT 한 문장으로 생성된 AUTO_INCREMENT 값은 연속이므로
+        첫 번째 ID(lastrowid)부터 순서대로 각 행에 대응됩니다.
+        (auto_increment_increment = 1 기준)
+    """
+    chunk_size = chunk_size or Config.DB_BULK_CHUNK_SIZE
+    nested = get_current_unit_of_work() is not None
+    ids = []
+    errors = []
+    aborted = False
+
+    def fail(indexes, message):
+        for index in indexes:
+            ids[index] = None
+            errors.append({"index": index, "error": message})
+
+    def flush(chunk):
+        nonlocal aborted
+
+        if aborted:
+            fail((index for index, _ in chunk), "일괄 등록 중단 (트랜잭션 롤백)")
+            return
+
+        with transaction() as uow:
+            result = execute_many(query, [values for _, values in chunk])
+            message = "일괄 등록 실패 (청크 롤백)"
+
+            if result is not None and not uow.failed and on_chunk is not None:
+                try:
+                    on_chunk([result["lastrowid"] + offset for offset in range(len(chunk))])
+                except Exception as e:
+                    print(f"[ERROR] 일괄 등록 후처리 실패: {e}")
+                    uow.failed = True
+                message = "일괄 등록 후처리 실패 (청크 롤백)"
+
+            if result is None or uow.failed:
+                uow.failed = True
+                fail((index for index, _ in chunk), message)
+
+                if nested:
+                    # 앞서 등록한 청크도 함께 롤백되므로 성공 목록에서 제외
+                    aborted = True
+                    fail([index for index, row_id in enumerate(ids) if row_id is not None],
+                         "일괄 등록 중단 (트랜잭션 롤백)")
+                return
+
+        for offset, (index, _) in enumerate(chunk):
+            ids[index] = result["lastrowid"] + offset
+
+    chunk = []
+    for index, record in enumerate(records):
+        ids.append(None)
+
+        try:
+            chunk.append((index, to_values(record)))
+        except KeyError as e:
+            errors.append({"index": index, "error": f"필수 항목 누락: {e}"})
+            continue
+
+        except (ValueError, TypeError) as e:
+            errors.append({"index": index, "error": str(e)})
+            continue
+
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+
+    if chunk:
+        flush(chunk)
+
+    errors.sort(key=lambda error: error["index"])
+    return {"ids": ids, "errors": errors}
 
 def test_connection():
     """데이터 베이스 연결 테스트"""
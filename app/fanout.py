@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from .config import Config
+from .database import (get_current_unit_of_work, is_capturing, prefer_primary, read_your_writes_deadline,
+                       current_request_queries, track_request_queries)
+
+"""
+독립 조회 병렬 실행(fan-out) 모듈
+
+한 화면에서 서로 의존하지 않는 조회 여러 개를 스레드 풀에서 동시에 실행하고
+모두 끝날 때까지 기다립니다. 화면 응답 시간이 조회 시간의 합 대신 가장 느린 조회 시간에 가까워집니다.
+
+- 각 조회는 작업 스레드에서 풀의 연결을 따로 빌려 실행됩니다 (요청 트랜잭션 밖, 읽기 전용 조회용)
+  호출한 스레드가 기본 DB 에서 조회해야 하는 기간(read-your-writes)이면 작업 스레드도 기본 DB 를 사용합니다.
+  작업 스레드의 쿼리도 호출한 요청의 쿼리 수/DB 시간에 합산됩니다.
+- 조회별 제한 시간: 시간 안에 끝나지 않으면 기본값을 사용 (실행 중인 쿼리는 끝날 때까지 연결을 사용)
+- 오류 격리: 한 조회가 예외를 내도 나머지 결과는 그대로 반환하고 해당 조회만 기본값 사용
+
+요청 트랜잭션에 커밋 전 변경이 있거나 capture_queries() 블록 안이면
+변경 내용/기록이 보이도록 현재 스레드에서 순서대로 실행합니다.
+
+사용법:
+    results = fan_out({
+        "stats": Call(get_customer_statistics, customer_id),
+        "visits": Call(get_visits_by_customer, customer_id, default=[]),
+    })
+    results["stats"], results["visits"]
+"""
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class Call:
+    """
+    병렬 실행할 조회 하나
+
+    Args:
+        func (callable): 조회 함수
+        *args, **kwargs: 조회 함수 인자
+        default: 오류/시간 초과 시 사용할 값
+        timeout (float, optional): 제한 시간 (초, 생략 시 fan_out 의 timeout)
+    """
+
+    def __init__(self, func, *args, default=None, timeout=None, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.default = default
+        self.timeout = timeout
+
+    def run(self):
+        return self.func(*self.args, **self.kwargs)
+
+
+def get_executor():
+    """프로세스 공용 작업 스레드 풀 반환 (최초 호출 시 생성)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=Config.FANOUT_WORKERS, thread_name_prefix="fanout")
+
+    return _executor
+
+def shutdown_executor():
+    """작업 스레드 풀 종료 (다음 호출에서 새로 생성됨)"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+def _run_inline():
+    """현재 스레드에서 순서대로 실행해야 하는지 여부"""
+    uow = get_current_unit_of_work()
+    return is_capturing() or (uow is not None and bool(uow.written_tables))
+
+def _run_isolated(name, call, primary_until=0.0, request_queries=None):
+    try:
+        with prefer_primary(primary_until), track_request_queries(request_queries):
+            return call.run()
+    except Exception as e:
+        print(f"[ERROR] 병렬 조회 실패 ({name}): {e}")
+        return call.default
+
+def fan_out(calls, timeout=None):
+    """
+    독립 조회들을 동시에 실행하고 모두 끝날 때까지 대기
+
+    Args:
+        calls (dict): 이름 -> Call
+        timeout (float, optional): 조회별 기본 제한 시간 (초, 기본값: Config.FANOUT_TIMEOUT)
+
+    Returns:
+        dict: 이름 -> 결과 (오류/시간 초과 시 Call.default)
+    """
+    if _run_inline() or len(calls) < 2:
+        return {name: _run_isolated(name, call) for name, call in calls.items()}
+
+    timeout = Config.FANOUT_TIMEOUT if timeout is None else timeout
+    started = time.monotonic()
+    executor = get_executor()
+    primary_until = read_your_writes_deadline()
+    request_queries = current_request_queries()
+    futures = {
+        name: executor.submit(_run_isolated, name, call, primary_until, request_queries)
+        for name, call in calls.items()
+    }
+
+    results = {}
+    for name, future in futures.items():
+        call = calls[name]
+        # 모든 조회가 같은 시각에 시작했으므로 조회별 마감 시각까지 남은 시간만 대기
+        deadline = started + (call.timeout if call.timeout is not None else timeout)
+
+        try:
+            results[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            future.cancel()
+            print(f"[ERROR] 병렬 조회 시간 초과 ({name}): {deadline - started:.1f}초")
+            results[name] = call.default
+
+    return results
@@ -0,0 +1,273 @@
+import argparse
+import csv
+import sys
+import time
+from itertools import islice
+
+from .config import Config
+from .database import execute_query, detached
+from .customer import create_customers_bulk
+from .visit import create_visits_bulk
+from .validators import normalize_phone, normalize_birth_date, optional_text
+
+"""
+CSV 가져오기 모듈
+
+CSV 파일을 한 번에 읽지 않고 배치 단위로 읽어 정규화/검증한 뒤
+다중 행 INSERT로 등록합니다. 메모리 사용량은 배치 크기에만 비례합니다.
+
+사용법:
+    python -m app.importer customers legacy_customers.csv --rejects rejects.csv
+    python -m app.importer visits legacy_visits.csv
+"""
+
+# 헤더 별칭 (기존 엑셀 양식의 한글 헤더 지원)
+CUSTOMER_HEADERS = {
+    "name": ("name", "이름", "고객명"),
+    "phone": ("phone", "연락처", "전화번호", "휴대폰"),
+    "birth_date": ("birth_date", "생년월일", "생일"),
+    "gender": ("gender", "성별"),
+    "memo": ("memo", "메모", "비고")
+}
+
+VISIT_HEADERS = {
+    "customer_id": ("customer_id", "고객ID", "고객번호"),
+    "phone": ("phone", "연락처", "전화번호", "휴대폰"),
+    "visit_date": ("visit_date", "방문일", "방문일시"),
+    "memo": ("memo", "메모", "비고")
+}
+
+GENDER_ALIASES = {
+    "M": "M", "MALE": "M", "남": "M", "남성": "M", "남자": "M",
+    "F": "F", "FEMALE": "F", "여": "F", "여성": "F", "여자": "F"
+}
+
+MAX_REPORTED_REJECTS = 1000  # 보고서에 보관할 거부 행 수 (전체 건수는 별도 집계)
+
+
+class ImportReport:
+    """가져오기 진행 상황 및 결과"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.total = 0
+        self.inserted = 0
+        self.rejected = 0
+        self.rejects = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def reject(self, line, error, row=None):
+        self.rejected += 1
+        if len(self.rejects) < MAX_REPORTED_REJECTS:
+            self.rejects.append({"line": line, "error": error, "row": row})
+
+    @property
+    def rows_per_second(self):
+        elapsed = self.elapsed or (time.perf_counter() - self.started)
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def summary(self):
+        return (f"[IMPORT] {self.kind}: {self.total:,}행 처리, {self.inserted:,}행 등록, "
+                f"{self.rejected:,}행 거부 ({self.rows_per_second:,.0f}행/초)")
+
+    def as_dict(self):
+        return {
+            "kind": self.kind,
+            "total": self.total,
+            "inserted": self.inserted,
+            "rejected": self.rejected,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "rejects": self.rejects
+        }
+
+
+def _read_rows(stream, headers):
+    """CSV 행을 (줄 번호, 표준 컬럼 딕셔너리) 형태로 하나씩 반환"""
+    reader = csv.DictReader(stream)
+    fieldnames = [(name or "").strip().lstrip("\ufeff") for name in (reader.fieldnames or [])]
+
+    mapping = {}
+    for column, aliases in headers.items():
+        for index, name in enumerate(fieldnames):
+            if name in aliases or name.lower() in aliases:
+                mapping[column] = reader.fieldnames[index]
+                break
+
+    for row in reader:
+        yield reader.line_num, {column: row.get(source) for column, source in mapping.items()}
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _normalize_gender(value):
+    text = (value or "").strip()
+    if not text:
+        return None
+
+    gender = GENDER_ALIASES.get(text.upper())
+    if gender is None:
+        raise ValueError(f"gender 값이 올바르지 않습니다: {value}")
+
+    return gender
+
+def _normalize_customer(row):
+    return {
+        "name": optional_text(row.get("name"), "name", 20),
+        "phone": normalize_phone(row.get("phone")),
+        "birth_date": normalize_birth_date(row.get("birth_date")),
+        "gender": _normalize_gender(row.get("gender")),
+        "memo": optional_text(row.get("memo"), "memo")
+    }
+
+def _phone_digits(value):
+    """정규화한 전화번호의 숫자만 (customer.phone_digits 와 같은 형식)"""
+    phone = normalize_phone(value)
+    return phone.replace("-", "") if phone else None
+
+def _find_customer_ids_by_phone(digits):
+    """
+    숫자만 남긴 전화번호 -> 고객 ID 조회 (배치당 쿼리 1회, 중복 번호는 None)
+
+    고객 전화번호는 입력한 형식 그대로 저장되므로 phone 대신 phone_digits 로 비교합니다.
+    (scripts/sql/migrations/0003_customer_search.sql 필요)
+    """
+    if not digits:
+        return {}
+
+    placeholders = ", ".join(["%s"] * len(digits))
+    query = f"SELECT customer_id, phone_digits FROM customer WHERE phone_digits IN ({placeholders})"
+
+    found = {}
+    for row in execute_query(query, tuple(digits), fetch_all=True) or []:
+        # 같은 번호의 고객이 여럿이면 어느 고객인지 알 수 없으므로 None 으로 표시
+        key = row["phone_digits"]
+        found[key] = None if key in found else row["customer_id"]
+
+    return found
+
+def _run_import(kind, rows, prepare, insert, batch_size, progress):
+    report = ImportReport(kind)
+
+    # 요청 트랜잭션과 분리하여 청크마다 커밋
+    with detached():
+        for batch in _batches(rows, batch_size):
+            records, lines = [], []
+
+            for line, record in prepare(batch, report):
+                records.append(record)
+                lines.append(line)
+
+            if records:
+                result = insert(records)
+                for error in result["errors"]:
+                    report.reject(lines[error["index"]], error["error"])
+                report.inserted += len(records) - len(result["errors"])
+
+            report.total += len(batch)
+            if progress:
+                progress(report)
+
+    return report.finish()
+
+def import_customers(stream, batch_size=None, progress=None):
+    """
+    고객 CSV 가져오기
+
+    Args:
+        stream: 텍스트 모드 파일 객체 (헤더: name, phone, birth_date, gender, memo 또는 한글 헤더)
+        batch_size (int, optional): 한 번에 읽어 등록할 행 수 (기본값: Config.IMPORT_BATCH_SIZE)
+        progress (callable, optional): 배치마다 ImportReport 를 받아 호출
+
+    Returns:
+        ImportReport: 처리/등록/거부 건수, 처리량, 거부 행 목록
+    """
+    def prepare(batch, report):
+        for line, row in batch:
+            try:
+                yield line, _normalize_customer(row)
+            except ValueError as e:
+                report.reject(line, str(e), row)
+
+    return _run_import("customers", _read_rows(stream, CUSTOMER_HEADERS), prepare,
+                       create_customers_bulk, batch_size or Config.IMPORT_BATCH_SIZE, progress)
+
+def import_visits(stream, batch_size=None, progress=None):
+    """
+    방문 기록 CSV 가져오기
+
+    고객은 customer_id 컬럼 또는 phone 컬럼(등록된 고객 전화번호)으로 지정합니다.
+
+    Args:
+        stream: 텍스트 모드 파일 객체 (헤더: customer_id 또는 phone, visit_date, memo)
+        batch_size (int, optional): 한 번에 읽어 등록할 행 수 (기본값: Config.IMPORT_BATCH_SIZE)
+        progress (callable, optional): 배치마다 ImportReport 를 받아 호출
+
+    Returns:
+        ImportReport: 처리/등록/거부 건수, 처리량, 거부 행 목록
+    """
+    def prepare(batch, report):
+        normalized = []
+        for line, row in batch:
+            try:
+                phone = None if row.get("customer_id") else _phone_digits(row.get("phone"))
+                normalized.append((line, row, phone))
+            except ValueError as e:
+                report.reject(line, str(e), row)
+
+        customer_ids = _find_customer_ids_by_phone(sorted({phone for _, _, phone in normalized if phone}))
+
+        for line, row, phone in normalized:
+            customer_id = row.get("customer_id")
+
+            if not customer_id:
+                customer_id = customer_ids.get(phone) if phone else None
+                if customer_id is None:
+                    report.reject(line, f"고객을 찾을 수 없거나 중복됩니다: {row.get('phone')}", row)
+                    continue
+
+            yield line, {"customer_id": customer_id, "visit_date": row.get("visit_date"), "memo": row.get("memo")}
+
+    return _run_import("visits", _read_rows(stream, VISIT_HEADERS), prepare,
+                       create_visits_bulk, batch_size or Config.IMPORT_BATCH_SIZE, progress)
+
+IMPORTERS = {
+    "customers": import_customers,
+    "visits": import_visits
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV 데이터 가져오기")
+    parser.add_argument("kind", choices=sorted(IMPORTERS), help="가져올 데이터 종류")
+    parser.add_argument("path", help="CSV 파일 경로 (UTF-8)")
+    parser.add_argument("--batch-size", type=int, default=None, help="배치 크기")
+    parser.add_argument("--rejects", help=f"거부된 행을 기록할 CSV 파일 경로 (최대 {MAX_REPORTED_REJECTS}건)")
+    args = parser.parse_args(argv)
+
+    with open(args.path, encoding="utf-8-sig", newline="") as stream:
+        report = IMPORTERS[args.kind](stream, args.batch_size, progress=lambda r: print(r.summary()))
+
+    print(f"{report.summary()} - {report.elapsed:.1f}초")
+
+    if args.rejects and report.rejects:
+        with open(args.rejects, "w", encoding="utf-8-sig", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(["line", "error"])
+            for reject in report.rejects:
+                writer.writerow([reject["line"], reject["error"]])
+        print(f"거부 행 {len(report.rejects):,}건 기록: {args.rejects}")
+
+    return 0 if report.rejected == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
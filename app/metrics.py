@@ -0,0 +1,358 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+
+from .config import Config
+from .database import get_pool_stats, get_query_cache_stats, get_query_stats, get_replica_stats
+
+"""
+메트릭 수집 모듈
+
+외부 서비스 없이 프로세스 안에서 카운터와 히스토그램을 모으고
+/metrics 에서 Prometheus 텍스트 형식으로 내보냅니다.
+
+- 라우트별: init_app() 의 before/after_request 훅이 요청 수(상태 코드별)와 응답 시간을 기록
+- 데이터 계층 함수별: @timed 데코레이터가 호출 시간과 예외 수를 기록
+- 히스토그램은 고정 버킷에 개수만 더하므로 기록 비용이 일정하고,
+  버킷으로 추정한 p50/p95/p99 를 <이름>_quantile 게이지로 함께 내보냄
+- 커넥션 풀, 쿼리 실행 통계, 쿼리 결과 캐시, 복제본 상태는 내보낼 때 읽음
+
+사용법:
+    @timed
+    def get_customer_by_customer(customer_id):
+        ...
+"""
+
+# 1ms ~ 10s (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + (list(extra.items()) if extra else [])
+    if not pairs:
+        return ""
+
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """라벨 조합별로 증가만 하는 값 (스레드 안전)"""
+
+    type = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values):
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+
+        return [(self.name + _format_labels(self.labels, labels), value) for labels, value in values]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """
+    라벨 조합별 고정 버킷 히스토그램 (스레드 안전)
+
+    Args:
+        name (str): 메트릭 이름
+        help (str): 설명
+        labels (tuple): 라벨 이름
+        buckets (tuple): 버킷 상한 (오름차순, +Inf 는 자동 추가)
+    """
+
+    type = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+
+        self._lock = threading.Lock()
+        self._series = {}  # 라벨 값 -> [버킷별 개수(+Inf 포함), 합계]
+
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series[0]) if series else 0
+
+    def quantile(self, q, *label_values):
+        """
+        버킷 개수로 추정한 분위수 (버킷 안에서는 선형 보간, 기록이 없으면 None)
+
+        가장 큰 버킷을 넘는 값은 가장 큰 버킷 상한으로 표시됩니다.
+        """
+        with self._lock:
+            series = self._series.get(label_values)
+            counts = list(series[0]) if series else []
+
+        return self._quantile(q, counts)
+
+    def _quantile(self, q, counts):
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+
+            cumulative += count
+
+        return self.buckets[-1]
+
+    def samples(self):
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+
+        lines = []
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = {"le": _format_value(bound)}
+                lines.append((self.name + "_bucket" + _format_labels(self.labels, labels, le), cumulative))
+
+            lines.append((self.name + "_sum" + _format_labels(self.labels, labels), round(total, 6)))
+            lines.append((self.name + "_count" + _format_labels(self.labels, labels), cumulative))
+
+        return lines
+
+    def quantile_samples(self):
+        """라벨 조합별 QUANTILES 추정값 (<이름>_quantile 게이지)"""
+        with self._lock:
+            series = sorted((labels, list(counts)) for labels, (counts, _) in self._series.items())
+
+        lines = []
+        for labels, counts in series:
+            for q in QUANTILES:
+                value = self._quantile(q, counts)
+                lines.append((self.name + "_quantile" + _format_labels(self.labels, labels, {"quantile": q}),
+                              round(value, 6)))
+
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """메트릭 목록과 내보낼 때 값을 읽는 수집 함수 목록"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, help, labels=()):
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, func):
+        """
+        내보낼 때마다 호출할 수집 함수 등록 (데코레이터로 사용 가능)
+
+        수집 함수는 (이름, 유형, 설명, 값) 목록을 반환합니다.
+        """
+        self._collectors.append(func)
+        return func
+
+    def render(self):
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines = []
+
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(f"{name} {_format_value(value)}" for name, value in metric.samples())
+
+            if isinstance(metric, Histogram):
+                lines.append(f"# HELP {metric.name}_quantile {metric.help} (버킷 기준 추정 분위수)")
+                lines.append(f"# TYPE {metric.name}_quantile gauge")
+                lines.extend(f"{name} {_format_value(value)}" for name, value in metric.quantile_samples())
+
+        for collect in self._collectors:
+            try:
+                collected = collect()
+            except Exception as e:
+                print(f"[ERROR] 메트릭 수집 실패 ({collect.__name__}): {e}")
+                continue
+
+            for name, kind, help, value in collected:
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """기록한 값 초기화 (테스트용)"""
+        for metric in self._metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "crm_http_requests_total", "라우트별 요청 수", ("endpoint", "method", "status"))
+http_request_duration = registry.histogram(
+    "crm_http_request_duration_seconds", "라우트별 응답 시간 (초)", ("endpoint",))
+function_duration = registry.histogram(
+    "crm_function_duration_seconds", "데이터 계층 함수별 실행 시간 (초)", ("function",))
+function_errors = registry.counter(
+    "crm_function_errors_total", "데이터 계층 함수별 예외 수", ("function",))
+
+
+def timed(func):
+    """
+    데이터 계층 함수의 호출 시간과 예외 수를 기록하는 데코레이터 (라벨: 모듈.함수)
+
+    제너레이터 함수(iter_* 스트리밍 조회)는 생성 시점이 아니라 소비가 끝날 때까지의 시간을 기록합니다.
+    """
+    label = f"{func.__module__.rpartition('.')[2]}.{func.__name__}"
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            if not Config.METRICS_ENABLED:
+                return (yield from func(*args, **kwargs))
+
+            started = time.perf_counter()
+            try:
+                return (yield from func(*args, **kwargs))
+            except Exception:
+                function_errors.inc(label)
+                raise
+            finally:
+                # 소비자가 중간에 멈춘 경우(close)도 그때까지의 시간 기록
+                function_duration.observe(time.perf_counter() - started, label)
+
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not Config.METRICS_ENABLED:
+            return func(*args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            function_errors.inc(label)
+            raise
+        finally:
+            function_duration.observe(time.perf_counter() - started, label)
+
+    return wrapper
+
+def init_app(app):
+    """Flask 요청마다 라우트(endpoint)별 요청 수와 응답 시간 기록"""
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started = g.pop("metrics_started", None)
+
+        if Config.METRICS_ENABLED and started is not None:
+            # 등록되지 않은 경로(404)는 하나로 모아 라벨 수가 늘어나지 않도록 함
+            endpoint = request.endpoint or "unmatched"
+            http_request_duration.observe(time.perf_counter() - started, endpoint)
+            http_requests.inc(endpoint, request.method, str(response.status_code))
+
+        return response
+
+
+@registry.collector
+def _database_metrics():
+    """커넥션 풀 / 쿼리 실행 / 쿼리 결과 캐시 / 복제본 상태"""
+    metrics = []
+
+    pool = get_pool_stats()
+    if pool:
+        metrics += [
+            ("crm_db_pool_in_use", "gauge", "사용 중인 DB 연결 수", pool["in_use"]),
+            ("crm_db_pool_idle", "gauge", "유휴 DB 연결 수", pool["idle"]),
+            ("crm_db_pool_checkouts_total", "counter", "DB 연결 대여 횟수", pool["checkouts"]),
+            ("crm_db_pool_wait_seconds_total", "counter", "DB 연결 대기 시간 합계 (초)", pool["wait_time_total"]),
+            ("crm_db_pool_timeouts_total", "counter", "DB 연결 대기 시간 초과 횟수", pool["timeouts"])
+        ]
+
+    queries = get_query_stats(top=0)
+    metrics += [
+        ("crm_db_queries_total", "counter", "실행한 쿼리 수", queries["queries"]),
+        ("crm_db_query_seconds_total", "counter", "쿼리 실행 시간 합계 (초)", queries["total_time"]),
+        ("crm_db_slow_queries_total", "counter", "느린 쿼리 수", queries["slow"])
+    ]
+
+    cache = get_query_cache_stats()
+    metrics += [
+        ("crm_query_cache_hits_total", "counter", "쿼리 결과 캐시 적중 수", cache["hits"]),
+        ("crm_query_cache_misses_total", "counter", "쿼리 결과 캐시 미적중 수", cache["misses"]),
+        ("crm_query_cache_bytes", "gauge", "쿼리 결과 캐시 크기 추정 (바이트)", cache["bytes"])
+    ]
+
+    replicas = get_replica_stats()
+    if replicas:
+        healthy = sum(1 for replica in replicas["replicas"] if replica["healthy"])
+        metrics += [
+            ("crm_db_replicas_healthy", "gauge", "사용 가능한 읽기 복제본 수", healthy),
+            ("crm_db_replica_fallbacks_total", "counter", "복제본 대신 기본 DB 에서 조회한 횟수", replicas["fallbacks"])
+        ]
+
+    return metrics
@@ -0,0 +1,249 @@
+import argparse
+import os
+import re
+import sys
+from datetime import date, datetime
+
+from .backends import get_backend
+from .database import get_connection, capture_queries
+from . import customer, search, visit, payment, stats
+
+"""
+스키마 마이그레이션 모듈
+
+scripts/sql/migrations/ 의 NNNN_이름.sql 파일을 번호 순서대로 적용하고
+적용 이력을 schema_version 테이블에 기록합니다.
+
+사용법:
+    python -m app.migrate status    # 적용/미적용 마이그레이션 목록
+    python -m app.migrate upgrade   # 미적용 마이그레이션 적용
+    python -m app.migrate check     # app/ 조회 함수의 실행 계획(EXPLAIN) 점검
+"""
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "scripts", "sql", "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+class MigrationError(Exception):
+    """마이그레이션 적용 실패"""
+
+
+def list_migrations(directory=MIGRATIONS_DIR):
+    """마이그레이션 파일 목록 [(버전, 이름, 경로)] (버전 순)"""
+    migrations = []
+
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+
+    return sorted(migrations)
+
+def split_statements(sql):
+    """SQL 파일을 문장 단위로 분리 (-- 주석 줄 제외)"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+def _connect():
+    conn = get_connection()
+    if conn is None:
+        raise MigrationError("데이터베이스에 연결할 수 없습니다.")
+    return conn
+
+def _ensure_version_table(cursor):
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_version (
+      version INT PRIMARY KEY,
+      name VARCHAR(100) NOT NULL,
+      applied_at DATETIME NOT NULL
+    )
+    """)
+
+def get_applied_versions():
+    """적용된 마이그레이션 버전 집합"""
+    conn = _connect()
+    cursor = conn.cursor()
+
+    try:
+        _ensure_version_table(cursor)
+        cursor.execute("SELECT version FROM schema_version")
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+        conn.close()
+
+def upgrade(directory=MIGRATIONS_DIR):
+    """
+    미적용 마이그레이션을 순서대로 적용
+
+    MySQL의 DDL은 문장마다 자동 커밋되므로, 실패 시 해당 파일의 이전 문장은
+    이미 반영된 상태로 중단됩니다. 원인을 해결한 뒤 남은 문장을 수동 적용하고
+    schema_version 에 기록하거나 파일을 수정해 다시 실행하세요.
+
+    Returns:
+        list: 이번에 적용한 마이그레이션 버전 목록
+    """
+    applied = get_applied_versions()
+    pending = [migration for migration in list_migrations(directory) if migration[0] not in applied]
+    done = []
+
+    conn = _connect()
+    cursor = conn.cursor()
+
+    try:
+        for version, name, path in pending:
+            with open(path, encoding="utf-8") as f:
+                statements = split_statements(f.read())
+
+            print(f"[MIGRATE] {version:04d}_{name} 적용 중 ({len(statements)}개 문장)")
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except Exception as e:
+                    conn.rollback()
+                    raise MigrationError(f"{version:04d}_{name} 적용 실패: {e}\n{statement}")
+
+            cursor.execute("INSERT INTO schema_version (version, name, applied_at) VALUES (%s, %s, %s)",
+                           (version, name, datetime.now()))
+            conn.commit()
+            done.append(version)
+    finally:
+        cursor.close()
+        conn.close()
+
+    return done
+
+def status(directory=MIGRATIONS_DIR):
+    """마이그레이션 목록과 적용 여부 [(버전, 이름, 적용 여부)]"""
+    applied = get_applied_versions()
+    return [(version, name, version in applied) for version, name, _ in list_migrations(directory)]
+
+
+# 실행 계획 점검 대상 (함수, 인자)
+PLAN_CHECKS = [
+    (customer.get_all_customers, ()),
+    (customer.get_customers_page, ()),
+    (customer.get_customer_by_customer, (1,)),
+    (search.search_customers, ("홍길동",)),
+    (search.search_customers, ("홍",)),
+    (search.search_customers, ("5678",)),
+    (search.search_customers, ("1990-01-02",)),
+    (customer.get_customer_by_birth_month, (1,)),
+    (customer.get_upcoming_birthdays, (30, date(2024, 12, 20))),
+    (customer.iter_customers, ()),
+    (visit.get_visits, ()),
+    (visit.get_recent_visits, ()),
+    (visit.get_recent_visits, (None, "2024-01-01")),
+    (visit.get_visits_page, ()),
+    (visit.get_visits_page, (None, None, None, "2024-01-01", "2024-01-31")),
+    (visit.get_visits_by_customer, (1,)),
+    (visit.get_visit_by_visit_id, (1,)),
+    (visit.get_visits_by_date_range, ("2024-01-01", "2024-01-31")),
+    (visit.iter_visits, ("2024-01-01", "2024-01-31")),
+    (payment.get_all_payments, ()),
+    (payment.get_recent_payments, ()),
+    (payment.get_payments_page, ()),
+    (payment.get_payments_by_customer, (1,)),
+    (payment.get_payment_methods, ()),
+    (payment.iter_all_payments, ()),
+    (stats.get_total_visits_by_customer, (1,)),
+    (stats.get_total_payment_by_customer, (1,)),
+    (stats.get_customer_statistics, (1,)),
+    (stats.get_overall_statistics, ()),
+    (stats.get_monthly_statistics, (2024, 1)),
+    (stats.get_monthly_series, (date(2024, 1, 1), date(2024, 7, 1))),
+    (stats.get_range_statistics, (date(2024, 1, 1), date(2024, 1, 31))),
+    (stats.get_all_customer_statistics, ()),
+]
+
+# 전체 행을 읽는 것이 목적이라 풀 스캔이 정상인 함수
+EXPECTED_FULL_SCANS = {
+    "get_all_customers", "iter_customers", "get_visits", "get_all_payments", "iter_all_payments",
+    "get_payment_methods", "get_overall_statistics", "get_all_customer_statistics",
+}
+
+def _capture(func, args):
+    with capture_queries() as captured:
+        result = func(*args)
+        # 제너레이터 함수는 소비해야 쿼리가 실행됨
+        if hasattr(result, "__next__"):
+            list(result)
+
+    return captured
+
+def check_query_plans(checks=None):
+    """
+    조회 함수들이 보내는 SQL의 실행 계획을 확인하여 풀 스캔(type=ALL)을 찾음
+
+    Returns:
+        list: [{"function", "table", "type", "key", "rows", "expected"}] 풀 스캔 목록
+
+    Raises:
+        MigrationError: MySQL 이 아닌 백엔드 (EXPLAIN 형식이 다름)
+    """
+    if get_backend().name != "mysql":
+        raise MigrationError("실행 계획 점검(EXPLAIN)은 MySQL 백엔드에서만 지원합니다.")
+
+    full_scans = []
+    conn = _connect()
+    cursor = conn.cursor(dictionary=True)
+
+    try:
+        for func, args in checks or PLAN_CHECKS:
+            for query, params in _capture(func, args):
+                if not query.lstrip().upper().startswith("SELECT"):
+                    continue
+
+                cursor.execute("EXPLAIN " + query, params or ())
+                for row in cursor.fetchall():
+                    table = row.get("table") or ""
+                    # <derivedN> 등 임시 테이블은 원본 테이블 계획에서 확인
+                    if row.get("type") == "ALL" and not table.startswith("<"):
+                        full_scans.append({
+                            "function": func.__name__,
+                            "table": table,
+                            "type": row.get("type"),
+                            "key": row.get("key"),
+                            "rows": row.get("rows"),
+                            "expected": func.__name__ in EXPECTED_FULL_SCANS
+                        })
+    finally:
+        cursor.close()
+        conn.close()
+
+    return full_scans
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument("command", choices=["status", "upgrade", "check"])
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "status":
+            for version, name, applied in status():
+                print(f"{version:04d}_{name}: {'적용됨' if applied else '미적용'}")
+
+        elif args.command == "upgrade":
+            done = upgrade()
+            print(f"[MIGRATE] {len(done)}개 마이그레이션 적용 완료" if done else "[MIGRATE] 적용할 마이그레이션 없음")
+
+        elif args.command == "check":
+            full_scans = check_query_plans()
+            unexpected = [scan for scan in full_scans if not scan["expected"]]
+
+            for scan in full_scans:
+                mark = "허용" if scan["expected"] else "문제"
+                print(f"[{mark}] {scan['function']}: {scan['table']} 풀 스캔 (rows={scan['rows']})")
+
+            print(f"[CHECK] 예상치 못한 풀 스캔 {len(unexpected)}건")
+            return 1 if unexpected else 0
+
+    except MigrationError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
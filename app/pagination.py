@@ -0,0 +1,138 @@
+import base64
+import json
+from datetime import date, datetime
+
+from .config import Config
+from .database import execute_query
+
+"""
+키셋(커서) 페이지네이션 모듈
+
+정렬 키와 기본 키를 커서로 인코딩하여 OFFSET 없이
+"마지막으로 본 행 다음부터" 조회합니다.
+"""
+
+# 페이지 크기 보정 (기본값/최대값은 Config 기준)
+def clamp_limit(limit):
+    if not limit or limit < 1:
+        return Config.PAGE_SIZE_DEFAULT
+
+    return min(limit, Config.PAGE_SIZE_MAX)
+
+# 커서 인코딩 (정렬 키 값 목록 -> URL 안전 문자열)
+def encode_cursor(values):
+    def default(value):
+        if isinstance(value, (date, datetime)):
+            return value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+        return str(value)
+
+    raw = json.dumps(list(values), default=default, ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+# 커서 디코딩 (잘못된 커서는 None)
+def decode_cursor(cursor, size):
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        return None
+
+    if not isinstance(values, list) or len(values) != size:
+        return None
+
+    return values
+
+def _keyset_condition(columns, descending, forward):
+    """
+    (정렬 키, 기본 키) 두 컬럼 기준 키셋 조건 생성
+
+    인덱스 범위 스캔이 가능하도록 행 생성자 대신 OR 형태로 풀어서 작성합니다.
+    """
+    (sort_column, _), (key_column, _) = columns
+    # 다음 페이지는 정렬 방향 그대로, 이전 페이지는 반대 방향으로 비교
+    op = "<" if descending == forward else ">"
+
+    return f"({sort_column} {op} %s OR ({sort_column} = %s AND {key_column} {op} %s))"
+
+def page_query(select, columns, descending=False, where=None, params=(),
+               limit=None, after=None, before=None):
+    """
+    키셋 페이지 조회 쿼리 생성 (fetch_page 와 app/async_queries.py 공용)
+
+    Args:
+        select (str): WHERE / ORDER BY 를 제외한 SELECT ... FROM ... 쿼리
+        columns (list): [(정렬 컬럼 SQL, 결과 키), (기본 키 컬럼 SQL, 결과 키)]
+        descending (bool): 내림차순 정렬 여부
+        where (list, optional): 추가 WHERE 조건 목록
+        params (tuple, optional): 추가 조건 파라미터
+        limit (int, optional): 페이지 크기 (Config.PAGE_SIZE_MAX 이하로 보정)
+        after (str, optional): 이 커서 다음 페이지 조회
+        before (str, optional): 이 커서 이전 페이지 조회
+
+    Returns:
+        tuple: (쿼리, 파라미터, 조회 결과 행 목록을 페이지로 바꾸는 함수)
+    """
+    limit = clamp_limit(limit)
+    conditions = list(where or [])
+    values = list(params)
+
+    after_key = decode_cursor(after, 2)
+    before_key = decode_cursor(before, 2) if after_key is None else None
+    forward = before_key is None
+    cursor_key = after_key if forward else before_key
+
+    if cursor_key is not None:
+        conditions.append(_keyset_condition(columns, descending, forward))
+        values.extend([cursor_key[0], cursor_key[0], cursor_key[1]])
+
+    # 이전 페이지는 역순으로 조회한 뒤 뒤집어서 원래 정렬로 반환
+    direction = "DESC" if descending == forward else "ASC"
+    order_by = ", ".join(f"{column} {direction}" for column, _ in columns)
+
+    query = select
+    if conditions:
+        query += "\n    WHERE " + " AND ".join(conditions)
+    query += f"\n    ORDER BY {order_by}\n    LIMIT %s"
+    values.append(limit + 1)
+
+    def to_page(rows):
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if not forward:
+            rows.reverse()
+
+        def key_of(row):
+            return encode_cursor(row[name] for _, name in columns)
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if (forward and has_more) or not forward:
+                next_cursor = key_of(rows[-1])
+            if (forward and cursor_key is not None) or (not forward and has_more):
+                prev_cursor = key_of(rows[0])
+
+        return {
+            "items": rows,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "limit": limit
+        }
+
+    return query, tuple(values), to_page
+
+def fetch_page(select, columns, descending=False, where=None, params=(),
+               limit=None, after=None, before=None):
+    """
+    키셋 페이지 조회 (인자는 page_query 와 동일)
+
+    Returns:
+        dict: {"items": 행 목록, "next_cursor": 다음 페이지 커서 또는 None,
+               "prev_cursor": 이전 페이지 커서 또는 None, "limit": 페이지 크기}
+    """
+    query, params, to_page = page_query(select, columns, descending, where, params, limit, after, before)
+
+    return to_page(execute_query(query, params, fetch_all=True) or [])
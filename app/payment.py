@@ -1,21 +1,35 @@
-from .database import execute_query
+from .cache import reference_cache
+from .database import execute_query, iter_query, bulk_insert, transaction
+from .rollup import days_of_visits, days_of_payments, refresh_daily_stats
+from .summary import customers_of_visits, customers_of_payments, refresh_customer_summary
+from .config import Config
+from .pagination import fetch_page, clamp_limit
+from .validators import require, parse_datetime, parse_int
+from .metrics import timed
 
 # 결제 등록
+@timed
 def create_payment(visit_id, payment_data):
     query = """
     INSERT INTO payment (visit_id, amount, payment_method_code, payment_datetime)
     VALUES (%s, %s, %s, %s)
     """
 
-    values = (
-        visit_id,
-        payment_data["amount"],
-        payment_data["payment_method_code"],
-        payment_data["payment_datetime"]
-    )
-
     try:
-        execute_query(query, values)
+        # 결제 일시 문자열은 저장 형식이 백엔드와 관계없이 같도록 datetime 으로 변환
+        values = (
+            visit_id,
+            payment_data["amount"],
+            payment_data["payment_method_code"],
+            parse_datetime(payment_data["payment_datetime"], "payment_datetime")
+        )
+
+        # 결제 등록과 일별 집계(방문일 기준)/고객 요약 갱신을 한 트랜잭션으로 처리
+        with transaction():
+            execute_query(query, values)
+            refresh_daily_stats(days_of_visits([visit_id]))
+            refresh_customer_summary(customers_of_visits([visit_id]))
+
         print(f"결제 기록 등록 성공: 방문 ID {visit_id}, 금액 {payment_data['amount']}")
         return True
     
@@ -23,35 +37,130 @@ def create_payment(visit_id, payment_data):
         print(f"결제 기록 등록 실패: {e}")
         return False
     
-# 전체 결제 기록 조회
-def get_all_payments():
-    query = """
-    SELECT p.*, v.customer_id, c.name as customer_name, pm.method_name
-    FROM payment p
-    JOIN visit v ON p.visit_id = v.visit_id
-    JOIN customer c ON v.customer_id = c.customer_id
-    JOIN payment_method pm ON p.payment_method_code = pm.method_code
-    ORDER BY p.payment_datetime DESC
+# 결제 일괄 등록용 파라미터 변환 (잘못된 값은 ValueError)
+def _payment_values(payment_data):
+    return (
+        parse_int(require(payment_data, "visit_id"), "visit_id", 1),
+        parse_int(require(payment_data, "amount"), "amount", 0),
+        require(payment_data, "payment_method_code"),
+        parse_datetime(require(payment_data, "payment_datetime"), "payment_datetime")
+    )
+
+# 일괄 등록 청크의 일별 집계 / 고객 요약 갱신 (청크와 같은 트랜잭션, 실패 시 청크 롤백)
+def _refresh_rollups(payment_ids):
+    refresh_daily_stats(days_of_payments(payment_ids))
+    refresh_customer_summary(customers_of_payments(payment_ids))
+
+# 결제 일괄 등록
+@timed
+def create_payments_bulk(payments, chunk_size=None):
     """
+    여러 결제 기록을 청크 단위 다중 행 INSERT로 등록
 
-    result = execute_query(query, fetch_all=True)
-    return result if result is not None else []
+    Args:
+        payments (iterable): create_payment 의 payment_data 에 visit_id 를 포함한 데이터
+        chunk_size (int, optional): 청크 크기 (기본값: Config.DB_BULK_CHUNK_SIZE)
 
-# 고객별 결제 기록 조회
-def get_payments_by_customer(customer_id):
+    Returns:
+        dict: {"ids": 입력 순서대로 생성된 결제 ID (실패 시 None),
+               "errors": [{"index": 입력 순번, "error": 오류 메시지}]}
+    """
     query = """
-    SELECT p.*, v.visit_date, pm.method_name
+    INSERT INTO payment (visit_id, amount, payment_method_code, payment_datetime)
+    VALUES (%s, %s, %s, %s)
+    """
+
+    result = bulk_insert(query, payments, _payment_values, chunk_size, on_chunk=_refresh_rollups)
+    print(f"결제 일괄 등록: 성공 {len(result['ids']) - len(result['errors'])}건, 실패 {len(result['errors'])}건")
+
+    return result
+
+# 결제 목록 쿼리 (고객 ID/이름 포함, app/async_queries.py 와 공용)
+PAYMENTS_SELECT = """
+    SELECT p.*, v.customer_id, c.name as customer_name
     FROM payment p
     JOIN visit v ON p.visit_id = v.visit_id
-    JOIN payment_method pm ON p.payment_method_code = pm.method_code
-    WHERE v.customer_id = %s
-    ORDER BY p.payment_datetime DESC
+    JOIN customer c ON v.customer_id = c.customer_id"""
+PAYMENTS_PAGE_COLUMNS = [("p.payment_datetime", "payment_datetime"), ("p.payment_id", "payment_id")]
+ALL_PAYMENTS_QUERY = PAYMENTS_SELECT + "\n    ORDER BY p.payment_datetime DESC"
+PAYMENTS_EXPORT_QUERY = PAYMENTS_SELECT + "\n    ORDER BY p.payment_datetime DESC, p.payment_id DESC"
+
+# 전체 결제 기록 조회
+@timed
+def get_all_payments():
+    result = execute_query(ALL_PAYMENTS_QUERY, fetch_all=True)
+    return _with_method_names(result if result is not None else [])
+
+# 최근 결제 기록 조회 (결제 일시 인덱스 역순 스캔, 결제 테이블 크기와 무관)
+@timed
+def get_recent_payments(limit=None, before=None):
     """
+    Args:
+        limit (int, optional): 조회 건수 (기본값: Config.RECENT_LIMIT)
+        before (datetime, optional): 이 시각 이전 결제만 조회 (더 보기용, 생략 시 최신부터)
 
-    result = execute_query(query, (customer_id,), fetch_all=True)
-    return result if result is not None else []
+    Returns:
+        list: 최신순 결제 기록 (customer_id, customer_name, method_name 포함)
+    """
+    query, params = _recent_payments_query(limit, before)
+
+    result = execute_query(query, params, fetch_all=True)
+    return _with_method_names(result if result is not None else [])
+
+# 최근 결제 기록 쿼리와 파라미터 (app/async_queries.py 와 공용)
+def _recent_payments_query(limit, before):
+    query = PAYMENTS_SELECT + "\n"
+    params = ()
+
+    if before is not None:
+        query += "WHERE p.payment_datetime < %s\n"
+        params = (before,)
+
+    query += "ORDER BY p.payment_datetime DESC, p.payment_id DESC LIMIT %s"
+
+    return query, params + (clamp_limit(limit or Config.RECENT_LIMIT),)
+
+# 결제 기록 페이지 조회 (최신순, 키셋 페이지네이션)
+@timed
+def get_payments_page(limit=None, after=None, before=None):
+    """
+    Args:
+        limit (int, optional): 페이지 크기
+        after (str, optional): 다음 페이지 커서
+        before (str, optional): 이전 페이지 커서
+
+    Returns:
+        dict: {"items", "next_cursor", "prev_cursor", "limit"}
+    """
+    page = fetch_page(PAYMENTS_SELECT, PAYMENTS_PAGE_COLUMNS, descending=True, limit=limit, after=after, before=before)
+    _with_method_names(page["items"])
+
+    return page
+
+# 전체 결제 기록 스트리밍 조회 (내보내기용)
+@timed
+def iter_all_payments():
+    names = get_payment_method_names()
+    for row in iter_query(PAYMENTS_EXPORT_QUERY):
+        yield _with_method_names([row], names)[0]
+
+# 고객별 결제 기록 쿼리 (app/async_queries.py 와 공용)
+PAYMENTS_BY_CUSTOMER_QUERY = """
+SELECT p.*, v.visit_date
+FROM payment p
+JOIN visit v ON p.visit_id = v.visit_id
+WHERE v.customer_id = %s
+ORDER BY p.payment_datetime DESC
+"""
+
+# 고객별 결제 기록 조회
+@timed
+def get_payments_by_customer(customer_id):
+    result = execute_query(PAYMENTS_BY_CUSTOMER_QUERY, (customer_id,), fetch_all=True)
+    return _with_method_names(result if result is not None else [])
 
 # 결제 수정
+@timed
 def update_payment(payment_data):
     query = """
     UPDATE payment
@@ -59,15 +168,19 @@ def update_payment(payment_data):
     WHERE payment_id = %s
     """
 
-    values = (
-        payment_data["amount"],
-        payment_data["payment_method_code"],
-        payment_data["payment_datetime"],
-        payment_data["payment_id"]
-    )
-
     try:
-        execute_query(query, values)
+        values = (
+            payment_data["amount"],
+            payment_data["payment_method_code"],
+            parse_datetime(payment_data["payment_datetime"], "payment_datetime"),
+            payment_data["payment_id"]
+        )
+
+        with transaction():
+            execute_query(query, values)
+            refresh_daily_stats(days_of_payments([payment_data["payment_id"]]))
+            refresh_customer_summary(customers_of_payments([payment_data["payment_id"]]))
+
         print(f"결제 기록 수정 성공: 결제 ID {payment_data['payment_id']}")
 
         return True
@@ -78,11 +191,18 @@ def update_payment(payment_data):
         return False
 
 # 결제 삭제
+@timed
 def delete_payment(payment_id):
     query = "DELETE FROM payment WHERE payment_id = %s"
 
     try:
-        execute_query(query, (payment_id,))
+        with transaction():
+            days = days_of_payments([payment_id])
+            customers = customers_of_payments([payment_id])
+            execute_query(query, (payment_id,))
+            refresh_daily_stats(days)
+            refresh_customer_summary(customers)
+
         print(f"결제 기록 삭제 성공: 결제 ID {payment_id}")
 
         return True
@@ -92,9 +212,43 @@ def delete_payment(payment_id):
         
         return False
 
-# 결제 수단 조회
+# 결제 수단 DB 조회 (기준 데이터 캐시 loader)
+PAYMENT_METHODS_QUERY = "SELECT * FROM payment_method ORDER BY method_code"
+
+def _load_payment_methods():
+    result = execute_query(PAYMENT_METHODS_QUERY, fetch_all=True)
+    return result if result is not None else []
+
+reference_cache.register("payment_methods", _load_payment_methods)
+
+# 결제 수단 조회 (기준 데이터 캐시)
+@timed
 def get_payment_methods():
-    query = "SELECT * FROM payment_method"
+    return [dict(method) for method in reference_cache.get("payment_methods")]
+
+# 결제 수단 코드 -> 이름
+@timed
+def get_payment_method_names():
+    return {method["method_code"]: method["method_name"] for method in reference_cache.get("payment_methods")}
+
+# 결제 기록에 결제 수단 이름 추가 (payment_method 조인 대신 캐시에서 매핑)
+def _with_method_names(payments, names=None):
+    names = get_payment_method_names() if names is None else names
+
+    if _has_unknown_method(payments, names):
+        # 캐시한 뒤 추가된 결제 수단이면 한 번 다시 읽음
+        reference_cache.invalidate("payment_methods")
+        names.update(get_payment_method_names())
+
+    return _apply_method_names(payments, names)
+
+# 이름을 모르는 결제 수단 코드가 있는지 여부 (app/async_queries.py 와 공용)
+def _has_unknown_method(payments, names):
+    return any(payment["payment_method_code"] not in names for payment in payments)
+
+# 결제 수단 이름 매핑 (다시 읽어도 없는 코드는 None 으로 기록하여 이후 행에서 반복 조회하지 않음)
+def _apply_method_names(payments, names):
+    for payment in payments:
+        payment["method_name"] = names.setdefault(payment["payment_method_code"], None)
 
-    result = execute_query(query, fetch_all=True)
-    return result if result is not None else []
\ No newline at end of file
+    return payments
\ No newline at end of file
@@ -0,0 +1,174 @@
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+"""
+쿼리 결과 캐시 모듈
+
+execute_query(..., cache=True) 로 조회한 결과를 (정규화한 SQL, 파라미터) 키로 보관합니다.
+각 결과에는 쿼리가 읽은 테이블을 태그로 기록해 두고, 데이터 계층을 거치는
+INSERT / UPDATE / DELETE 가 실행되면 해당 테이블 태그가 붙은 결과를 모두 버립니다.
+
+- 크기 제한: 결과 크기 추정치의 합이 max_bytes 를 넘으면 가장 오래 사용하지 않은 결과부터 제거 (LRU)
+- TTL: 다른 프로세스(워커)나 데이터 계층 밖(mysql 콘솔 등)의 변경은 감지할 수 없으므로
+  결과는 ttl 초가 지나면 만료
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+_TABLE_REFERENCE = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+`?(\w+)`?", re.IGNORECASE)
+_READ_STATEMENTS = ("SELECT", "WITH", "SHOW", "EXPLAIN", "DESCRIBE")
+
+# ON DELETE CASCADE 외래 키로 함께 변경되는 테이블 (scripts/sql/crm_ddl.sql)
+CASCADES = {
+    "customer": {"visit", "payment", "customer_summary"},
+    "visit": {"payment"},
+    "payment_method": {"payment"}
+}
+
+
+def normalize_sql(query):
+    """공백/줄바꿈 차이를 없앤 SQL (캐시 키용, 값은 파라미터로 전달된다는 전제)"""
+    return _WHITESPACE.sub(" ", query).strip()
+
+def statement_tables(query):
+    """쿼리가 참조하는 테이블 이름 집합 (소문자)"""
+    return {table.lower() for table in _TABLE_REFERENCE.findall(query)}
+
+def affected_tables(query):
+    """변경 문장이 영향을 주는 테이블 집합 (외래 키 연쇄 삭제 포함)"""
+    tables = statement_tables(query)
+    for table in list(tables):
+        tables |= CASCADES.get(table, set())
+    return tables
+
+def is_write(query):
+    """데이터를 변경하는 문장인지 여부"""
+    words = query.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() not in _READ_STATEMENTS
+
+def estimate_size(value):
+    """결과 메모리 크기 추정 (바이트, 행 딕셔너리와 값 기준)"""
+    if value is None:
+        return 0
+
+    rows = value if isinstance(value, list) else [value]
+    size = sys.getsizeof(rows)
+
+    for row in rows:
+        size += sys.getsizeof(row)
+        for item in row.values():
+            size += sys.getsizeof(item)
+
+    return size
+
+def copy_result(value):
+    """호출자가 결과를 수정해도 캐시에 영향이 없도록 행 단위 복사"""
+    if isinstance(value, list):
+        return [dict(row) for row in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class QueryCache:
+    """
+    테이블 태그 기반 무효화를 지원하는 LRU 결과 캐시 (스레드 안전)
+
+    Args:
+        max_bytes (int): 보관할 결과 크기 추정치의 합 상한
+        ttl (float): 결과 유지 시간 (초)
+    """
+
+    def __init__(self, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 키 -> (결과, 테이블 집합, 크기, 만료 시각)
+        self._by_table = {}            # 테이블 -> 키 집합
+        self._bytes = 0
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(query, params, fetch_one):
+        return (normalize_sql(query), tuple(params or ()), fetch_one)
+
+    def get(self, key):
+        """결과 반환 (없거나 만료되었으면 (False, None))"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[3] <= time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, copy_result(entry[0])
+
+    def put(self, key, value, tables):
+        """결과 보관 (한 건이 상한보다 크면 보관하지 않음)"""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+
+            self._entries[key] = (copy_result(value), tables, size, time.monotonic() + self.ttl)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._evictions += 1
+
+    def invalidate_tables(self, tables):
+        """테이블 태그가 붙은 결과 제거"""
+        with self._lock:
+            for table in tables:
+                for key in list(self._by_table.get(table, ())):
+                    self._discard(key)
+                    self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def _discard(self, key):
+        _, tables, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def stats(self):
+        """적중/미적중/LRU 제거/무효화 횟수와 현재 크기 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations
+            }
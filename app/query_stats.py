@@ -0,0 +1,253 @@
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+
+"""
+쿼리 실행 계측 모듈
+
+데이터 계층(app/database.py, app/async_database.py)을 거치는 모든 쿼리의 시간을 단계별로 잽니다.
+
+- 연결 대여(acquire), 실행(execute), 결과 읽기(fetch) 시간과 행 수
+- 값과 IN 목록을 지운 쿼리 지문(fingerprint) 별 누적 통계 (횟수, 합계/최대 시간, 행 수)
+- slow_seconds 를 넘은 쿼리는 느린 쿼리 로그에 기록 (print, 파일 지정 시 파일에도 추가)
+- 요청별 쿼리 수와 DB 시간, 같은 지문 반복 횟수 (N+1 확인용)
+
+어떤 요청/스레드에 기록할지는 app/database.py 가 결정합니다.
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query):
+    """값/자리표시자/IN 목록 길이 차이를 없앤 쿼리 지문 (같은 모양의 쿼리를 한 항목으로 집계)"""
+    normalized = _WHITESPACE.sub(" ", query).strip()
+    normalized = _STRING.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = normalized.replace("%s", "?")
+    normalized = _VALUE_LIST.sub("(?+)", normalized)
+
+    return normalized
+
+
+class QueryTiming:
+    """쿼리 하나의 단계별 실행 시간 (초)과 행 수"""
+
+    __slots__ = ("query", "acquire", "execute", "fetch", "rows", "replica")
+
+    def __init__(self, acquire=0.0, replica=None):
+        self.query = None
+        self.acquire = acquire
+        self.execute = 0.0
+        self.fetch = 0.0
+        self.rows = 0
+        self.replica = replica
+
+    @property
+    def total(self):
+        return self.acquire + self.execute + self.fetch
+
+
+class TimedCursor:
+    """
+    실행/결과 읽기 시간과 행 수를 QueryTiming 에 기록하는 커서 래퍼
+
+    그 밖의 속성(rowcount, lastrowid, close 등)은 원래 커서로 전달합니다.
+    """
+
+    def __init__(self, cursor, timing):
+        self._cursor = cursor
+        self._timing = timing
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _execute(self, method, query, params):
+        self._timing.query = query
+        started = time.perf_counter()
+        try:
+            return method(query, params)
+        finally:
+            self._timing.execute += time.perf_counter() - started
+            # 변경 문장은 반영된 행 수 (조회는 결과를 읽을 때 다시 기록)
+            rowcount = getattr(self._cursor, "rowcount", -1)
+            if isinstance(rowcount, int) and rowcount > 0:
+                self._timing.rows = rowcount
+
+    def execute(self, query, params=()):
+        return self._execute(self._cursor.execute, query, params)
+
+    def executemany(self, query, seq_params):
+        return self._execute(self._cursor.executemany, query, seq_params)
+
+    def _fetch(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._timing.fetch += time.perf_counter() - started
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        self._timing.rows = 1 if row is not None else 0
+        return row
+
+    def fetchall(self):
+        rows = self._fetch(self._cursor.fetchall)
+        self._timing.rows = len(rows)
+        return rows
+
+    def fetchmany(self, size):
+        rows = self._fetch(self._cursor.fetchmany, size)
+        # 스트리밍 조회는 배치마다 누적
+        self._timing.rows += len(rows)
+        return rows
+
+
+class AsyncTimedCursor(TimedCursor):
+    """TimedCursor 의 비동기 커서(aiomysql) 버전 - 코루틴 생성이 아니라 완료까지의 시간을 기록"""
+
+    async def _execute(self, method, query, params):
+        self._timing.query = query
+        started = time.perf_counter()
+        try:
+            return await method(query, params)
+        finally:
+            self._timing.execute += time.perf_counter() - started
+            rowcount = getattr(self._cursor, "rowcount", -1)
+            if isinstance(rowcount, int) and rowcount > 0:
+                self._timing.rows = rowcount
+
+    async def _fetch(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return await method(*args)
+        finally:
+            self._timing.fetch += time.perf_counter() - started
+
+    async def fetchone(self):
+        row = await self._fetch(self._cursor.fetchone)
+        self._timing.rows = 1 if row is not None else 0
+        return row
+
+    async def fetchall(self):
+        rows = await self._fetch(self._cursor.fetchall)
+        self._timing.rows = len(rows)
+        return rows
+
+    async def fetchmany(self, size):
+        rows = await self._fetch(self._cursor.fetchmany, size)
+        self._timing.rows += len(rows)
+        return rows
+
+
+class RequestQueries:
+    """요청 하나의 쿼리 수, DB 시간, 지문별 실행 횟수 (병렬 조회 작업 스레드와 공유하므로 스레드 안전)"""
+
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, timing):
+        with self._lock:
+            self.count += 1
+            self.db_time += timing.total
+            self.fingerprints[fingerprint(timing.query)] += 1
+
+    def repeated(self, threshold):
+        """threshold 회 이상 실행된 지문 목록 [(지문, 횟수)] (N+1 의심)"""
+        with self._lock:
+            return [(key, count) for key, count in self.fingerprints.most_common() if count >= threshold]
+
+
+class QueryStats:
+    """
+    쿼리 지문별 누적 실행 통계와 느린 쿼리 로그 (스레드 안전)
+
+    Args:
+        slow_seconds (float): 이 시간(초) 이상 걸린 쿼리를 느린 쿼리로 기록 (0 이면 기록 안 함)
+        slow_log_path (str, optional): 느린 쿼리를 추가로 기록할 파일 경로
+    """
+
+    def __init__(self, slow_seconds, slow_log_path=None):
+        self.slow_seconds = slow_seconds
+        self.slow_log_path = slow_log_path
+
+        self._lock = threading.Lock()
+        self._entries = {}  # 지문 -> 누적 통계
+        self._slow = 0
+
+    def record(self, timing):
+        """실행이 끝난 쿼리 하나를 누적하고 느리면 로그에 기록"""
+        if timing.query is None:
+            return
+
+        key = fingerprint(timing.query)
+        total = timing.total
+        slow = bool(self.slow_seconds) and total >= self.slow_seconds
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {
+                    "count": 0, "total_time": 0.0, "max_time": 0.0, "acquire_time": 0.0,
+                    "execute_time": 0.0, "fetch_time": 0.0, "rows": 0, "slow": 0
+                }
+
+            entry["count"] += 1
+            entry["total_time"] += total
+            entry["max_time"] = max(entry["max_time"], total)
+            entry["acquire_time"] += timing.acquire
+            entry["execute_time"] += timing.execute
+            entry["fetch_time"] += timing.fetch
+            entry["rows"] += timing.rows
+            if slow:
+                entry["slow"] += 1
+                self._slow += 1
+
+        if slow:
+            self._log_slow(key, timing)
+
+    def _log_slow(self, key, timing):
+        line = (f"[SLOW] {timing.total * 1000:.1f}ms (대기 {timing.acquire * 1000:.1f}ms, "
+                f"실행 {timing.execute * 1000:.1f}ms, 읽기 {timing.fetch * 1000:.1f}ms, "
+                f"{timing.rows}행{', 복제본 ' + timing.replica if timing.replica else ''}) {key}")
+        print(line)
+
+        if self.slow_log_path:
+            try:
+                with open(self.slow_log_path, "a", encoding="utf-8") as f:
+                    f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {line}\n")
+            except OSError as e:
+                print(f"[ERROR] 느린 쿼리 로그 기록 실패: {e}")
+
+    def stats(self, top=20):
+        """총 실행 시간이 큰 순서로 지문별 통계 top 개와 전체 합계 반환"""
+        with self._lock:
+            entries = [dict(entry, fingerprint=key) for key, entry in self._entries.items()]
+            slow = self._slow
+
+        entries.sort(key=lambda entry: entry["total_time"], reverse=True)
+        for entry in entries:
+            entry["avg_time"] = entry["total_time"] / entry["count"]
+            for name in ("total_time", "max_time", "avg_time", "acquire_time", "execute_time", "fetch_time"):
+                entry[name] = round(entry[name], 6)
+
+        return {
+            "queries": sum(entry["count"] for entry in entries),
+            "total_time": round(sum(entry["total_time"] for entry in entries), 6),
+            "slow": slow,
+            "statements": entries[:top]
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._slow = 0
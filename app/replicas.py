@@ -0,0 +1,129 @@
+import itertools
+import threading
+import time
+
+"""
+읽기 복제본 선택 모듈
+
+Config.DB_REPLICAS 에 지정한 복제본마다 커넥션 풀을 두고, 조회를 건강한 복제본에 돌아가며 보냅니다.
+주기적으로(또는 연결 실패 직후 다음 점검에서) 각 복제본의 복제 지연을 확인하여
+지연이 max_lag 초를 넘거나 복제가 멈춘 복제본은 다음 점검에서 회복될 때까지 제외합니다.
+사용할 수 있는 복제본이 없으면 기본(primary) DB 에서 조회합니다.
+
+어떤 조회를 복제본으로 보낼지는 app/database.py 가 결정합니다.
+"""
+
+
+class Replica:
+    """복제본 하나의 풀과 상태"""
+
+    def __init__(self, name, pool):
+        self.name = name
+        self.pool = pool
+        self.healthy = True
+        self.lag = None          # 마지막 점검 시 복제 지연 (초)
+        self.checked_at = None   # 마지막 점검 시각 (monotonic)
+        self.error = None        # 제외 사유
+        self.reads = 0
+        self.failures = 0
+
+
+class ReplicaRouter:
+    """
+    건강한 복제본을 돌아가며 선택 (스레드 안전)
+
+    Args:
+        replicas (list): (이름, 커넥션 풀) 목록
+        probe (callable): 풀을 받아 복제 지연(초)을 반환, 복제가 멈췄으면 None (연결 실패는 예외)
+        max_lag (float): 허용 복제 지연 (초)
+        check_interval (float): 상태 점검 주기 (초)
+    """
+
+    def __init__(self, replicas, probe, max_lag, check_interval):
+        self.replicas = [Replica(name, pool) for name, pool in replicas]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+
+        self._probe = probe
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._next = itertools.count()
+        self._checked_at = None
+        self._fallbacks = 0
+
+    def choose(self):
+        """조회를 보낼 복제본 반환 (사용 가능한 복제본이 없으면 None)"""
+        if self._checked_at is None or time.monotonic() - self._checked_at >= self.check_interval:
+            self.check(blocking=self._checked_at is None)
+
+        with self._lock:
+            available = [replica for replica in self.replicas if replica.healthy]
+            if not available:
+                self._fallbacks += 1
+                return None
+
+            replica = available[next(self._next) % len(available)]
+            replica.reads += 1
+            return replica
+
+    def check(self, blocking=True):
+        """
+        모든 복제본의 연결/복제 지연 점검
+
+        blocking=False 이면 다른 스레드가 점검 중일 때 기다리지 않고 이전 상태를 사용합니다.
+        """
+        if not self._check_lock.acquire(blocking=blocking):
+            return
+
+        try:
+            for replica in self.replicas:
+                try:
+                    lag = self._probe(replica.pool)
+                    error = None if lag is not None else "복제 중지"
+                    if lag is not None and lag > self.max_lag:
+                        error = f"복제 지연 {lag}초 (허용 {self.max_lag}초)"
+                except Exception as e:
+                    lag, error = None, f"연결 실패: {e}"
+
+                with self._lock:
+                    if replica.healthy and error:
+                        print(f"[ERROR] 복제본 제외 ({replica.name}): {error}")
+                    elif not replica.healthy and not error:
+                        print(f"[INFO] 복제본 복귀 ({replica.name})")
+
+                    replica.healthy = error is None
+                    replica.lag = lag
+                    replica.error = error
+                    replica.checked_at = time.monotonic()
+
+            self._checked_at = time.monotonic()
+        finally:
+            self._check_lock.release()
+
+    def mark_failed(self, replica, error):
+        """조회 중 연결 오류가 난 복제본을 다음 점검까지 제외"""
+        with self._lock:
+            replica.failures += 1
+            if replica.healthy:
+                print(f"[ERROR] 복제본 제외 ({replica.name}): {error}")
+            replica.healthy = False
+            replica.error = str(error)
+
+    def dispose(self):
+        for replica in self.replicas:
+            replica.pool.dispose()
+
+    def stats(self):
+        """복제본별 상태, 지연, 조회/실패 횟수와 기본 DB 대체 횟수 반환"""
+        with self._lock:
+            return {
+                "replicas": [{
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag": replica.lag,
+                    "error": replica.error,
+                    "reads": replica.reads,
+                    "failures": replica.failures
+                } for replica in self.replicas],
+                "fallbacks": self._fallbacks
+            }
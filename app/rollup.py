@@ -0,0 +1,152 @@
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+
+from .database import execute_query, transaction
+
+"""
+일별 집계(daily_stats) 테이블 관리 모듈
+
+방문/결제 원본 대신 일별 집계를 읽어 통계를 계산할 수 있도록
+방문/결제가 변경될 때마다 해당 날짜의 집계 행을 원본에서 다시 계산합니다.
+(scripts/sql/migrations/0004_daily_stats.sql 필요)
+
+daily_stats 행:
+    payment_method_code = ''    : 날짜별 합계 (방문 수, 방문 고객 수, 결제 합계/건수)
+    payment_method_code = 코드  : 결제 수단별 (해당 수단 결제가 있는 방문 수/고객 수, 결제 합계/건수)
+
+결제는 원본 통계와 같이 방문일 기준으로 집계합니다.
+
+사용법 (집계가 어긋났을 때 복구):
+    python -m app.rollup rebuild                                  # 전체 재계산
+    python -m app.rollup rebuild --start 2024-01-01 --end 2024-02-01
+"""
+
+# 한 번에 재계산할 날짜 수 (많은 날짜는 이 크기로 나누어 재계산)
+REFRESH_CHUNK_DAYS = 100
+
+
+def _day(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _days(query, params):
+    rows = execute_query(query, params, fetch_all=True) or []
+    return {_day(row["day"]) for row in rows if row["day"] is not None}
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+def days_of_visits(visit_ids):
+    """방문 ID 목록의 방문일 집합"""
+    visit_ids = list(visit_ids)
+    if not visit_ids:
+        return set()
+
+    query = f"SELECT DISTINCT DATE(visit_date) AS day FROM visit WHERE visit_id IN ({_placeholders(visit_ids)})"
+    return _days(query, tuple(visit_ids))
+
+def days_of_payments(payment_ids):
+    """결제 ID 목록이 속한 방문의 방문일 집합"""
+    payment_ids = list(payment_ids)
+    if not payment_ids:
+        return set()
+
+    query = f"""
+    SELECT DISTINCT DATE(v.visit_date) AS day
+    FROM payment p
+    JOIN visit v ON p.visit_id = v.visit_id
+    WHERE p.payment_id IN ({_placeholders(payment_ids)})
+    """
+    return _days(query, tuple(payment_ids))
+
+def days_of_customer(customer_id):
+    """고객의 방문일 집합 (고객 삭제 시 연쇄 삭제되는 방문)"""
+    query = "SELECT DISTINCT DATE(visit_date) AS day FROM visit WHERE customer_id = %s"
+    return _days(query, (customer_id,))
+
+def rebuild_daily_stats(start=None, end=None):
+    """
+    기간 [start, end) 의 일별 집계를 원본에서 다시 계산 (생략 시 전체)
+
+    작업 단위 안에서 호출되면 원본 변경과 같은 트랜잭션으로 반영됩니다.
+    """
+    conditions, params = [], []
+    if start is not None:
+        conditions.append("v.visit_date >= %s")
+        params.append(_day(start))
+    if end is not None:
+        conditions.append("v.visit_date < %s")
+        params.append(_day(end))
+
+    visit_where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    stats_where = visit_where.replace("v.visit_date", "stat_date")
+    _recompute(stats_where, tuple(params), visit_where, tuple(params))
+
+def _recompute(stats_where, stats_params, visit_where, visit_params):
+    """조건에 해당하는 집계 행을 삭제하고 원본에서 다시 집계"""
+    with transaction():
+        execute_query(f"DELETE FROM daily_stats {stats_where}", stats_params)
+
+        execute_query(f"""
+        INSERT INTO daily_stats (stat_date, payment_method_code, visit_count, unique_customers, revenue_sum, payment_count)
+        SELECT DATE(v.visit_date), '',
+               COUNT(DISTINCT v.visit_id), COUNT(DISTINCT v.customer_id),
+               COALESCE(SUM(p.amount), 0), COUNT(p.payment_id)
+        FROM visit v
+        LEFT JOIN payment p ON v.visit_id = p.visit_id
+        {visit_where}
+        GROUP BY DATE(v.visit_date)
+        """, visit_params)
+
+        execute_query(f"""
+        INSERT INTO daily_stats (stat_date, payment_method_code, visit_count, unique_customers, revenue_sum, payment_count)
+        SELECT DATE(v.visit_date), p.payment_method_code,
+               COUNT(DISTINCT v.visit_id), COUNT(DISTINCT v.customer_id),
+               SUM(p.amount), COUNT(*)
+        FROM visit v
+        JOIN payment p ON v.visit_id = p.visit_id
+        {visit_where}
+        GROUP BY DATE(v.visit_date), p.payment_method_code
+        """, visit_params)
+
+def refresh_daily_stats(days):
+    """
+    변경된 날짜들의 일별 집계만 재계산
+
+    여러 해에 걸친 일괄 등록도 실제로 바뀐 날짜만 읽고 쓰도록, 날짜 사이 기간 전체가 아니라
+    날짜별 [날짜, 다음 날) 범위의 OR 조건(방문일 인덱스 범위 조회)으로 REFRESH_CHUNK_DAYS 개씩 처리합니다.
+    """
+    days = sorted({_day(day) for day in days if day is not None})
+
+    for offset in range(0, len(days), REFRESH_CHUNK_DAYS):
+        chunk = days[offset:offset + REFRESH_CHUNK_DAYS]
+
+        ranges = " OR ".join(["(v.visit_date >= %s AND v.visit_date < %s)"] * len(chunk))
+        visit_params = tuple(value for day in chunk for value in (day, day + timedelta(days=1)))
+
+        _recompute(f"WHERE stat_date IN ({_placeholders(chunk)})", tuple(chunk),
+                   f"WHERE {ranges}", visit_params)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="일별 집계(daily_stats) 재계산")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--start", type=date.fromisoformat, help="시작일 (포함, YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료일 (제외, YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    with transaction() as uow:
+        rebuild_daily_stats(args.start, args.end)
+
+    if uow.failed:
+        print("[ERROR] 일별 집계 재계산 실패 (롤백)")
+        return 1
+
+    print(f"[ROLLUP] 일별 집계 재계산 완료: {args.start or '처음'} ~ {args.end or '끝'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
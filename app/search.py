@@ -0,0 +1,150 @@
+import re
+
+from .config import Config
+from .database import execute_query
+from .validators import normalize_birth_date
+from .metrics import timed
+
+"""
+고객 검색 모듈
+
+검색어 종류에 따라 인덱스를 사용하는 조회만 실행하고 결과를 순위대로 합칩니다.
+(scripts/sql/migrations/0003_customer_search.sql 필요)
+
+- 이름: ngram FULLTEXT 인덱스로 부분 일치 (한 글자는 이름 인덱스 앞부분 일치)
+- 전화번호: 숫자만 남긴 phone_digits 앞부분 일치, 뒤집은 phone_digits_rev 로 뒷자리 일치
+- 생년월일: birth_date 일치
+
+순위: 완전 일치 > 앞부분/뒷자리 일치 > 부분 일치 (같은 순위는 FULLTEXT 점수, 이름순)
+"""
+
+NGRAM_TOKEN_SIZE = 2   # MySQL ngram_token_size 기본값
+MIN_PHONE_DIGITS = 3   # 전화번호 검색 최소 숫자 수 (짧으면 결과가 너무 많음)
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _name_matcher(term, limit):
+    prefix = _escape_like(term) + "%"
+
+    if len(term) < NGRAM_TOKEN_SIZE:
+        # ngram 토큰보다 짧은 검색어는 FULLTEXT 로 찾을 수 없으므로 이름 인덱스 앞부분 일치
+        query = """
+        SELECT *, IF(name = %s, 0, 1) AS search_rank, 0 AS search_score
+        FROM customer
+        WHERE name LIKE %s
+        ORDER BY search_rank, name
+        LIMIT %s
+        """
+        return query, (term, prefix, limit)
+
+    # 큰따옴표 구문 검색: 검색어의 ngram 이 연속으로 나타나는 이름 (부분 문자열 일치)
+    phrase = '"' + term.replace('"', " ") + '"'
+    query = """
+    SELECT *, CASE WHEN name = %s THEN 0 WHEN name LIKE %s THEN 1 ELSE 2 END AS search_rank,
+           MATCH(name) AGAINST (%s IN BOOLEAN MODE) AS search_score
+    FROM customer
+    WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE)
+    ORDER BY search_rank, search_score DESC, name
+    LIMIT %s
+    """
+    return query, (term, prefix, phrase, phrase, limit)
+
+def _phone_matchers(digits, limit):
+    prefix_query = """
+    SELECT *, IF(phone_digits = %s, 0, 1) AS search_rank, 0 AS search_score
+    FROM customer
+    WHERE phone_digits LIKE %s
+    ORDER BY search_rank, name
+    LIMIT %s
+    """
+
+    # 뒷자리 검색 (예: 5678): 뒤집은 번호의 앞부분 일치로 인덱스 사용
+    suffix_query = """
+    SELECT *, 1 AS search_rank, 0 AS search_score
+    FROM customer
+    WHERE phone_digits_rev LIKE %s
+    ORDER BY name
+    LIMIT %s
+    """
+
+    return [
+        (prefix_query, (digits, digits + "%", limit)),
+        (suffix_query, (digits[::-1] + "%", limit))
+    ]
+
+def _birth_date_matcher(birth_date, limit):
+    query = """
+    SELECT *, 0 AS search_rank, 0 AS search_score
+    FROM customer
+    WHERE birth_date = %s
+    ORDER BY name
+    LIMIT %s
+    """
+    return query, (birth_date, limit)
+
+def build_matchers(search_term, limit):
+    """검색어에 해당하는 (쿼리, 파라미터) 목록"""
+    term = (search_term or "").strip()
+    if not term:
+        return []
+
+    matchers = []
+    digits = re.sub(r"\D", "", term)
+
+    try:
+        birth_date = normalize_birth_date(term)
+    except ValueError:
+        birth_date = None
+
+    if birth_date:
+        matchers.append(_birth_date_matcher(birth_date, limit))
+
+    # 숫자/구분자로만 된 검색어는 전화번호, 그 외는 이름
+    if re.fullmatch(r"[\d\s\-+.()]+", term):
+        if len(digits) >= MIN_PHONE_DIGITS:
+            matchers.extend(_phone_matchers(digits, limit))
+    else:
+        matchers.append(_name_matcher(term, limit))
+
+    return matchers
+
+@timed
+def search_customers(search_term, limit=None):
+    """
+    고객 검색 (이름 / 전화번호 / 생년월일)
+
+    Args:
+        search_term (str): 검색어
+        limit (int, optional): 최대 결과 수 (기본값: Config.SEARCH_LIMIT)
+
+    Returns:
+        list: 순위순 고객 목록 (최대 limit 건)
+    """
+    limit = search_limit(limit)
+    results = [execute_query(query, params, fetch_all=True) for query, params in build_matchers(search_term, limit)]
+
+    return merge_results(results, limit)
+
+def search_limit(limit=None):
+    """최대 결과 수 보정 (기본값: Config.SEARCH_LIMIT)"""
+    return min(limit or Config.SEARCH_LIMIT, Config.PAGE_SIZE_MAX)
+
+def _rank(row):
+    return (row["search_rank"], -row["search_score"], row["name"])
+
+def merge_results(results, limit):
+    """
+    조회별 결과를 순위순으로 합침 (search_customers 와 app/async_queries.py 공용)
+
+    여러 조회에 나온 고객은 가장 높은 순위로 한 번만 포함합니다.
+    """
+    found = {}
+    for rows in results:
+        for row in rows or []:
+            current = found.get(row["customer_id"])
+            if current is None or _rank(row) < _rank(current):
+                found[row["customer_id"]] = row
+
+    return sorted(found.values(), key=_rank)[:limit]
@@ -0,0 +1,393 @@
+import atexit
+import functools
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+
+"""
+내장 SQLite 백엔드
+
+MySQL 서버 없이 데모 모드, 로컬 테스트, 벤치마크를 실행하기 위한 백엔드입니다.
+mysql.connector 의 연결/커서와 같은 방식(dictionary 커서, %s 파라미터, start_transaction,
+executemany 후 첫 번째 생성 ID)으로 쓸 수 있어 app/ 의 데이터 계층 코드를 그대로 사용합니다.
+
+- 경로: 파일 경로 또는 ':memory:' (프로세스 전용 임시 파일, 종료 시 삭제)
+  여러 연결이 같은 DB 를 공유해야 하므로 SQLite 의 연결별 메모리 DB 대신 임시 파일(WAL)을 사용하며,
+  가능하면 메모리 파일 시스템(/dev/shm)에 만듭니다.
+- 스키마: 빈 DB 에 처음 연결하면 scripts/sql 의 DDL, 결제 수단 코드, 마이그레이션을 적용
+- SQL 변환: %s -> ?, AUTO_INCREMENT, 여러 ADD COLUMN 을 가진 ALTER TABLE, 저장 생성 컬럼(STORED -> VIRTUAL),
+  FULLTEXT 인덱스(생략), MATCH ... AGAINST, LIKE 이스케이프, 정수 나눗셈, 잠금 읽기(FOR UPDATE 등)
+- MySQL 함수: YEAR, MONTH, DAYOFMONTH, REVERSE, IF 는 사용자 정의 함수로 등록 (DATE 는 SQLite 내장 함수와 동일)
+- 값 변환: date/datetime/Decimal 파라미터는 MySQL 과 같은 문자열/숫자로 저장하고,
+  선언 타입이 DATE / DATETIME 인 컬럼 값은 date/datetime 으로 반환 (PARSE_DECLTYPES)
+  계산 결과(MIN(visit_date), DATE(...) 등)는 선언 타입이 없으므로 문자열 그대로 반환
+
+읽기 복제본, 비동기 데이터 계층(aiomysql), 실행 계획 점검(EXPLAIN)은 MySQL 전용입니다.
+"""
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts", "sql")
+SCHEMA_FILES = ("crm_ddl.sql", "init_payment_method.sql")
+
+BUSY_TIMEOUT = 30  # 다른 연결이 쓰기 잠금을 가진 경우 대기할 최대 시간 (초)
+MEMORY = ":memory:"
+
+
+# ---- SQL 변환 ----
+
+_AUTO_INCREMENT = re.compile(r"\bINT\s+PRIMARY\s+KEY\s+AUTO_INCREMENT\b", re.I)
+_ALTER_TABLE = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+", re.I)
+_ADD_COLUMN = re.compile(r",\s*(?=ADD\s+COLUMN\b)", re.I)
+_STORED = re.compile(r"\bSTORED\b", re.I)
+_FULLTEXT_INDEX = re.compile(r"^\s*CREATE\s+FULLTEXT\s+INDEX\b", re.I)
+_FULLTEXT_MATCH = re.compile(r"MATCH\s*\(\s*([\w.]+)\s*\)\s*AGAINST\s*\(\s*%s\s+IN\s+BOOLEAN\s+MODE\s*\)", re.I)
+_LIKE_PARAM = re.compile(r"\bLIKE\s+%s", re.I)
+_LOCKING_READ = re.compile(r"\s+(FOR\s+UPDATE|FOR\s+SHARE|LOCK\s+IN\s+SHARE\s+MODE)\s*$", re.I)
+_DIVISION = re.compile(r"(?<=\s)/(?=\s)")
+_INSERT = re.compile(r"^\s*INSERT\b", re.I)
+_READ = re.compile(r"^\s*(SELECT|WITH|EXPLAIN|PRAGMA)\b", re.I)
+
+
+def _translate_alter(statement, table):
+    """ALTER TABLE ... ADD COLUMN a, ADD COLUMN b -> 컬럼별 ALTER TABLE (SQLite 는 한 문장에 하나만 추가 가능)"""
+    actions = _ADD_COLUMN.split(statement[_ALTER_TABLE.match(statement).end():])
+
+    # SQLite 는 기존 테이블에 저장(STORED) 생성 컬럼을 추가할 수 없으므로 가상 생성 컬럼으로 추가 (인덱스 가능)
+    return tuple(f"ALTER TABLE {table} {_STORED.sub('VIRTUAL', action.strip())}" for action in actions)
+
+@functools.lru_cache(maxsize=1024)
+def translate(query):
+    """
+    MySQL 문장을 SQLite 문장 목록으로 변환
+
+    Returns:
+        tuple: SQLite 문장 (DDL 한 문장이 여러 문장이 되거나, 지원하지 않는 인덱스는 빈 목록)
+    """
+    statement = query.strip().rstrip(";")
+
+    if _FULLTEXT_INDEX.match(statement):
+        # 이름 부분 일치 검색은 MATCH_AGAINST 함수가 대신 처리
+        return ()
+
+    alter = _ALTER_TABLE.match(statement)
+    if alter:
+        return _translate_alter(statement, alter.group(1))
+
+    statement = _AUTO_INCREMENT.sub("INTEGER PRIMARY KEY AUTOINCREMENT", statement)
+    statement = _FULLTEXT_MATCH.sub(r"MATCH_AGAINST(\1, %s)", statement)
+    # MySQL 의 LIKE 는 역슬래시가 기본 이스케이프 문자
+    statement = _LIKE_PARAM.sub(r"LIKE %s ESCAPE '\\'", statement)
+    # 쓰기 트랜잭션이 DB 전체를 잠그므로 행 잠금 구문은 필요 없음
+    statement = _LOCKING_READ.sub("", statement)
+    # MySQL 의 / 는 정수끼리도 소수 결과 (SQLite 는 정수 나눗셈)
+    statement = _DIVISION.sub("* 1.0 /", statement)
+
+    return (statement.replace("%s", "?"),)
+
+
+# ---- 값 변환 ----
+
+def to_sqlite(value):
+    """파라미터 값을 MySQL 저장 형식과 같은 SQLite 값으로 변환"""
+    if isinstance(value, datetime):
+        # DATETIME 컬럼은 초 단위
+        return value.isoformat(" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+def from_date(value):
+    """DATE 컬럼 값 -> date (형식이 다른 값은 문자열 그대로)"""
+    text = value.decode()
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return text
+
+def from_datetime(value):
+    """DATETIME 컬럼 값 -> datetime (형식이 다른 값은 문자열 그대로)"""
+    text = value.decode()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+# 선언 타입별 결과 변환 (sqlite3 모듈 전역 등록, 타입 이름은 대소문자 구분 없음)
+CONVERTERS = {
+    "DATE": from_date,
+    "DATETIME": from_datetime,
+}
+for _type_name, _converter in CONVERTERS.items():
+    sqlite3.register_converter(_type_name, _converter)
+
+
+# ---- MySQL 함수 ----
+
+def _date_part(start, end):
+    def part(value):
+        return int(str(value)[start:end]) if value is not None else None
+    return part
+
+def _reverse(value):
+    return str(value)[::-1] if value is not None else None
+
+def _if(condition, true_value, false_value):
+    return true_value if condition else false_value
+
+def _match_against(text, expression):
+    """
+    MySQL ngram FULLTEXT 불리언 모드 검색 대체 (검색어가 포함된 횟수를 점수로 사용, 없으면 0)
+
+    큰따옴표 구문은 부분 문자열 일치, 그 외에는 단어별 일치 횟수의 합입니다.
+    """
+    if text is None or not expression:
+        return 0.0
+
+    expression = expression.strip()
+    if len(expression) >= 2 and expression[0] == expression[-1] == '"':
+        terms = [expression[1:-1].strip()]
+    else:
+        terms = [term.strip('+-~<>()*"') for term in expression.split()]
+
+    return float(sum(text.count(term) for term in terms if term))
+
+FUNCTIONS = {
+    "YEAR": (1, _date_part(0, 4)),
+    "MONTH": (1, _date_part(5, 7)),
+    "DAYOFMONTH": (1, _date_part(8, 10)),
+    "REVERSE": (1, _reverse),
+    "IF": (3, _if),
+    "MATCH_AGAINST": (2, _match_against),
+}
+
+
+# ---- 연결 ----
+
+class SQLiteCursor:
+    """mysql.connector 커서처럼 쓸 수 있는 SQLite 커서 (dictionary=True 이면 행을 딕셔너리로 반환)"""
+
+    def __init__(self, connection, dictionary=False):
+        self._connection = connection
+        self._raw = connection._raw
+        self._cursor = self._raw.cursor()
+        self._dictionary = dictionary
+        self._columns = ()
+        self.rowcount = -1
+        self.lastrowid = None
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query, params=()):
+        statements = translate(query)
+        values = tuple(to_sqlite(value) for value in params or ())
+
+        self._connection._before_execute(query)
+        for index, statement in enumerate(statements):
+            self._cursor.execute(statement, values if index == len(statements) - 1 else ())
+
+        self._after_execute()
+
+    def executemany(self, query, seq_params):
+        """
+        같은 문장을 여러 파라미터로 실행
+
+        MySQL 의 다중 행 INSERT 한 문장처럼 전체가 반영되거나 전체가 취소되며(세이브포인트),
+        INSERT 이면 lastrowid 로 첫 번째 생성 ID 를 반환합니다.
+        """
+        (statement,) = translate(query)
+        rows = [tuple(to_sqlite(value) for value in params) for params in seq_params]
+
+        self._connection._before_execute(query)
+        self._raw.execute("SAVEPOINT executemany")
+        try:
+            self._cursor.executemany(statement, rows)
+        except Exception:
+            self._raw.execute("ROLLBACK TO executemany")
+            self._raw.execute("RELEASE executemany")
+            raise
+        self._raw.execute("RELEASE executemany")
+
+        self._after_execute()
+        if _INSERT.match(statement) and rows:
+            # 쓰기 잠금 안에서 연속으로 생성된 ID 이므로 마지막 ID 에서 첫 번째 ID 를 계산
+            last_id = self._raw.execute("SELECT last_insert_rowid()").fetchone()[0]
+            self.lastrowid = last_id - len(rows) + 1
+
+    def _after_execute(self):
+        self._columns = tuple(column[0] for column in self._cursor.description or ())
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+
+    def _row(self, values):
+        return dict(zip(self._columns, values)) if self._dictionary else tuple(values)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return self._row(row) if row is not None else None
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def fetchmany(self, size=1):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """
+    mysql.connector 연결처럼 쓸 수 있는 SQLite 연결
+
+    MySQL 설정(autocommit=True)과 같이 문장마다 자동 커밋되고,
+    start_transaction() 호출 시에만 commit()/rollback() 까지 하나의 트랜잭션으로 묶입니다.
+
+    SQLite 는 쓰기 잠금이 DB 전체에 걸리므로 트랜잭션은 첫 변경(또는 잠금 읽기) 직전에 시작합니다.
+    조회만 하는 작업 단위는 쓰기 잠금을 잡지 않아, 같은 스레드의 다른 연결(detached(), 병렬 조회,
+    캐시 로더)이 쓰기 잠금 대기(BUSY_TIMEOUT)에 걸리지 않습니다.
+    첫 변경 전의 조회는 문장마다 최신 커밋 결과를 읽습니다 (MySQL READ COMMITTED 와 같은 동작).
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._pending_transaction = False
+
+    def cursor(self, dictionary=False, buffered=True):
+        # 결과는 SQLite 가 필요할 때 읽으므로 buffered 옵션과 관계없이 스트리밍 가능
+        return SQLiteCursor(self, dictionary)
+
+    def start_transaction(self):
+        self._pending_transaction = True
+
+    def _before_execute(self, query):
+        """start_transaction() 후 첫 변경/잠금 읽기 직전에 쓰기 잠금을 잡고 트랜잭션 시작"""
+        if self._pending_transaction and (not _READ.match(query) or _LOCKING_READ.search(query)):
+            # 조회로 시작한 트랜잭션의 잠금 승격 충돌(SQLITE_BUSY)을 피하기 위해 쓰기 잠금으로 시작
+            self._raw.execute("BEGIN IMMEDIATE")
+            self._pending_transaction = False
+
+    def commit(self):
+        self._pending_transaction = False
+        self._raw.commit()
+
+    def rollback(self):
+        self._pending_transaction = False
+        self._raw.rollback()
+
+    def is_connected(self):
+        try:
+            self._raw.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        self._raw.close()
+
+
+_memory_path = None
+_initialized = set()
+_lock = threading.Lock()
+
+def _remove_database(path):
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+def database_path(path=MEMORY):
+    """실제 DB 파일 경로 (':memory:' 는 프로세스 전용 임시 파일)"""
+    global _memory_path
+
+    if path != MEMORY:
+        return path
+
+    with _lock:
+        if _memory_path is None:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            fd, _memory_path = tempfile.mkstemp(prefix="crm_", suffix=".sqlite3", dir=directory)
+            os.close(fd)
+            atexit.register(_remove_database, _memory_path)
+
+    return _memory_path
+
+def connect(path=MEMORY, timeout=BUSY_TIMEOUT):
+    """
+    SQLite 연결 생성 (빈 DB 이면 스키마 생성)
+
+    Args:
+        path (str): DB 파일 경로 또는 ':memory:'
+        timeout (float): 다른 연결의 쓰기 잠금 대기 시간 (초)
+
+    Returns:
+        SQLiteConnection: 새 연결
+    """
+    path = database_path(path)
+    raw = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False,
+                          detect_types=sqlite3.PARSE_DECLTYPES)
+
+    try:
+        for name, (arity, func) in FUNCTIONS.items():
+            raw.create_function(name, arity, func, deterministic=True)
+
+        raw.execute("PRAGMA foreign_keys = ON")
+        # 쓰기 중에도 다른 연결이 읽을 수 있도록 WAL 사용
+        raw.execute("PRAGMA journal_mode = WAL")
+        raw.execute("PRAGMA synchronous = NORMAL")
+
+        connection = SQLiteConnection(raw)
+        if path not in _initialized:
+            with _lock:
+                if path not in _initialized:
+                    _ensure_schema(connection)
+                    _initialized.add(path)
+    except Exception:
+        raw.close()
+        raise
+
+    return connection
+
+def _ensure_schema(connection):
+    """빈 DB 이면 스키마 생성 (다른 프로세스와 동시에 생성하지 않도록 쓰기 잠금 안에서 확인)"""
+    connection.start_transaction()
+    try:
+        cursor = connection.cursor()
+        # 잠금 읽기로 확인 시점부터 쓰기 잠금 획득
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'customer' FOR UPDATE")
+        if cursor.fetchone() is None:
+            create_schema(cursor)
+        cursor.close()
+    except Exception:
+        connection.rollback()
+        raise
+
+    connection.commit()
+
+def create_schema(cursor):
+    """scripts/sql 의 DDL, 결제 수단 코드, 마이그레이션 적용 (마이그레이션은 schema_version 에 기록)"""
+    # app.migrate 는 데이터 계층(app.database)을 임포트하므로 실행 시점에 임포트
+    from .migrate import _ensure_version_table, list_migrations, split_statements
+
+    for filename in SCHEMA_FILES:
+        with open(os.path.join(SQL_DIR, filename), encoding="utf-8") as f:
+            for statement in split_statements(f.read()):
+                cursor.execute(statement)
+
+    _ensure_version_table(cursor)
+    for version, name, path in list_migrations():
+        with open(path, encoding="utf-8") as f:
+            for statement in split_statements(f.read()):
+                cursor.execute(statement)
+
+        cursor.execute("INSERT INTO schema_version (version, name, applied_at) VALUES (%s, %s, %s)",
+                       (version, name, datetime.now()))
+
+    print(f"[INFO] SQLite 스키마 생성 완료 (마이그레이션 {len(list_migrations())}개)")
@@ -1,90 +1,332 @@
 from .database import execute_query
+from .pagination import clamp_limit
+from .metrics import timed
 from datetime import datetime, timedelta
 
-# 고객별 총 방문 횟수 조회
-def get_total_visits_by_customer(customer_id):
-    query = "SELECT COUNT(*) total_visits FROM visit WHERE customer_id = %s"
+# 고객별 총 방문 횟수 / 총 결제 금액 쿼리 (app/async_queries.py 와 공용)
+TOTAL_VISITS_BY_CUSTOMER_QUERY = "SELECT visit_count total_visits FROM customer_summary WHERE customer_id = %s"
+TOTAL_PAYMENT_BY_CUSTOMER_QUERY = "SELECT payment_total total_amount FROM customer_summary WHERE customer_id = %s"
 
-    result = execute_query(query, (customer_id,), fetch_one=True)
+# 고객별 총 방문 횟수 조회 (고객 요약 기준)
+@timed
+def get_total_visits_by_customer(customer_id):
+    result = execute_query(TOTAL_VISITS_BY_CUSTOMER_QUERY, (customer_id,), fetch_one=True)
     
     return result["total_visits"] if result else 0
 
-# 고객별 총 결제 금액 조회
+# 고객별 총 결제 금액 조회 (고객 요약 기준)
+@timed
 def get_total_payment_by_customer(customer_id):
-    query = """
-    SELECT SUM(p.amount) total_amount
-    FROM payment p
-    JOIN visit v ON p.visit_id = v.visit_id
-    WHERE v.customer_id = %s
-    """
-
-    result = execute_query(query, (customer_id, ), fetch_one=True)
+    result = execute_query(TOTAL_PAYMENT_BY_CUSTOMER_QUERY, (customer_id, ), fetch_one=True)
 
     return result["total_amount"] if result and result["total_amount"] else 0
 
-# 고객별 통계 정보 조회
-def get_customer_statistics(customer_id):
-    query = """
-    SELECT 
-        c.name,
-        COUNT(v.visit_id) as total_visits,
-        SUM(p.amount) as total_payment,
-        AVG(p.amount) as avg_payment,
-        MAX(v.visit_date) as last_visit_date,
-        MIN(v.visit_date) as first_visit_date
-    FROM customer c
-    LEFT JOIN visit v ON c.customer_id = v.customer_id
-    LEFT JOIN payment p ON v.visit_id = p.visit_id
-    WHERE c.customer_id = %s
-    GROUP BY c.customer_id, c.name
-    """
+# 고객별 통계 쿼리 (app/async_queries.py 와 공용)
+CUSTOMER_STATISTICS_QUERY = """
+SELECT 
+    c.name,
+    COALESCE(s.visit_count, 0) as total_visits,
+    COALESCE(s.payment_total, 0) as total_payment,
+    COALESCE(s.payment_count, 0) as payment_count,
+    s.payment_total / NULLIF(s.payment_count, 0) as avg_payment,
+    s.last_visit_date,
+    s.first_visit_date,
+    s.last_payment_datetime
+FROM customer c
+LEFT JOIN customer_summary s ON c.customer_id = s.customer_id
+WHERE c.customer_id = %s
+"""
 
-    result = execute_query(query, (customer_id, ), fetch_one=True)
+# 고객별 통계 정보 조회 (고객 요약 기본 키 조회)
+@timed
+def get_customer_statistics(customer_id):
+    result = execute_query(CUSTOMER_STATISTICS_QUERY, (customer_id, ), fetch_one=True)
     
+    return _fill_payment_defaults(result)
+
+def _fill_payment_defaults(result):
     if result:
         result["total_payment"] = result["total_payment"] or 0
         result["avg_payment"] = result["avg_payment"] or 0
     
     return result
 
-# 전체 통계 조회
-def get_overall_statistics():
-    query = """
-    SELECT 
-        COUNT(DISTINCT c.customer_id) as total_customers,
-        COUNT(v.visit_id) as total_visits,
-        SUM(p.amount) as total_revenue,
-        AVG(p.amount) as avg_revenue_per_visit,
-        COUNT(DISTINCT DATE(v.visit_date)) as total_visit_days
+# 고객별 통계 정렬 기준 (요청 값 -> SQL 컬럼)
+CUSTOMER_STATISTICS_SORTS = {
+    "name": "c.name",
+    "total_visits": "total_visits",
+    "total_payment": "total_payment",
+    "avg_payment": "avg_payment",
+    "first_visit_date": "first_visit_date",
+    "last_visit_date": "last_visit_date"
+}
+
+# 전체 고객 수 쿼리 (app/async_queries.py 와 공용)
+CUSTOMER_COUNT_QUERY = "SELECT COUNT(*) as total FROM customer"
+
+# 전체 고객 통계 조회 (고객 요약 조인, 방문/결제 집계 없음)
+@timed
+def get_all_customer_statistics(limit=None, page=1, sort="name", order="asc"):
+    """
+    고객 요약(customer_summary)을 고객 테이블과 조인하여
+    모든 고객의 통계를 한 번에 조회합니다.
+
+    Args:
+        limit (int, optional): 페이지 크기 (Config.PAGE_SIZE_MAX 이하로 보정)
+        page (int): 페이지 번호 (1부터 시작)
+        sort (str): 정렬 기준 (CUSTOMER_STATISTICS_SORTS 의 키)
+        order (str): "asc" 또는 "desc"
+
+    Returns:
+        dict: {"items": 고객별 통계 목록, "total": 전체 고객 수, "page", "limit", "sort", "order"}
+    """
+    query, params, result = _all_customer_statistics_query(limit, page, sort, order)
+
+    items = execute_query(query, params, fetch_all=True)
+    total = execute_query(CUSTOMER_COUNT_QUERY, fetch_one=True)
+
+    return dict(result, items=items if items is not None else [], total=total["total"] if total else 0)
+
+# 전체 고객 통계 쿼리, 파라미터, 보정한 페이지 정보 (app/async_queries.py 와 공용)
+def _all_customer_statistics_query(limit, page, sort, order):
+    limit = clamp_limit(limit)
+    page = max(page or 1, 1)
+    sort = sort if sort in CUSTOMER_STATISTICS_SORTS else "name"
+    order = "desc" if order == "desc" else "asc"
+
+    # 정렬 컬럼은 허용 목록에서만 선택하므로 문자열 조합이 안전함
+    query = f"""
+    SELECT
+        c.customer_id,
+        c.name,
+        c.phone,
+        COALESCE(s.visit_count, 0) as total_visits,
+        COALESCE(s.payment_total, 0) as total_payment,
+        COALESCE(s.payment_total / NULLIF(s.payment_count, 0), 0) as avg_payment,
+        s.first_visit_date,
+        s.last_visit_date
     FROM customer c
-    LEFT JOIN visit v ON c.customer_id = v.customer_id
-    LEFT JOIN payment p ON v.visit_id = p.visit_id
+    LEFT JOIN customer_summary s ON c.customer_id = s.customer_id
+    ORDER BY {CUSTOMER_STATISTICS_SORTS[sort]} {order.upper()}, c.customer_id
+    LIMIT %s OFFSET %s
     """
 
-    result = execute_query(query, fetch_one=True)
+    return query, (limit, (page - 1) * limit), {"page": page, "limit": limit, "sort": sort, "order": order}
+
+# 고객 통계 요약 카드의 순위 기준 (결과 키 -> 고객 요약 정렬 식)
+TOP_CUSTOMER_METRICS = {
+    "total_payment": "s.payment_total",
+    "total_visits": "s.visit_count",
+    "avg_payment": "s.payment_total / NULLIF(s.payment_count, 0)",
+}
+
+# 기준별 상위 고객 조회 (기준별 ORDER BY ... LIMIT 을 UNION ALL 로 묶어 쿼리 1회)
+@timed
+def get_top_customers(limit=1):
+    """
+    TOP_CUSTOMER_METRICS 기준별 상위 고객
+
+    Returns:
+        dict: {기준: [고객 통계 (get_all_customer_statistics 행과 같은 키)]} (순위 순)
+    """
+    query, params = _top_customers_query(limit)
+
+    return _group_top_customers(execute_query(query, params, fetch_all=True, cache=True) or [])
+
+# 기준별 상위 고객 쿼리와 파라미터 (app/async_queries.py 와 공용)
+def _top_customers_query(limit):
+    limit = max(int(limit), 1)
+
+    # 정렬 식은 고정 목록에서만 선택하므로 문자열 조합이 안전함
+    ranked = [
+        f"""
+        SELECT * FROM (
+            SELECT %s AS metric, c.customer_id, c.name, c.phone,
+                   s.visit_count AS total_visits,
+                   s.payment_total AS total_payment,
+                   COALESCE(s.payment_total / NULLIF(s.payment_count, 0), 0) AS avg_payment,
+                   s.first_visit_date, s.last_visit_date
+            FROM customer_summary s
+            JOIN customer c ON s.customer_id = c.customer_id
+            ORDER BY {expression} DESC, s.customer_id
+            LIMIT %s
+        ) {metric}_rank
+        """
+        for metric, expression in TOP_CUSTOMER_METRICS.items()
+    ]
+    params = tuple(value for metric in TOP_CUSTOMER_METRICS for value in (metric, limit))
+
+    return " UNION ALL ".join(ranked), params
+
+# 상위 고객 결과 행을 기준별 목록으로 나눔 (app/async_queries.py 와 공용)
+def _group_top_customers(rows):
+    top = {metric: [] for metric in TOP_CUSTOMER_METRICS}
+    for row in rows:
+        top[row["metric"]].append({key: value for key, value in row.items() if key != "metric"})
+
+    return top
+
+# 전체 통계 쿼리 (app/async_queries.py 와 공용)
+OVERALL_STATISTICS_QUERY = """
+SELECT 
+    (SELECT COUNT(*) FROM customer) as total_customers,
+    COALESCE(SUM(visit_count), 0) as total_visits,
+    SUM(revenue_sum) as total_revenue,
+    SUM(revenue_sum) / NULLIF(SUM(payment_count), 0) as avg_revenue_per_visit,
+    COUNT(*) as total_visit_days
+FROM daily_stats
+WHERE payment_method_code = ''
+"""
+
+# 전체 통계 조회 (일별 집계 기준, 날짜 수에 비례)
+@timed
+def get_overall_statistics():
+    result = execute_query(OVERALL_STATISTICS_QUERY, fetch_one=True, cache=True)
     if result:
-        result["total_revenue"] = result["total_revenue"] or 0
-        result["avg_revenue_per_visit"] = result["avg_revenue_per_visit"] or 0
+        _fill_revenue_defaults(result)
 
     return result
 
+# 해당 월 1일
+def _month_start(value):
+    return datetime(value.year, value.month, 1)
+
+# n개월 뒤(음수면 이전) 1일
+def _add_months(value, months):
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+def _fill_revenue_defaults(result):
+    result["total_revenue"] = result["total_revenue"] or 0
+    result["avg_revenue_per_visit"] = result["avg_revenue_per_visit"] or 0
+    return result
+
+# 기간 [start, end) 월별 방문 고객 수 쿼리 (날짜별 고객 수는 더할 수 없으므로 방문일 커버링 인덱스로 계산)
+UNIQUE_CUSTOMERS_BY_MONTH_QUERY = """
+SELECT 
+    YEAR(visit_date) as year,
+    MONTH(visit_date) as month,
+    COUNT(DISTINCT customer_id) as unique_customers
+FROM visit
+WHERE visit_date >= %s AND visit_date < %s
+GROUP BY YEAR(visit_date), MONTH(visit_date)
+"""
+
+# 월별 결과 행 -> {(연, 월): 행}
+def _by_month(rows):
+    return {(int(row["year"]), int(row["month"])): row for row in rows}
+
 # 월별 통계 조회
+@timed
 def get_monthly_statistics(year, month):
-    query = """
-    SELECT 
-        COUNT(DISTINCT v.customer_id) as unique_customers,
-        COUNT(v.visit_id) as total_visits,
-        SUM(p.amount) as total_revenue,
-        AVG(p.amount) as avg_revenue_per_visit
-    FROM visit v
-    LEFT JOIN payment p ON v.visit_id = p.visit_id
-    WHERE YEAR(v.visit_date) = %s AND MONTH(v.visit_date) = %s
+    start = datetime(int(year), int(month), 1)
+    series = get_monthly_series(start, _add_months(start, 1))
+
+    return series[0]["stats"] if series else None
+
+# 월별 통계 쿼리 - 일별 집계(날짜별 합계 행)를 월 단위로 합산 (app/async_queries.py 와 공용)
+MONTHLY_SERIES_QUERY = """
+SELECT 
+    YEAR(stat_date) as year,
+    MONTH(stat_date) as month,
+    SUM(visit_count) as total_visits,
+    SUM(revenue_sum) as total_revenue,
+    SUM(revenue_sum) / NULLIF(SUM(payment_count), 0) as avg_revenue_per_visit
+FROM daily_stats
+WHERE payment_method_code = '' AND stat_date >= %s AND stat_date < %s
+GROUP BY YEAR(stat_date), MONTH(stat_date)
+"""
+
+# 기간별 월 통계 조회 (월 수와 관계없이 쿼리 2회)
+@timed
+def get_monthly_series(start, end):
     """
+    Args:
+        start (date): 시작 월 (해당 월 1일부터 포함)
+        end (date): 종료 월 (해당 월 1일 이전까지, 즉 end 가 속한 월은 제외)
 
-    result = execute_query(query, (year, month), fetch_one=True)
+    Returns:
+        list: 월 순서대로 [{"year", "month", "stats": {unique_customers, total_visits,
+              total_revenue, avg_revenue_per_visit}}] (기록이 없는 월은 0으로 채움)
+    """
+    start, end = _month_start(start), _month_start(end)
+    rows = execute_query(MONTHLY_SERIES_QUERY, (start.date(), end.date()), fetch_all=True, cache=True) or []
+    customers = execute_query(UNIQUE_CUSTOMERS_BY_MONTH_QUERY, (start, end), fetch_all=True, cache=True) or []
 
-    if result:
-        result["total_revenue"] = result["total_revenue"] or 0
-        result["avg_revenue_per_visit"] = result["avg_revenue_per_visit"] or 0
+    return _build_monthly_series(start, end, rows, customers)
+
+# 월 순서대로 통계 목록 생성 (기록이 없는 월은 0으로 채움, app/async_queries.py 와 공용)
+def _build_monthly_series(start, end, rows, customer_rows):
+    by_month = _by_month(rows)
+    customers = _by_month(customer_rows)
+
+    series = []
+    month = start
+    while month < end:
+        key = (month.year, month.month)
+        row = by_month.get(key)
+        stats = {
+            "unique_customers": customers[key]["unique_customers"] if key in customers else 0,
+            "total_visits": int(row["total_visits"]) if row else 0,
+            "total_revenue": row["total_revenue"] if row else 0,
+            "avg_revenue_per_visit": row["avg_revenue_per_visit"] if row else 0
+        }
+        series.append({"year": month.year, "month": month.month, "stats": _fill_revenue_defaults(stats)})
+        month = _add_months(month, 1)
+
+    return series
+
+# 기간 일별 집계 쿼리 (app/async_queries.py 와 공용)
+RANGE_STATISTICS_QUERY = """
+SELECT stat_date, payment_method_code, visit_count, unique_customers, revenue_sum, payment_count
+FROM daily_stats
+WHERE stat_date BETWEEN %s AND %s
+ORDER BY stat_date, payment_method_code
+"""
+
+# 기간 통계 조회 (일별 합계와 결제 수단별 매출)
+@timed
+def get_range_statistics(start_date, end_date):
+    """
+    Args:
+        start_date (date): 시작일 (포함)
+        end_date (date): 종료일 (포함)
+
+    Returns:
+        dict: {"daily": [{"stat_date", "visit_count", "unique_customers", "revenue_sum", "payment_count"}],
+               "by_method": [{"payment_method_code", "revenue_sum", "payment_count"}],
+               "total_visits", "total_revenue", "total_payments"}
+    """
+    rows = execute_query(RANGE_STATISTICS_QUERY, (start_date, end_date), fetch_all=True, cache=True) or []
+
+    return _summarize_range(rows)
+
+# 일별 집계 행 -> 일별 합계 / 결제 수단별 매출 / 기간 합계 (app/async_queries.py 와 공용)
+def _summarize_range(rows):
+    daily = [row for row in rows if row["payment_method_code"] == ""]
+    by_method = {}
+    for row in rows:
+        if row["payment_method_code"]:
+            method = by_method.setdefault(row["payment_method_code"], {
+                "payment_method_code": row["payment_method_code"], "revenue_sum": 0, "payment_count": 0
+            })
+            method["revenue_sum"] += row["revenue_sum"]
+            method["payment_count"] += row["payment_count"]
+
+    return {
+        "daily": daily,
+        "by_method": sorted(by_method.values(), key=lambda method: -method["revenue_sum"]),
+        "total_visits": sum(row["visit_count"] for row in daily),
+        "total_revenue": sum(row["revenue_sum"] for row in daily),
+        "total_payments": sum(row["payment_count"] for row in daily)
+    }
+
+# 최근 N개월 통계 조회 (이번 달 포함, 최신 월부터)
+@timed
+def get_recent_monthly_series(months=6, today=None):
+    return list(reversed(get_monthly_series(*_recent_months(months, today))))
 
-    return result
\ No newline at end of file
+# 최근 N개월 기간 [시작 월, 다음 달) (app/async_queries.py 와 공용)
+def _recent_months(months, today=None):
+    this_month = _month_start(today or datetime.now())
+    return _add_months(this_month, -(months - 1)), _add_months(this_month, 1)
@@ -0,0 +1,209 @@
+import argparse
+import sys
+
+from .database import execute_query, transaction
+
+"""
+고객별 요약(customer_summary) 테이블 관리 모듈
+
+고객 상세/고객 통계 화면이 요청마다 방문/결제를 집계하지 않도록
+방문/결제가 변경될 때마다 해당 고객의 요약 행을 원본에서 다시 계산합니다.
+(scripts/sql/migrations/0005_customer_summary.sql 필요)
+
+요약 행이 없는 고객(방문/결제 기록이 없는 신규 고객)은 모든 값이 0 인 것으로 봅니다.
+
+사용법:
+    python -m app.summary check          # 원본과 다시 계산해 비교, 불일치 시 종료 코드 1
+    python -m app.summary check --fix    # 불일치 고객만 다시 계산
+    python -m app.summary rebuild        # 전체 재계산
+"""
+
+# 비교 대상 컬럼 (customer_summary 의 값 컬럼)
+SUMMARY_COLUMNS = (
+    "visit_count", "payment_total", "payment_count",
+    "first_visit_date", "last_visit_date", "last_payment_datetime"
+)
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+def _ids(query, params):
+    rows = execute_query(query, params, fetch_all=True) or []
+    return {row["customer_id"] for row in rows}
+
+def customers_of_visits(visit_ids):
+    """방문 ID 목록의 고객 ID 집합"""
+    visit_ids = list(visit_ids)
+    if not visit_ids:
+        return set()
+
+    query = f"SELECT DISTINCT customer_id FROM visit WHERE visit_id IN ({_placeholders(visit_ids)})"
+    return _ids(query, tuple(visit_ids))
+
+def customers_of_payments(payment_ids):
+    """결제 ID 목록이 속한 방문의 고객 ID 집합"""
+    payment_ids = list(payment_ids)
+    if not payment_ids:
+        return set()
+
+    query = f"""
+    SELECT DISTINCT v.customer_id
+    FROM payment p
+    JOIN visit v ON p.visit_id = v.visit_id
+    WHERE p.payment_id IN ({_placeholders(payment_ids)})
+    """
+    return _ids(query, tuple(payment_ids))
+
+def _summary_select(customer_ids=None):
+    """원본에서 요약 값을 계산하는 SELECT 와 파라미터 (customer_ids 생략 시 전체 고객)"""
+    if customer_ids is None:
+        visit_where = payment_where = customer_where = ""
+        params = ()
+    else:
+        marks = _placeholders(customer_ids)
+        visit_where = f"WHERE customer_id IN ({marks})"
+        payment_where = f"WHERE v.customer_id IN ({marks})"
+        customer_where = f"WHERE c.customer_id IN ({marks})"
+        params = tuple(customer_ids) * 3
+
+    query = f"""
+    SELECT c.customer_id,
+           COALESCE(vs.visit_count, 0) AS visit_count,
+           COALESCE(ps.payment_total, 0) AS payment_total,
+           COALESCE(ps.payment_count, 0) AS payment_count,
+           vs.first_visit_date,
+           vs.last_visit_date,
+           ps.last_payment_datetime
+    FROM customer c
+    LEFT JOIN (
+        SELECT customer_id,
+               COUNT(*) AS visit_count,
+               MIN(visit_date) AS first_visit_date,
+               MAX(visit_date) AS last_visit_date
+        FROM visit
+        {visit_where}
+        GROUP BY customer_id
+    ) vs ON c.customer_id = vs.customer_id
+    LEFT JOIN (
+        SELECT v.customer_id,
+               SUM(p.amount) AS payment_total,
+               COUNT(*) AS payment_count,
+               MAX(p.payment_datetime) AS last_payment_datetime
+        FROM payment p
+        JOIN visit v ON p.visit_id = v.visit_id
+        {payment_where}
+        GROUP BY v.customer_id
+    ) ps ON c.customer_id = ps.customer_id
+    {customer_where}
+    """
+    return query, params
+
+def refresh_customer_summary(customer_ids=None):
+    """
+    고객들의 요약 행을 원본에서 다시 계산 (customer_ids 생략 시 전체)
+
+    작업 단위 안에서 호출되면 원본 변경과 같은 트랜잭션으로 반영됩니다.
+    """
+    if customer_ids is not None:
+        customer_ids = sorted({customer_id for customer_id in customer_ids if customer_id is not None})
+        if not customer_ids:
+            return
+
+    select, params = _summary_select(customer_ids)
+    columns = ", ".join(("customer_id",) + SUMMARY_COLUMNS)
+
+    with transaction():
+        if customer_ids is None:
+            execute_query("DELETE FROM customer_summary")
+        else:
+            execute_query(f"DELETE FROM customer_summary WHERE customer_id IN ({_placeholders(customer_ids)})",
+                          tuple(customer_ids))
+
+        execute_query(f"INSERT INTO customer_summary ({columns}) {select}", params)
+
+def _normalize(row):
+    """
+    비교용 값 (요약 행이 없으면 0/None, 드라이버별 숫자/일시 타입 차이 제거)
+
+    SQLite 는 MIN()/MAX() 결과를 datetime 이 아닌 'YYYY-MM-DD HH:MM:SS' 문자열로 반환하므로 일시는 문자열로 비교합니다.
+    """
+    row = row or {}
+    return tuple(
+        int(row.get(column) or 0) if column in ("visit_count", "payment_total", "payment_count")
+        else (str(row[column]) if row.get(column) is not None else None)
+        for column in SUMMARY_COLUMNS
+    )
+
+def check_customer_summary():
+    """
+    요약 테이블을 원본에서 다시 계산한 값과 비교
+
+    Returns:
+        list: [{"customer_id", "column", "stored", "expected"}] (일치하면 빈 목록)
+    """
+    select, params = _summary_select()
+    expected = execute_query(select, params, fetch_all=True) or []
+    stored = execute_query(f"SELECT customer_id, {', '.join(SUMMARY_COLUMNS)} FROM customer_summary", fetch_all=True) or []
+    stored = {row["customer_id"]: row for row in stored}
+
+    mismatches = []
+    for row in expected:
+        current = stored.pop(row["customer_id"], None)
+        for column, stored_value, expected_value in zip(SUMMARY_COLUMNS, _normalize(current), _normalize(row)):
+            if stored_value != expected_value:
+                mismatches.append({
+                    "customer_id": row["customer_id"],
+                    "column": column,
+                    "stored": stored_value,
+                    "expected": expected_value
+                })
+
+    # 고객이 삭제되었는데 남아 있는 행 (외래 키 연쇄 삭제로 보통은 없음)
+    for customer_id in stored:
+        mismatches.append({"customer_id": customer_id, "column": "customer_id", "stored": customer_id, "expected": None})
+
+    return mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="고객별 요약(customer_summary) 점검/재계산")
+    parser.add_argument("command", choices=["check", "rebuild"])
+    parser.add_argument("--fix", action="store_true", help="check: 불일치 고객 요약 다시 계산")
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild":
+        with transaction() as uow:
+            refresh_customer_summary()
+
+        if uow.failed:
+            print("[ERROR] 고객 요약 재계산 실패 (롤백)")
+            return 1
+
+        print("[SUMMARY] 고객 요약 재계산 완료")
+        return 0
+
+    mismatches = check_customer_summary()
+    for mismatch in mismatches:
+        print(f"[SUMMARY] 불일치: 고객 {mismatch['customer_id']} {mismatch['column']} "
+              f"저장 {mismatch['stored']} / 원본 {mismatch['expected']}")
+
+    if not mismatches:
+        print("[SUMMARY] 고객 요약 일치")
+        return 0
+
+    if args.fix:
+        customer_ids = {mismatch["customer_id"] for mismatch in mismatches}
+        with transaction() as uow:
+            refresh_customer_summary(customer_ids)
+            # 원본 고객이 없는 행은 위 재계산에서 삭제만 됨
+        if uow.failed:
+            print("[ERROR] 고객 요약 수정 실패 (롤백)")
+            return 1
+
+        print(f"[SUMMARY] 고객 {len(customer_ids)}명 요약 다시 계산")
+        return 0
+
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+from datetime import date, datetime
+
+"""
+입력 데이터 검증 모듈
+"""
+
+GENDERS = ("M", "F")
+
+# 필수 값 확인
+def require(data, field):
+    value = data[field]
+
+    if value is None or (isinstance(value, str) and not value.strip()):
+        raise ValueError(f"{field} 값이 비어 있습니다.")
+
+    return value.strip() if isinstance(value, str) else value
+
+# 최대 길이 확인 (빈 값은 None 으로 변환)
+def optional_text(value, field, max_length=None):
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if not value:
+        return None
+
+    if max_length and len(value) > max_length:
+        raise ValueError(f"{field} 값이 너무 깁니다. (최대 {max_length}자)")
+
+    return value
+
+# 날짜 변환 (YYYY-MM-DD)
+def parse_date(value, field):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    try:
+        return datetime.strptime(str(value).strip(), "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"{field} 날짜 형식이 올바르지 않습니다: {value}")
+
+# 일시 변환 (YYYY-MM-DD HH:MM[:SS] 또는 datetime-local 형식)
+def parse_datetime(value, field):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+
+    text = str(value).strip().replace("T", " ")
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(f"{field} 일시 형식이 올바르지 않습니다: {value}")
+
+# 정수 변환
+def parse_int(value, field, minimum=None):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} 값이 숫자가 아닙니다: {value}")
+
+    if minimum is not None and number < minimum:
+        raise ValueError(f"{field} 값은 {minimum} 이상이어야 합니다: {value}")
+
+    return number
+
+# 전화번호 정규화 (숫자만 추출 후 010-1234-5678 형식으로 변환)
+def normalize_phone(value):
+    if value is None:
+        return None
+
+    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    if not digits:
+        return None
+
+    # 국가번호(+82) 제거
+    if digits.startswith("82") and len(digits) >= 11:
+        digits = "0" + digits[2:]
+
+    if digits.startswith("02") and len(digits) in (9, 10):
+        return f"02-{digits[2:-4]}-{digits[-4:]}"
+
+    if digits.startswith("0") and len(digits) in (10, 11):
+        return f"{digits[:3]}-{digits[3:-4]}-{digits[-4:]}"
+
+    raise ValueError(f"phone 형식이 올바르지 않습니다: {value}")
+
+# 생년월일 정규화 (YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD, YYYYMMDD 허용)
+def normalize_birth_date(value):
+    if value is None or isinstance(value, (date, datetime)):
+        return parse_date(value, "birth_date") if value else None
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    for separator in (".", "/"):
+        text = text.replace(separator, "-")
+    text = text.strip("-")
+
+    if len(text) == 8 and text.isdigit():
+        text = f"{text[:4]}-{text[4:6]}-{text[6:]}"
+
+    return parse_date(text, "birth_date")
@@ -1,20 +1,34 @@
-from .database import execute_query
+from .database import execute_query, execute_write, iter_query, bulk_insert, transaction
+from .rollup import days_of_visits, refresh_daily_stats
+from .summary import customers_of_visits, refresh_customer_summary
+from .config import Config
+from .pagination import fetch_page, clamp_limit
+from .validators import require, optional_text, parse_datetime, parse_int
+from .metrics import timed
 
 # 방문 등록
+@timed
 def create_visit(customer_id, visit_data):
     query = """
     INSERT INTO visit (customer_id, visit_date, memo)
     VALUES (%s, %s, %s)
     """
 
-    values = (
-        customer_id,
-        visit_data["visit_date"],
-        visit_data["memo"]
-    )
-
     try:
-        execute_query(query, values)
+        # datetime-local 입력('YYYY-MM-DDTHH:MM') 등 문자열 일시는 datetime 으로 변환 (잘못된 형식은 ValueError)
+        values = (
+            customer_id,
+            parse_datetime(visit_data["visit_date"], "visit_date"),
+            visit_data["memo"]
+        )
+
+        # 방문 등록과 일별 집계/고객 요약 갱신을 한 트랜잭션으로 처리
+        with transaction():
+            result = execute_write(query, values)
+            if result:
+                refresh_daily_stats(days_of_visits([result["lastrowid"]]))
+                refresh_customer_summary([customer_id])
+
         print(f"방문 등록 성공: 고객 ID {customer_id}")
 
         return True
@@ -24,44 +38,178 @@ def create_visit(customer_id, visit_data):
 
         return False
 
+# 방문 일괄 등록용 파라미터 변환 (잘못된 값은 ValueError)
+def _visit_values(visit_data):
+    return (
+        parse_int(require(visit_data, "customer_id"), "customer_id", 1),
+        parse_datetime(require(visit_data, "visit_date"), "visit_date"),
+        optional_text(visit_data.get("memo"), "memo")
+    )
+
+# 일괄 등록 청크의 일별 집계 / 고객 요약 갱신 (청크와 같은 트랜잭션, 실패 시 청크 롤백)
+def _refresh_rollups(visit_ids):
+    refresh_daily_stats(days_of_visits(visit_ids))
+    refresh_customer_summary(customers_of_visits(visit_ids))
+
+# 방문 일괄 등록
+@timed
+def create_visits_bulk(visits, chunk_size=None):
+    """
+    여러 방문 기록을 청크 단위 다중 행 INSERT로 등록
+
+    Args:
+        visits (iterable): create_visit 의 visit_data 에 customer_id 를 포함한 데이터
+        chunk_size (int, optional): 청크 크기 (기본값: Config.DB_BULK_CHUNK_SIZE)
+
+    Returns:
+        dict: {"ids": 입력 순서대로 생성된 방문 ID (실패 시 None),
+               "errors": [{"index": 입력 순번, "error": 오류 메시지}]}
+    """
+    query = """
+    INSERT INTO visit (customer_id, visit_date, memo)
+    VALUES (%s, %s, %s)
+    """
+
+    result = bulk_insert(query, visits, _visit_values, chunk_size, on_chunk=_refresh_rollups)
+    print(f"방문 일괄 등록: 성공 {len(result['ids']) - len(result['errors'])}건, 실패 {len(result['errors'])}건")
+
+    return result
+
+# 전체 방문 기록 쿼리 (app/async_queries.py 와 공용)
+ALL_VISITS_QUERY = """
+SELECT v.*, c.name as customer_name
+FROM visit v
+JOIN customer c ON v.customer_id = c.customer_id
+ORDER BY visit_date DESC
+"""
+
 # 전체 방문 기록 조회
+@timed
 def get_visits():
+    result = execute_query(ALL_VISITS_QUERY, fetch_all=True, cache=True)
+    return result if result is not None else []
+
+# 최근 방문 기록 조회 (방문일 인덱스 역순 스캔, 방문 테이블 크기와 무관)
+@timed
+def get_recent_visits(limit=None, before=None):
+    """
+    Args:
+        limit (int, optional): 조회 건수 (기본값: Config.RECENT_LIMIT)
+        before (datetime, optional): 이 시각 이전 방문만 조회 (더 보기용, 생략 시 최신부터)
+
+    Returns:
+        list: 최신순 방문 기록 (customer_name 포함)
+    """
+    query, params = _recent_visits_query(limit, before)
+
+    result = execute_query(query, params, fetch_all=True)
+    return result if result is not None else []
+
+# 최근 방문 기록 쿼리와 파라미터 (app/async_queries.py 와 공용)
+def _recent_visits_query(limit, before):
     query = """
     SELECT v.*, c.name as customer_name
     FROM visit v
     JOIN customer c ON v.customer_id = c.customer_id
-    ORDER BY visit_date DESC
     """
+    params = ()
 
-    result = execute_query(query, fetch_all=True)
-    return result if result is not None else []
+    if before is not None:
+        query += "WHERE v.visit_date < %s\n"
+        params = (before,)
 
-# 고객별 방문 기록 조회
-def get_visits_by_customer(customer_id):
-    query = """
-    SELECT v.*, c.name as customer_name 
+    query += "ORDER BY v.visit_date DESC, v.visit_id DESC LIMIT %s"
+
+    return query, params + (clamp_limit(limit or Config.RECENT_LIMIT),)
+
+# 방문 기록 페이지 쿼리와 키셋 컬럼 (app/async_queries.py 와 공용)
+VISITS_PAGE_SELECT = """
+    SELECT v.*, c.name as customer_name
     FROM visit v
-    JOIN customer c ON v.customer_id = c.customer_id
-    WHERE v.customer_id = %s 
-    ORDER BY v.visit_date DESC
+    JOIN customer c ON v.customer_id = c.customer_id"""
+VISITS_PAGE_COLUMNS = [("v.visit_date", "visit_date"), ("v.visit_id", "visit_id")]
+
+# 방문 기록 페이지 조회 (최신순, 키셋 페이지네이션)
+@timed
+def get_visits_page(limit=None, after=None, before=None, start_date=None, end_date=None):
+    """
+    Args:
+        limit (int, optional): 페이지 크기
+        after (str, optional): 다음 페이지 커서
+        before (str, optional): 이전 페이지 커서
+        start_date (str, optional): 기간 시작일 (end_date 와 함께 사용)
+        end_date (str, optional): 기간 종료일
+
+    Returns:
+        dict: {"items", "next_cursor", "prev_cursor", "limit"}
     """
+    where, params = _visit_period(start_date, end_date)
+
+    return fetch_page(VISITS_PAGE_SELECT, VISITS_PAGE_COLUMNS, descending=True, where=where, params=params,
+                      limit=limit, after=after, before=before)
+
+# 방문 기간 조건과 파라미터 (시작일/종료일이 모두 있을 때만)
+def _visit_period(start_date, end_date):
+    if start_date and end_date:
+        return ["v.visit_date BETWEEN %s AND %s"], (start_date, end_date)
+
+    return [], ()
+
+# 방문 기록 스트리밍 조회 (내보내기용, 기간 지정 가능)
+@timed
+def iter_visits(start_date=None, end_date=None):
+    query, params = _export_visits_query(start_date, end_date)
+
+    yield from iter_query(query, params)
+
+# 방문 기록 내보내기 쿼리와 파라미터 (app/async_queries.py 와 공용)
+def _export_visits_query(start_date, end_date):
+    where, params = _visit_period(start_date, end_date)
+
+    query = VISITS_PAGE_SELECT + "\n"
+    if where:
+        query += f"    WHERE {where[0]}\n"
+    query += "    ORDER BY v.visit_date DESC, v.visit_id DESC"
 
-    result = execute_query(query, (customer_id,), fetch_all=True)
+    return query, params
+
+# 고객별 방문 기록 쿼리 (app/async_queries.py 와 공용)
+VISITS_BY_CUSTOMER_QUERY = """
+SELECT v.*, c.name as customer_name 
+FROM visit v
+JOIN customer c ON v.customer_id = c.customer_id
+WHERE v.customer_id = %s 
+ORDER BY v.visit_date DESC
+"""
+
+# 고객별 방문 기록 조회
+@timed
+def get_visits_by_customer(customer_id):
+    result = execute_query(VISITS_BY_CUSTOMER_QUERY, (customer_id,), fetch_all=True)
     return result if result is not None else []
 
-def get_visit_by_visit_id(visit_id):
-    query = "SELECT * FROM visit WHERE visit_id = %s"
+# 방문 단건 조회 쿼리 (app/async_queries.py 와 공용)
+VISIT_BY_ID_QUERY = "SELECT * FROM visit WHERE visit_id = %s"
 
-    return execute_query(query, (visit_id,), fetch_one=True)
+@timed
+def get_visit_by_visit_id(visit_id):
+    return execute_query(VISIT_BY_ID_QUERY, (visit_id,), fetch_one=True)
 
 # 방문 기록 수정
+@timed
 def update_visit(visit_id, visit_data):
     query = """
     UPDATE visit SET visit_date = %s, memo = %s WHERE visit_id = %s
     """
 
     try:
-        execute_query(query, (visit_data["visit_date"], visit_data["memo"], visit_id))
+        # 방문일이 바뀌면 이전 날짜와 새 날짜의 집계를 모두 갱신
+        with transaction():
+            days = days_of_visits([visit_id])
+            execute_query(query, (parse_datetime(visit_data["visit_date"], "visit_date"), visit_data["memo"], visit_id))
+            refresh_daily_stats(days | days_of_visits([visit_id]))
+            refresh_customer_summary(customers_of_visits([visit_id]))
+
         print(f"방문 기록 수정 성공: 방문 ID {visit_id}")
 
         return True
@@ -72,11 +220,18 @@ def update_visit(visit_id, visit_data):
         return False
 
 # 방문 기록 삭제
+@timed
 def delete_visit(visit_id):
     query = "DELETE FROM visit WHERE visit_id = %s"
 
     try:
-        execute_query(query, (visit_id,))
+        with transaction():
+            days = days_of_visits([visit_id])
+            customers = customers_of_visits([visit_id])
+            execute_query(query, (visit_id,))
+            refresh_daily_stats(days)
+            refresh_customer_summary(customers)
+
         print(f"방문 기록 삭제 성공: 방문 ID {visit_id}")
         
         return True
@@ -86,17 +241,19 @@ def delete_visit(visit_id):
 
         return False
     
+# 기간별 방문 기록 쿼리 (app/async_queries.py 와 공용)
+VISITS_BY_DATE_RANGE_QUERY = """
+SELECT v.*, c.name as customer_name
+FROM visit v
+JOIN customer c ON v.customer_id = c.customer_id
+WHERE v.visit_date BETWEEN %s AND %s
+ORDER BY v.visit_date DESC
+"""
+
 # 기간별 방문 기록 조회
+@timed
 def get_visits_by_date_range(start_date, end_date):
-    query = """
-    SELECT v.*, c.name as customer_name
-    FROM visit v
-    JOIN customer c ON v.customer_id = c.customer_id
-    WHERE v.visit_date BETWEEN %s AND %s
-    ORDER BY v.visit_date DESC
-    """
-
-    result = execute_query(query, (start_date, end_date), fetch_all=True)
+    result = execute_query(VISITS_BY_DATE_RANGE_QUERY, (start_date, end_date), fetch_all=True)
     return result if result is not None else []
 
 
@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import async_database, async_queries, database
+from app.config import Config
+from app.customer import get_customer_by_customer
+from app.fanout import Call, fan_out
+from app.payment import get_payments_by_customer
+from app.stats import get_customer_statistics
+from app.visit import get_visits_by_customer
+
+"""
+동기/비동기 데이터 계층 처리량 비교
+
+동시 클라이언트 N개가 각각 고객 상세 화면 조회(고객, 통계, 방문, 결제 4회)를 반복하고
+초당 처리 화면 수와 화면당 지연 시간(p50/p95)을 측정합니다.
+
+- sync   : 클라이언트마다 스레드 1개, 4회 조회를 순서대로 실행 (기존 동기 뷰)
+- fanout : 클라이언트마다 스레드 1개, app.fanout 으로 4회 조회를 동시에 실행
+- async  : 한 이벤트 루프에서 클라이언트마다 Task 1개, asyncio.gather 로 동시에 실행
+
+두 방식 모두 최대 연결 수는 DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW 입니다.
+쿼리 결과 캐시는 끄고 측정합니다.
+
+사용법:
+    python -m benchmarks.async_vs_sync --clients 100 --requests 20            # 로컬 MySQL (async 는 aiomysql 필요)
+    python -m benchmarks.async_vs_sync --clients 200 --stand-in 5             # MySQL 대신 쿼리당 5ms 지연으로 대체
+    python -m benchmarks.async_vs_sync --modes sync async --json report.json
+"""
+
+MODES = ("sync", "fanout", "async")
+
+
+def install_stand_in(latency, connections):
+    """
+    실제 DB 대신 쿼리마다 latency 초 대기하는 대체 실행기 설치
+
+    연결 수 제한은 동기는 스레드 세마포어, 비동기는 asyncio 세마포어로 흉내 냅니다.
+    반환값은 오류 시 기본값과 같으므로 화면 조회 코드는 그대로 실행됩니다.
+    """
+    slots = threading.BoundedSemaphore(connections)
+    async_slots = {}
+
+    def run_statement(operation, default=None, query=None):
+        with slots:
+            time.sleep(latency)
+        return default
+
+    async def async_run_statement(operation, default=None):
+        loop = asyncio.get_running_loop()
+        semaphore = async_slots.setdefault(loop, asyncio.Semaphore(connections))
+        async with semaphore:
+            await asyncio.sleep(latency)
+        return default
+
+    database._run_statement = run_statement
+    async_database._run_statement = async_run_statement
+
+def sync_detail(customer_id):
+    return {
+        "customer": get_customer_by_customer(customer_id),
+        "stats": get_customer_statistics(customer_id),
+        "visits": get_visits_by_customer(customer_id),
+        "payments": get_payments_by_customer(customer_id)
+    }
+
+def fanout_detail(customer_id):
+    return fan_out({
+        "customer": Call(get_customer_by_customer, customer_id),
+        "stats": Call(get_customer_statistics, customer_id),
+        "visits": Call(get_visits_by_customer, customer_id, default=[]),
+        "payments": Call(get_payments_by_customer, customer_id, default=[])
+    })
+
+def _summary(mode, clients, latencies, elapsed):
+    latencies = sorted(latencies)
+    return {
+        "mode": mode,
+        "clients": clients,
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2)
+    }
+
+def run_threads(mode, detail, clients, requests, customers):
+    latencies = []
+    lock = threading.Lock()
+
+    def client(index):
+        for n in range(requests):
+            started = time.perf_counter()
+            detail((index * requests + n) % customers + 1)
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(client, range(clients)))
+
+    return _summary(mode, clients, latencies, time.perf_counter() - started)
+
+async def _run_tasks(clients, requests, customers):
+    latencies = []
+
+    async def client(index):
+        for n in range(requests):
+            started = time.perf_counter()
+            await async_queries.customer_detail((index * requests + n) % customers + 1)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    await async_database.close_async_pool()
+    return latencies, elapsed
+
+def run_async(clients, requests, customers):
+    latencies, elapsed = asyncio.run(_run_tasks(clients, requests, customers))
+    return _summary("async", clients, latencies, elapsed)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동기/비동기 데이터 계층 처리량 비교")
+    parser.add_argument("--clients", type=int, default=100, help="동시 클라이언트 수 (기본값: 100)")
+    parser.add_argument("--requests", type=int, default=20, help="클라이언트당 화면 조회 횟수 (기본값: 20)")
+    parser.add_argument("--customers", type=int, default=100, help="조회할 고객 ID 범위 1..N (기본값: 100)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--stand-in", type=float, metavar="MS", help="MySQL 대신 쿼리당 MS 밀리초 지연으로 대체")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    Config.QUERY_CACHE_ENABLED = False
+    connections = Config.DB_POOL_SIZE + Config.DB_POOL_MAX_OVERFLOW
+
+    if args.stand_in is not None:
+        install_stand_in(args.stand_in / 1000, connections)
+    elif "async" in args.modes and not async_database.AIOMYSQL_AVAILABLE:
+        print("[ERROR] async 측정에는 aiomysql 이 필요합니다 (pip install aiomysql) - async 제외")
+        args.modes = [mode for mode in args.modes if mode != "async"]
+
+    print(f"[BENCH] 클라이언트 {args.clients}개 x {args.requests}회, 최대 연결 {connections}개, "
+          f"{'대체 실행기 ' + str(args.stand_in) + 'ms' if args.stand_in is not None else 'MySQL'}")
+
+    results = []
+    for mode in args.modes:
+        if mode == "async":
+            result = run_async(args.clients, args.requests, args.customers)
+        else:
+            detail = sync_detail if mode == "sync" else fanout_detail
+            result = run_threads(mode, detail, args.clients, args.requests, args.customers)
+
+        results.append(result)
+        print(f"[BENCH] {mode:<6} {result['throughput_rps']:>9.1f} 화면/초  "
+              f"p50 {result['p50_ms']:>8.2f}ms  p95 {result['p95_ms']:>8.2f}ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from app.database import bulk_insert, execute_query, transaction
+from app.rollup import rebuild_daily_stats
+from app.summary import refresh_customer_summary
+
+"""
+벤치마크용 합성 데이터 생성기
+
+같은 시드/규모/기준일이면 항상 같은 고객, 방문, 결제 데이터를 만듭니다.
+고객마다 시드에서 파생한 별도 난수 생성기를 쓰므로 청크 크기와 관계없이 결과가 같고,
+고객 단위로 생성/등록하므로 1천 건에서 1천만 건까지 메모리 사용량이 일정합니다.
+
+분포 (실제 매장 데이터와 비슷한 치우침):
+- 방문 횟수: 15% 는 방문 기록 없음, 나머지는 파레토 분포 (소수 단골이 방문 대부분을 차지)
+- 방문일: 기준일에 가까울수록 많음 (매장 성장), 주말 가중, 영업시간(10~21시)
+- 결제: 방문의 85% 는 1건, 5% 는 분할 결제 2건, 금액은 로그 정규 분포 (1천원 단위)
+- 결제 수단: 카드 60%, 현금 20%, 계좌이체 12%, 포인트 8%
+
+사용법:
+    python -m benchmarks.datagen --rows 100k --reset          # 약 10만 행 (고객+방문+결제)
+    python -m benchmarks.datagen --rows 10m --seed 7 --end 2026-01-01
+"""
+
+SURNAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권")
+SURNAME_WEIGHTS = (21, 15, 8, 5, 4, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1)
+GIVEN_SYLLABLES = "민서준지현우하윤도예수아은영호진성연주희태경동혜나"
+MEMOS = ("VIP", "재방문 의사 있음", "주차 요청", "알레르기 주의", "예약 선호")
+
+PAYMENT_METHODS = ("CARD", "CASH", "TRANSFER", "POINT")
+PAYMENT_METHOD_WEIGHTS = (60, 20, 12, 8)
+
+NO_VISIT_RATIO = 0.15
+VISIT_PARETO_ALPHA = 1.3
+MAX_VISITS = 500
+SPLIT_PAYMENT_RATIO = 0.05
+NO_PAYMENT_RATIO = 0.10
+
+# 고객 1명당 평균 행 수 (고객 1 + 방문 약 2.9 + 결제 약 2.8, 시드 42 고객 2만 명 기준) - --rows 를 고객 수로 환산
+ROWS_PER_CUSTOMER = 6.7
+
+DEFAULT_SEED = 42
+DEFAULT_END = date(2026, 1, 1)
+DEFAULT_DAYS = 730
+
+_SCALE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_rows(value):
+    """'1k', '250k', '10m', '5000' 형식의 행 수"""
+    value = str(value).strip().lower()
+    multiplier = _SCALE_SUFFIXES.get(value[-1:], 1)
+    number = value[:-1] if multiplier != 1 else value
+    return int(float(number) * multiplier)
+
+def customers_for_rows(rows):
+    """전체 행 수(고객+방문+결제) 목표에 맞는 고객 수"""
+    return max(1, round(rows / ROWS_PER_CUSTOMER))
+
+def customer_rng(seed, index):
+    """고객별 난수 생성기 (시드와 순번만으로 결정)"""
+    return random.Random(f"{seed}:{index}")
+
+def _phone(index):
+    # 7919 는 10^8 과 서로소이므로 1억 명까지 번호가 겹치지 않음
+    number = (index * 7919 + 12345678) % 100_000_000
+    return f"010-{number // 10000:04d}-{number % 10000:04d}"
+
+def make_customer(index, rng, end=DEFAULT_END):
+    """순번 index 고객 데이터"""
+    surname = rng.choices(SURNAMES, SURNAME_WEIGHTS)[0]
+    given = "".join(rng.choice(GIVEN_SYLLABLES) for _ in range(2))
+    age_days = rng.randint(18 * 365, 80 * 365)
+
+    return {
+        "name": surname + given,
+        "phone": _phone(index),
+        "birth_date": end - timedelta(days=age_days),
+        "gender": rng.choice(("M", "F")),
+        "memo": rng.choice(MEMOS) if rng.random() < 0.2 else None
+    }
+
+def visit_count(rng):
+    """고객 한 명의 방문 횟수 (대부분 적고 소수가 매우 많음)"""
+    if rng.random() < NO_VISIT_RATIO:
+        return 0
+    return min(int(rng.paretovariate(VISIT_PARETO_ALPHA)), MAX_VISITS)
+
+def make_visit_datetime(rng, end=DEFAULT_END, days=DEFAULT_DAYS):
+    """기준일 직전 days 일 중 방문 일시 (최근/주말/영업시간 가중)"""
+    while True:
+        offset = int(rng.triangular(0, days, 0))  # 최근 날짜일수록 많음
+        day = end - timedelta(days=offset + 1)
+        # 평일 방문은 일부 건너뛰어 주말 비중을 높임
+        if day.weekday() >= 5 or rng.random() < 0.7:
+            break
+
+    hour = min(int(rng.gauss(15, 3)), 20)
+    return datetime(day.year, day.month, day.day, max(hour, 10), rng.randrange(60), rng.randrange(60))
+
+def make_payments(rng, visit_datetime):
+    """방문 한 건의 결제 목록 (없음 / 1건 / 분할 2건)"""
+    roll = rng.random()
+    if roll < NO_PAYMENT_RATIO:
+        return []
+
+    count = 2 if roll > 1 - SPLIT_PAYMENT_RATIO else 1
+    payments = []
+    for n in range(count):
+        amount = max(1000, int(round(math.exp(rng.gauss(10.6, 0.6)) / count, -3)))
+        payments.append({
+            "amount": amount,
+            "payment_method_code": rng.choices(PAYMENT_METHODS, PAYMENT_METHOD_WEIGHTS)[0],
+            "payment_datetime": visit_datetime + timedelta(minutes=30 + 5 * n + rng.randrange(60))
+        })
+
+    return payments
+
+def generate(customers, seed=DEFAULT_SEED, end=DEFAULT_END, days=DEFAULT_DAYS, start_index=0):
+    """
+    고객 단위 합성 데이터 생성기
+
+    Yields:
+        tuple: (고객 데이터, [(방문 일시, [결제 데이터])])  - 방문은 일시 순
+    """
+    for index in range(start_index, start_index + customers):
+        rng = customer_rng(seed, index)
+        customer = make_customer(index, rng, end)
+        visit_times = sorted(make_visit_datetime(rng, end, days) for _ in range(visit_count(rng)))
+        yield customer, [(visited_at, make_payments(rng, visited_at)) for visited_at in visit_times]
+
+
+def _to_row(*columns):
+    return lambda record: tuple(record[column] for column in columns)
+
+def _insert_chunk(chunk):
+    """고객 청크와 그 방문/결제 등록 (한 트랜잭션), 등록 행 수 반환"""
+    with transaction():
+        customer_ids = bulk_insert(
+            "INSERT INTO customer (name, phone, birth_date, gender, memo) VALUES (%s, %s, %s, %s, %s)",
+            [customer for customer, _ in chunk],
+            _to_row("name", "phone", "birth_date", "gender", "memo")
+        )["ids"]
+
+        visits = [
+            {"customer_id": customer_id, "visit_date": visited_at, "memo": None, "payments": payments}
+            for customer_id, (_, customer_visits) in zip(customer_ids, chunk) if customer_id
+            for visited_at, payments in customer_visits
+        ]
+        visit_ids = bulk_insert(
+            "INSERT INTO visit (customer_id, visit_date, memo) VALUES (%s, %s, %s)",
+            visits, _to_row("customer_id", "visit_date", "memo")
+        )["ids"]
+
+        payments = [
+            dict(payment, visit_id=visit_id)
+            for visit_id, visit in zip(visit_ids, visits) if visit_id
+            for payment in visit["payments"]
+        ]
+        payment_ids = bulk_insert(
+            "INSERT INTO payment (visit_id, amount, payment_method_code, payment_datetime) VALUES (%s, %s, %s, %s)",
+            payments, _to_row("visit_id", "amount", "payment_method_code", "payment_datetime")
+        )["ids"]
+
+    return sum(1 for row_id in customer_ids + visit_ids + payment_ids if row_id)
+
+def reset():
+    """기존 고객/방문/결제와 집계 테이블 비우기 (결제 수단 코드는 유지)"""
+    with transaction():
+        for table in ("payment", "visit", "customer_summary", "customer", "daily_stats"):
+            execute_query(f"DELETE FROM {table}")
+
+def load(customers, seed=DEFAULT_SEED, end=DEFAULT_END, days=DEFAULT_DAYS, chunk_size=1000, progress=None):
+    """
+    합성 데이터를 청크 단위로 등록한 뒤 일별 집계/고객 요약을 한 번에 재계산
+
+    Returns:
+        dict: {"customers": 고객 수, "rows": 등록 행 수, "elapsed_s": 소요 시간}
+    """
+    started = time.perf_counter()
+    rows = 0
+    chunk = []
+
+    for record in generate(customers, seed, end, days):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            rows += _insert_chunk(chunk)
+            chunk = []
+            if progress:
+                progress(rows)
+
+    if chunk:
+        rows += _insert_chunk(chunk)
+
+    # 건별 갱신 대신 마지막에 전체 재계산
+    rebuild_daily_stats()
+    refresh_customer_summary()
+
+    return {"customers": customers, "rows": rows, "elapsed_s": round(time.perf_counter() - started, 3)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--rows", default="10k", help="전체 행 수 목표 (고객+방문+결제, 예: 1k, 100k, 10m / 기본값: 10k)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"난수 시드 (기본값: {DEFAULT_SEED})")
+    parser.add_argument("--end", type=date.fromisoformat, default=DEFAULT_END, help="기준일 YYYY-MM-DD (방문은 이 날 이전)")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help=f"방문 기간 (일, 기본값: {DEFAULT_DAYS})")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 트랜잭션으로 등록할 고객 수 (기본값: 1000)")
+    parser.add_argument("--reset", action="store_true", help="등록 전 기존 고객/방문/결제 삭제")
+    args = parser.parse_args(argv)
+
+    customers = customers_for_rows(parse_rows(args.rows))
+
+    if args.reset:
+        reset()
+
+    print(f"[DATAGEN] 고객 {customers}명 (시드 {args.seed}, 기준일 {args.end}) 생성 중...")
+    result = load(customers, args.seed, args.end, args.days, args.chunk_size,
+                  progress=lambda rows: print(f"[DATAGEN] {rows}행 등록"))
+    print(f"[DATAGEN] 완료: {result['rows']}행, {result['elapsed_s']}초")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
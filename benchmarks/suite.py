@@ -0,0 +1,405 @@
+import argparse
+import inspect
+import itertools
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from app import customer, payment, stats, visit
+from app.config import Config
+from app.database import execute_query, get_query_stats, transaction
+from benchmarks import datagen
+
+"""
+데이터 계층 / 화면 벤치마크 모음
+
+app/customer.py, app/visit.py, app/payment.py, app/stats.py 의 모든 공개 함수와
+주요 GET 화면(Flask test client)을 같은 데이터에서 반복 실행하고
+호출당 지연 시간(평균, p50/p95/p99)과 쿼리 수를 JSON 보고서로 남깁니다.
+
+- 데이터: benchmarks/datagen.py 로 만든 합성 데이터 (보고서에 행 수/시드 기록)
+- 변경 함수(create/update/delete)는 트랜잭션 안에서 실행 후 롤백하므로 데이터가 바뀌지 않음
+  (롤백 시간 포함, 커밋 후 처리(after_commit)는 실행되지 않음)
+- 전체 조회 함수와 내보내기 화면은 --heavy-iterations 만큼만 실행
+- 스트리밍 조회(iter_*)는 --stream-limit 행까지만 읽음
+- 쿼리 결과 캐시는 끄고 측정 (--cache 로 켬)
+
+새 공개 함수를 추가하면 FUNCTION_CASES 에도 추가해야 합니다 (누락 시 경고, 테스트 실패).
+
+사용법:
+    python -m benchmarks.datagen --rows 100k --reset
+    python -m benchmarks.suite --json before.json
+    python -m benchmarks.suite --json after.json --compare before.json    # p50 이 20% 이상 느려지면 종료 코드 1
+    python -m benchmarks.suite --only stats. --iterations 50
+    python -m benchmarks.suite --stand-in 1 --iterations 3                 # MySQL 없이 실행 경로만 확인
+"""
+
+MODULES = (customer, visit, payment, stats)
+SEARCH_TERMS = ("김민", "이서", "박", "1234", "010-12", "5678")
+SAMPLE_SIZE = 64
+
+
+class Dataset:
+    """벤치마크 대상 데이터의 행 수와 시드 기반으로 고정한 표본 ID"""
+
+    def __init__(self, seed=datagen.DEFAULT_SEED, end=datagen.DEFAULT_END, stream_limit=1000):
+        self.seed = seed
+        self.end = datetime(end.year, end.month, end.day)
+        self.stream_limit = stream_limit
+        self.rows = {}
+
+        rng = random.Random(seed)
+        self.ids = {}
+        for table, key in (("customer", "customer_id"), ("visit", "visit_id"), ("payment", "payment_id")):
+            row = execute_query(f"SELECT COUNT(*) AS n, MIN({key}) AS lo, MAX({key}) AS hi FROM {table}",
+                                fetch_one=True) or {}
+            self.rows[table] = row.get("n") or 0
+            lo, hi = row.get("lo") or 1, row.get("hi") or 1
+            self.ids[table] = [rng.randint(lo, hi) for _ in range(SAMPLE_SIZE)]
+
+    def pick(self, table, i):
+        return self.ids[table][i % SAMPLE_SIZE]
+
+    def customer_data(self, i):
+        # 기존 고객과 겹치지 않는 순번의 합성 고객
+        return datagen.make_customer(10 ** 8 + i, datagen.customer_rng(self.seed, -i - 1), self.end.date())
+
+    def visit_datetime(self, i):
+        return self.end - timedelta(days=i % 30 + 1, hours=3)
+
+    def payment_data(self, i):
+        return {"amount": 10000 + 1000 * (i % 50), "payment_method_code": datagen.PAYMENT_METHODS[i % 4],
+                "payment_datetime": self.visit_datetime(i)}
+
+
+@contextmanager
+def rolled_back():
+    """블록 안의 변경을 모두 롤백하는 트랜잭션"""
+    with transaction() as uow:
+        yield
+        uow.failed = True
+
+def _write(func):
+    """변경 함수 실행 (롤백)"""
+    def run(ds, i):
+        with rolled_back():
+            return func(ds, i)
+    return run
+
+def _stream(func):
+    """스트리밍 조회는 stream_limit 행까지만 읽고 닫음"""
+    def run(ds, i):
+        rows = func(ds, i)
+        try:
+            return sum(1 for _ in itertools.islice(rows, ds.stream_limit))
+        finally:
+            rows.close()
+    return run
+
+def _heavy(run):
+    run.heavy = True
+    return run
+
+
+# 함수 이름("모듈.함수") -> 실행 방법 (ds: Dataset, i: 반복 순번)
+FUNCTION_CASES = {
+    # 고객
+    "customer.create_customer": _write(lambda ds, i: customer.create_customer(ds.customer_data(i))),
+    "customer.create_customers_bulk": _write(
+        lambda ds, i: customer.create_customers_bulk([ds.customer_data(i * 100 + n) for n in range(100)])),
+    "customer.get_all_customers": _heavy(lambda ds, i: customer.get_all_customers()),
+    "customer.get_customers_page": lambda ds, i: customer.get_customers_page(),
+    "customer.iter_customers": _stream(lambda ds, i: customer.iter_customers()),
+    "customer.get_customer_by_customer": lambda ds, i: customer.get_customer_by_customer(ds.pick("customer", i)),
+    "customer.search_customers": lambda ds, i: customer.search_customers(SEARCH_TERMS[i % len(SEARCH_TERMS)]),
+    "customer.update_customer": _write(lambda ds, i: customer.update_customer(
+        dict(ds.customer_data(i), customer_id=ds.pick("customer", i)))),
+    "customer.delete_customer": _write(lambda ds, i: customer.delete_customer(ds.pick("customer", i))),
+    "customer.get_customer_by_birth_month": _heavy(lambda ds, i: customer.get_customer_by_birth_month(i % 12 + 1)),
+    "customer.get_upcoming_birthdays": lambda ds, i: customer.get_upcoming_birthdays(
+        Config.BIRTHDAY_WINDOW_DAYS, today=ds.end.date()),
+
+    # 방문
+    "visit.create_visit": _write(lambda ds, i: visit.create_visit(
+        ds.pick("customer", i), {"visit_date": ds.visit_datetime(i), "memo": None})),
+    "visit.create_visits_bulk": _write(lambda ds, i: visit.create_visits_bulk([
+        {"customer_id": ds.pick("customer", i + n), "visit_date": ds.visit_datetime(n), "memo": None}
+        for n in range(100)])),
+    "visit.get_visits": _heavy(lambda ds, i: visit.get_visits()),
+    "visit.get_recent_visits": lambda ds, i: visit.get_recent_visits(),
+    "visit.get_visits_page": lambda ds, i: visit.get_visits_page(),
+    "visit.iter_visits": _stream(lambda ds, i: visit.iter_visits()),
+    "visit.get_visits_by_customer": lambda ds, i: visit.get_visits_by_customer(ds.pick("customer", i)),
+    "visit.get_visit_by_visit_id": lambda ds, i: visit.get_visit_by_visit_id(ds.pick("visit", i)),
+    "visit.update_visit": _write(lambda ds, i: visit.update_visit(
+        ds.pick("visit", i), {"visit_date": ds.visit_datetime(i), "memo": "벤치마크"})),
+    "visit.delete_visit": _write(lambda ds, i: visit.delete_visit(ds.pick("visit", i))),
+    "visit.get_visits_by_date_range": lambda ds, i: visit.get_visits_by_date_range(
+        ds.end - timedelta(days=7), ds.end),
+
+    # 결제
+    "payment.create_payment": _write(lambda ds, i: payment.create_payment(ds.pick("visit", i), ds.payment_data(i))),
+    "payment.create_payments_bulk": _write(lambda ds, i: payment.create_payments_bulk([
+        dict(ds.payment_data(n), visit_id=ds.pick("visit", i + n)) for n in range(100)])),
+    "payment.get_all_payments": _heavy(lambda ds, i: payment.get_all_payments()),
+    "payment.get_recent_payments": lambda ds, i: payment.get_recent_payments(),
+    "payment.get_payments_page": lambda ds, i: payment.get_payments_page(),
+    "payment.iter_all_payments": _stream(lambda ds, i: payment.iter_all_payments()),
+    "payment.get_payments_by_customer": lambda ds, i: payment.get_payments_by_customer(ds.pick("customer", i)),
+    "payment.update_payment": _write(lambda ds, i: payment.update_payment(
+        dict(ds.payment_data(i), payment_id=ds.pick("payment", i)))),
+    "payment.delete_payment": _write(lambda ds, i: payment.delete_payment(ds.pick("payment", i))),
+    "payment.get_payment_methods": lambda ds, i: payment.get_payment_methods(),
+    "payment.get_payment_method_names": lambda ds, i: payment.get_payment_method_names(),
+
+    # 통계
+    "stats.get_total_visits_by_customer": lambda ds, i: stats.get_total_visits_by_customer(ds.pick("customer", i)),
+    "stats.get_total_payment_by_customer": lambda ds, i: stats.get_total_payment_by_customer(ds.pick("customer", i)),
+    "stats.get_customer_statistics": lambda ds, i: stats.get_customer_statistics(ds.pick("customer", i)),
+    "stats.get_all_customer_statistics": lambda ds, i: stats.get_all_customer_statistics(
+        sort=("name", "total_payment", "total_visits", "avg_payment")[i % 4], order="desc"),
+    "stats.get_top_customers": lambda ds, i: stats.get_top_customers(),
+    "stats.get_overall_statistics": lambda ds, i: stats.get_overall_statistics(),
+    "stats.get_monthly_statistics": lambda ds, i: stats.get_monthly_statistics(
+        (ds.end - timedelta(days=1)).year, (ds.end - timedelta(days=1)).month),
+    "stats.get_monthly_series": lambda ds, i: stats.get_monthly_series(ds.end - timedelta(days=365), ds.end),
+    "stats.get_range_statistics": lambda ds, i: stats.get_range_statistics(
+        (ds.end - timedelta(days=30)).date(), ds.end.date()),
+    "stats.get_recent_monthly_series": lambda ds, i: stats.get_recent_monthly_series(6, today=ds.end),
+}
+
+# (이름, URL 형식, 전체 조회 여부) - GET 화면만 (POST 는 요청 트랜잭션이 커밋되므로 제외)
+ROUTE_CASES = [
+    ("home", "/", False),
+    ("customer.customer_list", "/customers", False),
+    ("customer.customer_list?search", "/customers?search={term}", False),
+    ("customer.customer_list?birth_month", "/customers?birth_month={month}", True),
+    ("customer.customer_detail", "/customers/{customer_id}", False),
+    ("customer.customer_edit", "/customers/{customer_id}/edit", False),
+    ("customer.customer_autocomplete", "/api/customers/autocomplete?q={term}", False),
+    ("customer.customer_birthday_export", "/customers/birthdays/export.csv", False),
+    ("customer.customer_export", "/customers/export.csv", True),
+    ("visit.visit_list", "/visits", False),
+    ("visit.visit_new", "/visits/new?customer_id={customer_id}", False),
+    ("visit.customer_visits_json", "/api/customers/{customer_id}/visits", False),
+    ("visit.visit_edit", "/visits/{visit_id}/edit", False),
+    ("visit.visit_export", "/visits/export.csv", True),
+    ("payment.payment_list", "/payments", False),
+    ("payment.payment_new", "/payments/new", False),
+    ("payment.payment_export", "/payments/export.csv", True),
+    ("stats.stats_dashboard", "/stats", False),
+    ("stats.stats_customers", "/stats/customers", False),
+    ("stats.stats_customers?sort", "/stats/customers?sort=total_payment&order=desc", False),
+]
+
+
+def discover():
+    """대상 모듈의 공개 함수 이름 목록 ("모듈.함수")"""
+    names = []
+    for module in MODULES:
+        short = module.__name__.rpartition(".")[2]
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("_") and func.__module__ == module.__name__:
+                names.append(f"{short}.{name}")
+    return sorted(names)
+
+def missing_cases():
+    """FUNCTION_CASES 에 없는 공개 함수 목록"""
+    return [name for name in discover() if name not in FUNCTION_CASES]
+
+def _percentile(sorted_values, q):
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def measure(name, kind, run, iterations, warmup=1):
+    """
+    run(i) 를 warmup 회 실행 후 iterations 회 측정
+
+    Returns:
+        dict: 호출당 지연 시간(ms) 통계, 호출당 쿼리 수, 오류 수
+    """
+    errors = 0
+
+    def call(i):
+        nonlocal errors
+        try:
+            if run(i) is False:
+                errors += 1
+        except Exception as e:
+            errors += 1
+            print(f"[ERROR] 벤치마크 실패 ({name}): {e}")
+
+    for i in range(warmup):
+        call(i)
+
+    queries_before = get_query_stats(top=0)["queries"]
+    latencies = []
+    for i in range(warmup, warmup + iterations):
+        started = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - started)
+    queries = get_query_stats(top=0)["queries"] - queries_before
+
+    latencies.sort()
+    return {
+        "name": name,
+        "kind": kind,
+        "iterations": iterations,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "min_ms": round(latencies[0] * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "queries_per_call": round(queries / iterations, 2),
+        "errors": errors
+    }
+
+def run_functions(ds, iterations, heavy_iterations, only=None):
+    results = []
+    for name, case in FUNCTION_CASES.items():
+        if only and only not in name:
+            continue
+
+        count = heavy_iterations if getattr(case, "heavy", False) else iterations
+        results.append(measure(name, "function", lambda i, case=case: case(ds, i), count))
+
+    return results
+
+def run_routes(ds, iterations, heavy_iterations, only=None):
+    from main import app
+
+    client = app.test_client()
+    results = []
+
+    for name, url, heavy in ROUTE_CASES:
+        name = f"route:{name}"
+        if only and only not in name:
+            continue
+
+        def run(i, url=url):
+            path = url.format(term=SEARCH_TERMS[i % len(SEARCH_TERMS)], month=i % 12 + 1,
+                              customer_id=ds.pick("customer", i), visit_id=ds.pick("visit", i))
+            response = client.get(path)
+            response.get_data()  # 스트리밍 응답까지 모두 읽음
+            return response.status_code < 400
+
+        results.append(measure(name, "route", run, heavy_iterations if heavy else iterations))
+
+    return results
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+def compare(results, baseline, threshold):
+    """
+    기준 보고서 대비 p50 변화 출력
+
+    Returns:
+        list: threshold 비율 이상 느려진 항목 이름
+    """
+    previous = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+
+    for result in results:
+        before = previous.get(result["name"])
+        if not before or not before["p50_ms"]:
+            continue
+
+        ratio = result["p50_ms"] / before["p50_ms"]
+        mark = ""
+        if ratio >= 1 + threshold:
+            mark = "  <- 느려짐"
+            regressions.append(result["name"])
+        elif ratio <= 1 - threshold:
+            mark = "  <- 빨라짐"
+
+        print(f"[COMPARE] {result['name']:<45} {before['p50_ms']:>9.3f} -> {result['p50_ms']:>9.3f}ms "
+              f"({ratio:>5.2f}x){mark}")
+
+    return regressions
+
+def run(args):
+    """벤치마크 실행 후 보고서(dict) 반환"""
+    if not args.cache:
+        Config.QUERY_CACHE_ENABLED = False
+
+    ds = Dataset(args.seed, args.end, args.stream_limit)
+    missing = missing_cases()
+    for name in missing:
+        print(f"[WARNING] 벤치마크 항목 없음: {name} (FUNCTION_CASES 에 추가하세요)")
+
+    results = []
+    if not args.skip_functions:
+        results += run_functions(ds, args.iterations, args.heavy_iterations, args.only)
+    if not args.skip_routes:
+        results += run_routes(ds, args.iterations, args.heavy_iterations, args.only)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": {"rows": ds.rows, "seed": ds.seed, "end": ds.end.date().isoformat()},
+            "iterations": args.iterations,
+            "heavy_iterations": args.heavy_iterations,
+            "query_cache": bool(args.cache),
+            "stand_in_ms": args.stand_in,
+            "missing_cases": missing
+        },
+        "results": results
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="데이터 계층 / 화면 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="항목당 측정 횟수 (기본값: 20)")
+    parser.add_argument("--heavy-iterations", type=int, default=3, help="전체 조회/내보내기 측정 횟수 (기본값: 3)")
+    parser.add_argument("--stream-limit", type=int, default=1000, help="스트리밍 조회에서 읽을 행 수 (기본값: 1000)")
+    parser.add_argument("--seed", type=int, default=datagen.DEFAULT_SEED, help="표본 ID 선택 시드 (데이터 생성 시드와 같게)")
+    parser.add_argument("--end", type=date.fromisoformat, default=datagen.DEFAULT_END,
+                        help="데이터 생성 기준일 YYYY-MM-DD (기간 조회 기준)")
+    parser.add_argument("--only", metavar="TEXT", help="이름에 TEXT 가 포함된 항목만 실행 (예: stats., route:)")
+    parser.add_argument("--skip-functions", action="store_true", help="데이터 계층 함수 제외")
+    parser.add_argument("--skip-routes", action="store_true", help="화면 제외")
+    parser.add_argument("--cache", action="store_true", help="쿼리 결과 캐시를 켠 채로 측정")
+    parser.add_argument("--stand-in", type=float, metavar="MS", help="MySQL 대신 쿼리당 MS 밀리초 지연으로 대체")
+    parser.add_argument("--json", metavar="PATH", help="보고서를 JSON 파일로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="기준 보고서(JSON)와 p50 비교")
+    parser.add_argument("--threshold", type=float, default=0.2, help="느려짐 판단 비율 (기본값: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.stand_in is not None:
+        from benchmarks.async_vs_sync import install_stand_in
+        install_stand_in(args.stand_in / 1000, Config.DB_POOL_SIZE + Config.DB_POOL_MAX_OVERFLOW)
+
+    report = run(args)
+
+    for result in report["results"]:
+        print(f"[BENCH] {result['name']:<45} p50 {result['p50_ms']:>9.3f}ms  p95 {result['p95_ms']:>9.3f}ms  "
+              f"쿼리 {result['queries_per_call']:>6.2f}회{'  오류 ' + str(result['errors']) if result['errors'] else ''}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        if regressions:
+            print(f"[BENCH] 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,6 @@
 # main.py
 
 from flask import Flask, render_template
-from datetime import datetime
 import secrets
 
 # Blueprint 임포트
@@ -9,41 +8,73 @@ from routes.customer_routes import customer_bp
 from routes.visit_routes import visit_bp
 from routes.payment_routes import payment_bp
 from routes.stats_routes import stats_bp
+from routes.import_routes import import_bp
+from routes.metrics_routes import metrics_bp
+from routes.async_routes import async_bp, async_views_available
+from routes.utils import page_url
 
 # 비즈니스 로직 임포트 (홈페이지용)
-from app.customer import get_customer_by_birth_month
-from app.visit import get_visits
+from app.customer import get_upcoming_birthdays
+from app.visit import get_recent_visits
+from app.payment import get_recent_payments
 from app.stats import get_overall_statistics
+from app.database import init_app as init_database
+from app.metrics import init_app as init_metrics
+from app.config import Config
+from app.cache import reference_cache
+from app.fanout import Call, fan_out
 
 def create_app():
     """Flask 애플리케이션 팩토리 함수"""
     app = Flask(__name__)
-    app.secret_key = secrets.token_hex(16)
+    # 모든 워커가 같은 키를 사용해야 세션(변경 직후 기본 DB 조회 기한 등)이 유지됨
+    app.secret_key = Config.SECRET_KEY or secrets.token_hex(16)
+    
+    # 라우트별 요청 수 / 응답 시간 기록 (DB 트랜잭션 처리 시간까지 포함되도록 먼저 등록)
+    if Config.METRICS_ENABLED:
+        init_metrics(app)
+    
+    # 요청 단위 DB 트랜잭션 (요청당 연결 1개, 커밋 1회)
+    init_database(app)
+    
+    # 기준 데이터(결제 수단 등) 미리 읽기
+    if Config.REFERENCE_CACHE_WARM_UP:
+        reference_cache.warm_up()
+    
+    # 템플릿 공용 함수 (목록 페이지 이동 링크)
+    app.add_template_global(page_url)
     
     # Blueprint 등록
     app.register_blueprint(customer_bp)
     app.register_blueprint(visit_bp)
     app.register_blueprint(payment_bp)
     app.register_blueprint(stats_bp)
+    app.register_blueprint(import_bp)
+    
+    if Config.METRICS_ENABLED:
+        app.register_blueprint(metrics_bp)
+    
+    # 비동기 뷰 (선택 의존성이 모두 설치된 경우)
+    if Config.ASYNC_VIEWS_ENABLED and async_views_available():
+        app.register_blueprint(async_bp)
     
     # 홈페이지 라우트
     @app.route("/")
     def home():
-        # 전체 통계
-        overall_stats = get_overall_statistics()
-        
-        # 이번달 생일 고객 조회
-        current_month = datetime.now().month
-        birth_day_customers = get_customer_by_birth_month(current_month)
-        
-        # 최근 방문 기록
-        all_visits = get_visits()
-        recent_visits = all_visits[:5] if all_visits else []
+        # 전체 통계 / 다가오는 생일 고객 / 최근 방문·결제 기록(최신 N건)을 동시에 조회
+        widgets = fan_out({
+            "overall_stats": Call(get_overall_statistics, default={}),
+            "birth_day_customers": Call(get_upcoming_birthdays, Config.BIRTHDAY_WINDOW_DAYS, default=[]),
+            "recent_visits": Call(get_recent_visits, Config.RECENT_LIMIT, default=[]),
+            "recent_payments": Call(get_recent_payments, Config.RECENT_LIMIT, default=[])
+        })
         
         return render_template("dashboard.html",
-                             overall_stats=overall_stats or {},
-                             birth_day_customers=birth_day_customers or [],
-                             recent_visits=recent_visits)
+                             overall_stats=widgets["overall_stats"] or {},
+                             birth_day_customers=widgets["birth_day_customers"] or [],
+                             birthday_window_days=Config.BIRTHDAY_WINDOW_DAYS,
+                             recent_visits=widgets["recent_visits"],
+                             recent_payments=widgets["recent_payments"])
     
     return app
 
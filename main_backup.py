@@ -1,6 +1,6 @@
 from flask import Flask, request, render_template, flash, url_for, redirect
 from app.customer import create_customer, get_all_customers, search_customers, update_customer, delete_customer, get_customer_by_birth_month, get_customer_by_customer
-from app.visit import create_visit, get_visits, get_visits_by_customer, update_visit, get_visits_by_date_range, get_visit_by_visit_id, delete_visit
+from app.visit import create_visit, get_visits, get_recent_visits, get_visits_by_customer, update_visit, get_visits_by_date_range, get_visit_by_visit_id, delete_visit
 from app.payment import create_payment, delete_payment, get_all_payments, get_payments_by_customer, get_payment_methods
 from app.stats import get_customer_statistics, get_overall_statistics, get_monthly_statistics
 
@@ -20,7 +20,7 @@ def home():
     birth_day_customers = get_customer_by_birth_month(current_month)
 
     # 최근 방문 기록
-    recent_visits = get_visits()[:5] if get_visits() else []
+    recent_visits = get_recent_visits(5)
 
     return render_template("dashboard.html",
                            overall_stats = overall_stats,
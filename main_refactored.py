@@ -10,7 +10,7 @@ from routes.stats_routes import stats_bp
 
 # 비즈니스 로직 임포트 (홈페이지용)
 from app.customer import get_customer_by_birth_month
-from app.visit import get_visits
+from app.visit import get_recent_visits
 from app.stats import get_overall_statistics
 
 def create_app():
@@ -35,7 +35,7 @@ def create_app():
         birth_day_customers = get_customer_by_birth_month(current_month)
         
         # 최근 방문 기록
-        recent_visits = get_visits()[:5] if get_visits() else []
+        recent_visits = get_recent_visits(5)
         
         return render_template("dashboard.html",
                              overall_stats=overall_stats,
@@ -0,0 +1,33 @@
+import importlib.util
+from flask import Blueprint, render_template, flash, url_for, redirect
+from app import async_queries
+from app.async_database import AIOMYSQL_AVAILABLE, on_db_loop
+from app.backends import get_backend
+from app.config import Config
+
+# 비동기 뷰 (MySQL 백엔드이고 aiomysql 과 Flask 비동기 지원(pip install -r requirements-async.txt)이 설치된 경우에만 등록)
+# 동기 화면과 같은 템플릿을 /async 경로로 제공하여 두 방식을 비교할 수 있음
+async_bp = Blueprint('async_views', __name__, url_prefix="/async")
+
+def async_views_available():
+    return (AIOMYSQL_AVAILABLE and get_backend().name == "mysql"
+            and importlib.util.find_spec("asgiref") is not None)
+
+@async_bp.route("/")
+async def home():
+    # 전체 통계 / 다가오는 생일 / 최근 방문·결제 기록을 동시에 조회 (공용 DB 이벤트 루프에서 실행)
+    widgets = await on_db_loop(async_queries.dashboard(Config.BIRTHDAY_WINDOW_DAYS, Config.RECENT_LIMIT))
+
+    return render_template("dashboard.html",
+                         birthday_window_days=Config.BIRTHDAY_WINDOW_DAYS,
+                         **widgets)
+
+@async_bp.route("/customers/<int:customer_id>")
+async def customer_detail(customer_id):
+    results = await on_db_loop(async_queries.customer_detail(customer_id))
+
+    if not results["customer"]:
+        flash("고객을 찾을 수 없습니다.", "error")
+        return redirect(url_for("customer.customer_list"))
+
+    return render_template("customers/detail.html", **results)
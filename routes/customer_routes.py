@@ -1,12 +1,17 @@
-from flask import Blueprint, request, render_template, flash, url_for, redirect
+from flask import Blueprint, request, render_template, flash, url_for, redirect, jsonify
 from app.customer import (
     create_customer, get_all_customers, search_customers, 
     update_customer, delete_customer, get_customer_by_birth_month, 
-    get_customer_by_customer
+    get_customer_by_customer, get_customers_page, iter_customers,
+    get_upcoming_birthdays
 )
+from app.autocomplete import autocomplete_customers
+from app.config import Config
+from app.fanout import Call, fan_out
 from app.visit import get_visits_by_customer
 from app.payment import get_payments_by_customer
 from app.stats import get_customer_statistics
+from routes.utils import export_response
 
 customer_bp = Blueprint('customer', __name__)
 
@@ -15,18 +20,42 @@ def customer_list():
     search = request.args.get("search", "")
     birth_month = request.args.get("birth_month", "")
 
+    page = None
+
     if search:
         customers = search_customers(search)
     elif birth_month:
         customers = get_customer_by_birth_month(birth_month)
     else:
-        customers = get_all_customers()
+        page = get_customers_page(limit=request.args.get("limit", type=int),
+                                  after=request.args.get("after"),
+                                  before=request.args.get("before"))
+        customers = page["items"]
 
     return render_template("customers/list.html", 
                          customers=customers, 
+                         page=page,
                          search=search, 
                          birth_month=birth_month)
 
+@customer_bp.route("/customers/export.<fmt>")
+def customer_export(fmt):
+    columns = ["customer_id", "name", "phone", "birth_date", "gender", "memo"]
+    return export_response(iter_customers(), columns, "customers", fmt)
+
+@customer_bp.route("/customers/birthdays/export.<fmt>")
+def customer_birthday_export(fmt):
+    # 생일 마케팅 캠페인 대상 (기본: 오늘부터 BIRTHDAY_WINDOW_DAYS 일 이내)
+    days = request.args.get("days", Config.BIRTHDAY_WINDOW_DAYS, type=int)
+    columns = ["customer_id", "name", "phone", "birth_date", "next_birthday", "days_until", "gender"]
+    return export_response(get_upcoming_birthdays(days), columns, f"birthdays_{days}d", fmt)
+
+@customer_bp.route("/api/customers/autocomplete")
+def customer_autocomplete():
+    # 방문/결제 등록 화면의 고객 선택 입력용 (이름, 전화번호 앞글자/뒷자리)
+    results = autocomplete_customers(request.args.get("q", ""), request.args.get("limit", type=int))
+    return jsonify(results)
+
 @customer_bp.route("/customer/new", methods=["GET", "POST"])
 def customer_new():
     if request.method == "POST":
@@ -48,21 +77,23 @@ def customer_new():
 
 @customer_bp.route("/customers/<int:customer_id>")
 def customer_detail(customer_id):
-    customer = get_customer_by_customer(customer_id)
-
-    if not customer:
+    # 고객 정보 / 통계 / 방문 / 결제 기록을 동시에 조회
+    results = fan_out({
+        "customer": Call(get_customer_by_customer, customer_id),
+        "stats": Call(get_customer_statistics, customer_id),
+        "visits": Call(get_visits_by_customer, customer_id, default=[]),
+        "payments": Call(get_payments_by_customer, customer_id, default=[])
+    })
+
+    if not results["customer"]:
         flash("고객을 찾을 수 없습니다.", "error")
         return redirect(url_for("customer.customer_list"))
 
-    stats = get_customer_statistics(customer_id)
-    visits = get_visits_by_customer(customer_id)
-    payments = get_payments_by_customer(customer_id)
-
     return render_template("customers/detail.html", 
-                         customer=customer, 
-                         stats=stats, 
-                         visits=visits, 
-                         payments=payments)
+                         customer=results["customer"], 
+                         stats=results["stats"], 
+                         visits=results["visits"], 
+                         payments=results["payments"])
 
 @customer_bp.route("/customers/<int:customer_id>/edit", methods=["GET", "POST"])
 def customer_edit(customer_id):
@@ -0,0 +1,27 @@
+import io
+from flask import Blueprint, request, render_template, flash
+from app.importer import IMPORTERS
+from routes.utils import flash_success_error
+
+import_bp = Blueprint('data_import', __name__)
+
+@import_bp.route("/import", methods=["GET", "POST"])
+def import_upload():
+    report = None
+
+    if request.method == "POST":
+        kind = request.form.get("kind", "")
+        upload = request.files.get("file")
+
+        if kind not in IMPORTERS or not upload or not upload.filename:
+            flash("가져올 데이터 종류와 CSV 파일을 선택하세요.", "error")
+        else:
+            # 업로드 파일을 통째로 읽지 않고 스트림 그대로 배치 단위 처리
+            stream = io.TextIOWrapper(upload.stream, encoding="utf-8-sig", newline="")
+            report = IMPORTERS[kind](stream).as_dict()
+
+            flash_success_error(report["rejected"] == 0,
+                                f"가져오기 완료: {report['inserted']:,}건 등록",
+                                f"가져오기 완료: {report['inserted']:,}건 등록, {report['rejected']:,}건 거부")
+
+    return render_template("import/upload.html", report=report)
@@ -0,0 +1,9 @@
+from flask import Blueprint, Response
+from app.metrics import registry
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route("/metrics")
+def metrics():
+    # Prometheus 텍스트 형식
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
@@ -1,15 +1,24 @@
 from flask import Blueprint, request, render_template, flash, url_for, redirect
 from app.payment import (
-    create_payment, delete_payment, get_all_payments, get_payment_methods
+    create_payment, delete_payment, get_payments_page, get_payment_methods,
+    iter_all_payments
 )
-from app.visit import get_visits
+from routes.utils import export_response
 
 payment_bp = Blueprint('payment', __name__)
 
 @payment_bp.route("/payments")
 def payment_list():
-    payments = get_all_payments()
-    return render_template("payments/list.html", payments=payments)
+    page = get_payments_page(limit=request.args.get("limit", type=int),
+                             after=request.args.get("after"),
+                             before=request.args.get("before"))
+    return render_template("payments/list.html", payments=page["items"], page=page)
+
+@payment_bp.route("/payments/export.<fmt>")
+def payment_export(fmt):
+    columns = ["payment_id", "visit_id", "customer_id", "customer_name", "amount",
+               "payment_method_code", "method_name", "payment_datetime"]
+    return export_response(iter_all_payments(), columns, "payments", fmt)
 
 @payment_bp.route("/payments/new", methods=["GET", "POST"])
 def payment_new():
@@ -27,10 +36,8 @@ def payment_new():
         else:
             flash("결제 정보 등록 실패", "error")
 
-    visits = get_visits()
     payment_methods = get_payment_methods()
     return render_template("payments/new.html", 
-                         visits=visits, 
                          payment_methods=payment_methods)
 
 @payment_bp.route("/payments/<int:payment_id>/delete", methods=["POST"])
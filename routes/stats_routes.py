@@ -1,26 +1,15 @@
-from flask import Blueprint, render_template
-from app.stats import get_overall_statistics, get_monthly_statistics, get_customer_statistics
-from app.customer import get_all_customers
-from datetime import datetime, timedelta
+from flask import Blueprint, render_template, request
+from app.stats import get_overall_statistics, get_recent_monthly_series, get_all_customer_statistics, get_top_customers
 
 stats_bp = Blueprint('stats', __name__)
 
 @stats_bp.route("/stats")
 def stats_dashboard():
     overall_stats = get_overall_statistics()
-    current_date = datetime.now()
-    monthly_stats = get_monthly_statistics(current_date.year, current_date.month)
 
-    # 월별 통계 (최근 6개월)
-    monthly_data = []
-    for i in range(6):
-        month_date = current_date.replace(day=1) - timedelta(days=i*30)
-        month_stats = get_monthly_statistics(month_date.year, month_date.month)
-        monthly_data.append({
-            "year": month_date.year,
-            "month": month_date.month,
-            "stats": month_stats
-        })
+    # 월별 통계 (이번 달 포함 최근 6개월, 쿼리 1회)
+    monthly_data = get_recent_monthly_series(6)
+    monthly_stats = monthly_data[0]["stats"] if monthly_data else None
 
     return render_template("stats/dashboard.html", 
                          overall_stats=overall_stats, 
@@ -29,16 +18,15 @@ def stats_dashboard():
 
 @stats_bp.route("/stats/customers")
 def stats_customers():
-    customers = get_all_customers()
-    customer_stats = []
+    result = get_all_customer_statistics(limit=request.args.get("limit", type=int),
+                                         page=request.args.get("page", 1, type=int),
+                                         sort=request.args.get("sort", "name"),
+                                         order=request.args.get("order", "asc"))
 
-    for customer in customers:
-        # 버그 수정: customers -> customer
-        stats = get_customer_statistics(customer["customer_id"])
-        if stats:
-            customer_stats.append({
-                "customer": customer,
-                "stats": stats
-            })
+    # 요약 카드는 현재 페이지가 아닌 전체 고객 기준 1위 (기준별 1위를 쿼리 1회로 조회)
+    top_customers = {metric: (rows or [None])[0] for metric, rows in get_top_customers(1).items()}
 
-    return render_template("stats/customers.html", customer_stats=customer_stats)
\ No newline at end of file
+    return render_template("stats/customers.html",
+                         customer_stats=result["items"],
+                         result=result,
+                         top_customers=top_customers)
\ No newline at end of file
@@ -1,5 +1,9 @@
-from flask import flash, redirect, url_for
+from flask import flash, redirect, url_for, request, Response, abort
 from functools import wraps
+import csv
+import io
+import json
+import zlib
 
 def handle_not_found(item_name, redirect_to):
     """공통 404 에러 처리 함수"""
@@ -29,4 +33,96 @@ def flash_success_error(success, success_msg, error_msg):
         flash(success_msg, "success")
     else:
         flash(error_msg, "error")
-    return success
\ No newline at end of file
+    return success
+
+def page_url(**changes):
+    """현재 요청의 쿼리 파라미터를 유지한 채 일부만 바꾼 URL (페이지 이동 링크용)"""
+    args = request.args.to_dict()
+    args.update(changes)
+    args = {key: value for key, value in args.items() if value not in (None, "")}
+    return url_for(request.endpoint, **(request.view_args or {}), **args)
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8"
+}
+EXPORT_CHUNK_SIZE = 64 * 1024  # 응답으로 내보낼 청크 크기 (바이트)
+
+def _iter_csv(rows, columns):
+    """행을 CSV 텍스트 조각으로 변환 (엑셀 한글 호환을 위해 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+
+    for row in rows:
+        writer.writerow(["" if row.get(column) is None else row.get(column) for column in columns])
+
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+def _iter_jsonl(rows, columns):
+    """행을 JSON Lines 텍스트 조각으로 변환"""
+    lines = []
+    size = 0
+
+    for row in rows:
+        line = json.dumps({column: row.get(column) for column in columns},
+                          ensure_ascii=False, default=str) + "\n"
+        lines.append(line)
+        size += len(line)
+
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+            size = 0
+
+    yield "".join(lines)
+
+def _gzip_chunks(chunks):
+    """텍스트 조각을 받아 gzip 스트림으로 압축 (전체를 메모리에 올리지 않음)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더 포함
+
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+def export_response(rows, columns, filename, fmt):
+    """
+    조회 결과를 CSV / JSONL 스트리밍 응답으로 반환
+
+    Args:
+        rows (iterable): 내보낼 행 (iter_query 기반 제너레이터 권장)
+        columns (list): 내보낼 컬럼 순서
+        filename (str): 확장자를 제외한 다운로드 파일명
+        fmt (str): "csv" 또는 "jsonl"
+
+    요청에 gzip=1 이 있으면 압축된 .gz 파일로 내려줍니다.
+    """
+    if fmt not in EXPORT_FORMATS:
+        abort(404)
+
+    chunks = _iter_csv(rows, columns) if fmt == "csv" else _iter_jsonl(rows, columns)
+    filename = f"{filename}.{fmt}"
+    mimetype = EXPORT_FORMATS[fmt]
+
+    if request.args.get("gzip") == "1":
+        chunks = _gzip_chunks(chunks)
+        filename += ".gz"
+        mimetype = "application/gzip"
+    else:
+        chunks = (chunk.encode("utf-8") for chunk in chunks)
+
+    response = Response(chunks, mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    response.headers["Cache-Control"] = "no-store"
+    return response
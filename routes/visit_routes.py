@@ -1,9 +1,10 @@
-from flask import Blueprint, request, render_template, flash, url_for, redirect
+from flask import Blueprint, request, render_template, flash, url_for, redirect, jsonify
 from app.visit import (
-    create_visit, get_visits, get_visits_by_date_range, 
-    get_visit_by_visit_id, update_visit, delete_visit
+    create_visit, get_visits_page, iter_visits,
+    get_visit_by_visit_id, update_visit, delete_visit, get_visits_by_customer
 )
-from app.customer import get_all_customers
+from app.customer import get_customer_by_customer
+from routes.utils import export_response
 from datetime import datetime
 
 visit_bp = Blueprint('visit', __name__)
@@ -15,16 +16,26 @@ def visit_list():
     start_date = request.args.get("start_date", "")
     end_date = request.args.get("end_date", "")
 
-    if start_date and end_date:
-        visits = get_visits_by_date_range(start_date, end_date)
-    else:
-        visits = get_visits()
+    page = get_visits_page(limit=request.args.get("limit", type=int),
+                           after=request.args.get("after"),
+                           before=request.args.get("before"),
+                           start_date=start_date,
+                           end_date=end_date)
 
     return render_template("visits/list.html", 
-                         visits=visits, 
+                         visits=page["items"], 
+                         page=page,
                          start_date=start_date, 
                          end_date=end_date)
 
+@visit_bp.route("/visits/export.<fmt>")
+def visit_export(fmt):
+    start_date = request.args.get("start_date", "")
+    end_date = request.args.get("end_date", "")
+
+    columns = ["visit_id", "customer_id", "customer_name", "visit_date", "memo"]
+    return export_response(iter_visits(start_date, end_date), columns, "visits", fmt)
+
 @visit_bp.route("/visits/new", methods=["GET", "POST"])
 def visit_new():
     if request.method == "POST":
@@ -40,9 +51,20 @@ def visit_new():
         else:
             flash("방문 기록 저장 실패", "error")
 
-    customers = get_all_customers()
+    # 고객 상세 화면에서 넘어온 경우 해당 고객을 미리 선택
+    customer_id = request.args.get("customer_id", type=int)
+    customer = get_customer_by_customer(customer_id) if customer_id else None
+
     today = datetime.now().strftime("%Y-%m-%d")
-    return render_template("visits/new.html", customers=customers, today=today)
+    return render_template("visits/new.html", customer=customer, today=today)
+
+@visit_bp.route("/api/customers/<int:customer_id>/visits")
+def customer_visits_json(customer_id):
+    # 결제 등록 화면에서 선택한 고객의 방문 기록 목록
+    visits = get_visits_by_customer(customer_id)
+    return jsonify([{"visit_id": visit["visit_id"],
+                     "visit_date": visit["visit_date"].strftime("%Y-%m-%d %H:%M") if visit["visit_date"] else None,
+                     "memo": visit["memo"]} for visit in visits])
 
 @visit_bp.route("/visits/<int:visit_id>/edit", methods=["GET", "POST"])
 def visit_edit(visit_id):
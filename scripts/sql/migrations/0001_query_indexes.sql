@@ -0,0 +1,20 @@
+-- 조회 경로별 인덱스 추가
+-- (InnoDB 보조 인덱스에는 기본 키가 포함되므로 키셋 페이지네이션의 기본 키 정렬도 인덱스로 처리됨)
+
+-- 고객 목록 이름순 정렬 / 키셋 페이지네이션 (get_all_customers, get_customers_page)
+CREATE INDEX idx_customer_name ON customer (name);
+
+-- 전화번호 조회 (CSV 가져오기 고객 매칭)
+CREATE INDEX idx_customer_phone ON customer (phone);
+
+-- 방문 기록 최신순 정렬 / 기간 조회 / 월별 통계 (get_visits, get_visits_page, get_visits_by_date_range, get_monthly_series)
+CREATE INDEX idx_visit_date ON visit (visit_date);
+
+-- 고객별 방문 기록 최신순 조회 / 고객별 방문 집계 (get_visits_by_customer, get_all_customer_statistics)
+CREATE INDEX idx_visit_customer_date ON visit (customer_id, visit_date);
+
+-- 결제 기록 최신순 정렬 / 키셋 페이지네이션 (get_all_payments, get_payments_page)
+CREATE INDEX idx_payment_datetime ON payment (payment_datetime);
+
+-- 방문별 결제 금액 집계 커버링 인덱스 (get_total_payment_by_customer, get_customer_statistics)
+CREATE INDEX idx_payment_visit_amount ON payment (visit_id, amount);
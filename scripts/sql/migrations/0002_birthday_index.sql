@@ -0,0 +1,10 @@
+-- 생일(월/일) 조회용 저장 생성 컬럼과 인덱스
+-- birth_mmdd = 월 * 100 + 일 (예: 3월 15일 -> 315), birth_date 가 NULL 이면 NULL
+-- MONTH(birth_date) 조건은 인덱스를 사용할 수 없으므로 이 컬럼의 범위 조건으로 대체
+
+ALTER TABLE customer
+  ADD COLUMN birth_mmdd SMALLINT
+    GENERATED ALWAYS AS (MONTH(birth_date) * 100 + DAYOFMONTH(birth_date)) STORED;
+
+-- 월별 생일 고객 / 다가오는 생일 고객 범위 조회 (get_customer_by_birth_month, get_upcoming_birthdays)
+CREATE INDEX idx_customer_birth_mmdd ON customer (birth_mmdd);
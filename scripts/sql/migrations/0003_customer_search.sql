@@ -0,0 +1,17 @@
+-- 고객 검색용 인덱스 (app/search.py)
+
+-- 숫자만 남긴 전화번호와 뒤집은 번호 (뒷자리 검색을 앞부분 일치로 처리)
+ALTER TABLE customer
+  ADD COLUMN phone_digits VARCHAR(20)
+    GENERATED ALWAYS AS (REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(phone, '-', ''), ' ', ''), '.', ''), '+', ''), '(', ''), ')', '')) STORED,
+  ADD COLUMN phone_digits_rev VARCHAR(20)
+    GENERATED ALWAYS AS (REVERSE(phone_digits)) STORED;
+
+CREATE INDEX idx_customer_phone_digits ON customer (phone_digits);
+CREATE INDEX idx_customer_phone_digits_rev ON customer (phone_digits_rev);
+
+-- 이름 부분 일치 검색 (ngram_token_size 기본값 2: 한글 두 글자 단위)
+CREATE FULLTEXT INDEX ft_customer_name ON customer (name) WITH PARSER ngram;
+
+-- 생년월일 검색
+CREATE INDEX idx_customer_birth_date ON customer (birth_date);
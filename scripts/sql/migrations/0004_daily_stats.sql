@@ -0,0 +1,32 @@
+-- 일별 집계 테이블 (app/rollup.py 가 방문/결제 변경 시 해당 날짜를 다시 계산)
+-- payment_method_code = '' 행은 날짜별 합계, 그 외는 결제 수단별 집계
+
+CREATE TABLE daily_stats (
+  stat_date DATE NOT NULL,
+  payment_method_code VARCHAR(20) NOT NULL,
+  visit_count INT NOT NULL DEFAULT 0,
+  unique_customers INT NOT NULL DEFAULT 0,
+  revenue_sum BIGINT NOT NULL DEFAULT 0,
+  payment_count INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (stat_date, payment_method_code)
+);
+
+-- 기간별 방문 고객 수(COUNT(DISTINCT customer_id)) 커버링 인덱스 (일별 값은 더할 수 없으므로 원본에서 계산)
+CREATE INDEX idx_visit_date_customer ON visit (visit_date, customer_id);
+
+-- 기존 데이터 채우기 (python -m app.rollup rebuild 와 같은 계산)
+INSERT INTO daily_stats (stat_date, payment_method_code, visit_count, unique_customers, revenue_sum, payment_count)
+SELECT DATE(v.visit_date), '',
+       COUNT(DISTINCT v.visit_id), COUNT(DISTINCT v.customer_id),
+       COALESCE(SUM(p.amount), 0), COUNT(p.payment_id)
+FROM visit v
+LEFT JOIN payment p ON v.visit_id = p.visit_id
+GROUP BY DATE(v.visit_date);
+
+INSERT INTO daily_stats (stat_date, payment_method_code, visit_count, unique_customers, revenue_sum, payment_count)
+SELECT DATE(v.visit_date), p.payment_method_code,
+       COUNT(DISTINCT v.visit_id), COUNT(DISTINCT v.customer_id),
+       SUM(p.amount), COUNT(*)
+FROM visit v
+JOIN payment p ON v.visit_id = p.visit_id
+GROUP BY DATE(v.visit_date), p.payment_method_code;
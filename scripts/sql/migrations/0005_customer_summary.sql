@@ -0,0 +1,36 @@
+-- 고객별 요약 테이블 (app/summary.py 가 방문/결제 변경 시 해당 고객을 다시 계산)
+-- 행이 없는 고객은 방문/결제 기록이 없는 것으로 간주
+
+CREATE TABLE customer_summary (
+  customer_id INT PRIMARY KEY,
+  visit_count INT NOT NULL DEFAULT 0,
+  payment_total BIGINT NOT NULL DEFAULT 0,
+  payment_count INT NOT NULL DEFAULT 0,
+  first_visit_date DATETIME,
+  last_visit_date DATETIME,
+  last_payment_datetime DATETIME,
+  CONSTRAINT fk_customer_summary_customer FOREIGN KEY (customer_id) REFERENCES customer (customer_id) ON DELETE CASCADE
+);
+
+-- 기존 데이터 채우기 (python -m app.summary rebuild 와 같은 계산)
+INSERT INTO customer_summary (customer_id, visit_count, payment_total, payment_count,
+                              first_visit_date, last_visit_date, last_payment_datetime)
+SELECT c.customer_id,
+       COALESCE(vs.visit_count, 0),
+       COALESCE(ps.payment_total, 0),
+       COALESCE(ps.payment_count, 0),
+       vs.first_visit_date,
+       vs.last_visit_date,
+       ps.last_payment_datetime
+FROM customer c
+LEFT JOIN (
+    SELECT customer_id, COUNT(*) AS visit_count, MIN(visit_date) AS first_visit_date, MAX(visit_date) AS last_visit_date
+    FROM visit
+    GROUP BY customer_id
+) vs ON c.customer_id = vs.customer_id
+LEFT JOIN (
+    SELECT v.customer_id, SUM(p.amount) AS payment_total, COUNT(*) AS payment_count, MAX(p.payment_datetime) AS last_payment_datetime
+    FROM payment p
+    JOIN visit v ON p.visit_id = v.visit_id
+    GROUP BY v.customer_id
+) ps ON c.customer_id = ps.customer_id;
@@ -2,10 +2,16 @@
 테스트 공통 설정 및 유틸리티
 """
 
+import os
+
+# DB 서버 없이 내장 SQLite 임시 DB 로 실행 (MySQL 로 실행하려면 DB_BACKEND=mysql pytest)
+os.environ.setdefault("DB_BACKEND", "sqlite")
+os.environ.setdefault("SQLITE_PATH", ":memory:")
+
 import pytest
 import datetime
 from app.customer import create_customer, search_customers, delete_customer
-from app.visit import create_visit, get_visits_by_customer, delete_visit
+from app.visit import create_visit, get_visits_by_customer, get_visit_by_visit_id, delete_visit
 from app.payment import create_payment, get_payments_by_customer, delete_payment
 
 def create_test_customer(name="테스트고객", phone="010-1234-5678"):
@@ -42,7 +48,9 @@ def create_test_payment(visit_id, amount=50000, method="CASH"):
     }
     
     create_payment(visit_id, payment_data)
-    payments = get_payments_by_customer(visit_id)
+    # 결제는 고객 단위로 조회되므로 방문의 고객으로 조회한 뒤 해당 방문의 결제를 선택
+    visit = get_visit_by_visit_id(visit_id)
+    payments = [p for p in get_payments_by_customer(visit["customer_id"]) if p["visit_id"] == visit_id] if visit else []
     return payments[0]["payment_id"] if payments else None
 
 def cleanup_test_data(customer_id=None, visit_id=None, payment_id=None):
@@ -0,0 +1,196 @@
+"""
+비동기 데이터 계층 테스트 (DB 서버/aiomysql 없이 실행기 대체)
+"""
+
+import asyncio
+import inspect
+import pytest
+from app import async_database, async_queries, customer, visit, payment, stats
+from app.query_cache import QueryCache
+
+@pytest.fixture
+def statements(monkeypatch):
+    """async_database._run_statement 를 대체하여 실행 횟수 기록 (결과는 고정값)"""
+    calls = []
+
+    async def fake_run_statement(operation, default=None):
+        calls.append(operation)
+        await asyncio.sleep(0.01)
+        return [{"value": 1}]
+
+    monkeypatch.setattr(async_database, "_run_statement", fake_run_statement)
+    monkeypatch.setattr(async_database, "_query_cache", QueryCache(max_bytes=10 ** 6, ttl=60))
+    monkeypatch.setattr(async_database.Config, "QUERY_CACHE_ENABLED", True)
+    return calls
+
+def test_async_query_cache_and_write_invalidation(statements):
+    """비동기 조회도 결과 캐시를 사용하고, 변경 문장은 해당 테이블 캐시를 무효화하는지 테스트"""
+    async def scenario():
+        query = "SELECT * FROM customer"
+        await async_database.execute_query(query, fetch_all=True, cache=True)
+        await async_database.execute_query(query, fetch_all=True, cache=True)
+        assert len(statements) == 1
+
+        await async_database.execute_write("UPDATE customer SET memo = %s", ("x",))
+        await async_database.execute_query(query, fetch_all=True, cache=True)
+        assert len(statements) == 3
+
+    asyncio.run(scenario())
+
+def test_async_transaction_tracks_written_tables(statements):
+    """비동기 작업 단위 안의 변경 테이블은 커밋 전까지 캐시를 우회하는지 테스트"""
+    async def scenario():
+        async with async_database.transaction() as uow:
+            await async_database.execute_write("INSERT INTO visit (customer_id) VALUES (%s)", (1,))
+            assert "visit" in uow.written_tables
+            assert not async_database._cacheable("SELECT * FROM visit")
+            assert async_database._cacheable("SELECT * FROM customer")
+
+        assert async_database.get_current_async_unit_of_work() is None
+
+    asyncio.run(scenario())
+
+def test_customer_detail_runs_queries_concurrently(monkeypatch):
+    """고객 상세 화면 조회가 동시에 실행되어 가장 느린 조회 시간에 가깝게 끝나는지 테스트"""
+    async def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        await asyncio.sleep(0.05)
+        if "FROM payment_method" in query:
+            return [{"method_code": "CASH", "method_name": "현금"}]
+        if "FROM payment" in query:
+            return [{"payment_id": 1, "payment_method_code": "CASH"}]
+        if "customer_summary" in query:
+            return {"name": "홍길동", "total_visits": 0, "total_payment": None, "avg_payment": None}
+        return {"customer_id": params[0]} if fetch_one else []
+
+    monkeypatch.setattr(async_queries, "execute_query", fake_execute_query)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await async_queries.customer_detail(7)
+        return result, loop.time() - started
+
+    result, elapsed = asyncio.run(scenario())
+
+    assert result["customer"] == {"customer_id": 7}
+    assert result["stats"]["total_payment"] == 0
+    assert result["payments"][0]["method_name"] == "현금"
+    assert elapsed < 0.15
+
+def test_async_queries_cover_every_sync_read():
+    """고객/방문/결제/통계 모듈의 모든 공개 조회 함수에 같은 이름의 비동기 버전이 있는지 테스트"""
+    missing = []
+    for module in (customer, visit, payment, stats):
+        for name, func in vars(module).items():
+            if (name.startswith("_") or not inspect.isfunction(func) or func.__module__ != module.__name__
+                    or name.startswith(("create_", "update_", "delete_"))):
+                continue
+
+            ported = getattr(async_queries, name, None)
+            if not (inspect.iscoroutinefunction(ported) or inspect.isasyncgenfunction(ported)):
+                missing.append(f"{module.__name__}.{name}")
+
+    assert missing == []
+
+def test_unknown_payment_method_is_reloaded_without_sync_cache(monkeypatch):
+    """캐시 후 추가된 결제 수단은 비동기 조회로 다시 읽고, 동기 기준 데이터 캐시는 사용하지 않는지 테스트"""
+    methods = [[{"method_code": "CASH", "method_name": "현금"}],
+               [{"method_code": "CASH", "method_name": "현금"}, {"method_code": "CARD", "method_name": "카드"}]]
+
+    async def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        if "FROM payment_method" in query:
+            return methods.pop(0)
+        return [{"payment_id": 1, "payment_method_code": "CARD"}]
+
+    def blocking_get(name):
+        raise AssertionError("동기 기준 데이터 캐시 사용")
+
+    monkeypatch.setattr(async_queries, "execute_query", fake_execute_query)
+    monkeypatch.setattr(payment.reference_cache, "get", blocking_get)
+
+    payments = asyncio.run(async_queries.get_payments_by_customer(1))
+
+    assert payments[0]["method_name"] == "카드"
+    assert methods == []
+
+class _FakeCursor:
+    """동시에 사용되면 기록하는 aiomysql 커서 대체"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=()):
+        if self.conn.busy:
+            self.conn.overlaps += 1
+        self.conn.busy = True
+        await asyncio.sleep(0.01)
+        self.conn.busy = False
+        self.conn.statements.append(query)
+
+        if "FROM payment_method" in query:
+            self.result = [{"method_code": "CASH", "method_name": "현금"}]
+        elif "FROM payment" in query:
+            self.result = [{"payment_id": 1, "payment_method_code": "CASH"}]
+        elif "customer_summary" in query:
+            self.result = [{"name": "홍길동", "total_visits": 0, "total_payment": None, "avg_payment": None}]
+        else:
+            self.result = [{"customer_id": params[0]}] if params else []
+
+    async def fetchone(self):
+        return self.result[0] if self.result else None
+
+    async def fetchall(self):
+        return self.result
+
+class _FakeConnection:
+    def __init__(self):
+        self.busy = False
+        self.overlaps = 0
+        self.statements = []
+        self.begins = self.commits = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    async def begin(self):
+        await asyncio.sleep(0.01)
+        self.begins += 1
+
+    async def commit(self):
+        self.commits += 1
+
+def test_customer_detail_inside_transaction_shares_one_connection(monkeypatch):
+    """작업 단위 안에서 동시에 실행한 조회가 연결 하나와 트랜잭션 하나를 차례로 사용하는지 테스트"""
+    borrowed, released = [], []
+
+    async def fake_get_async_connection():
+        borrowed.append(_FakeConnection())
+        return borrowed[-1]
+
+    async def fake_release(conn, broken=False):
+        released.append(conn)
+
+    monkeypatch.setattr(async_database, "get_async_connection", fake_get_async_connection)
+    monkeypatch.setattr(async_database, "_release", fake_release)
+    monkeypatch.setattr(async_database.Config, "QUERY_CACHE_ENABLED", False)
+
+    async def scenario():
+        async with async_database.transaction():
+            return await async_queries.customer_detail(7)
+
+    result = asyncio.run(scenario())
+
+    assert len(borrowed) == 1
+    conn = borrowed[0]
+    assert released == [conn]
+    assert (conn.begins, conn.commits) == (1, 1)
+    assert conn.overlaps == 0
+    assert len(conn.statements) == 5
+    assert result["customer"] == {"customer_id": 7}
@@ -0,0 +1,137 @@
+"""
+고객 자동완성 색인 테스트 (DB 서버 없이 메모리 색인만 사용)
+"""
+
+import threading
+
+from app.autocomplete import CustomerPrefixIndex
+
+CUSTOMERS = [
+    {"customer_id": 1, "name": "홍길동", "phone": "010-1111-5678"},
+    {"customer_id": 2, "name": "홍길순", "phone": "010-2222-3333"},
+    {"customer_id": 3, "name": "김철수", "phone": "010-5678-9999"}
+]
+
+def build():
+    return CustomerPrefixIndex(loader=lambda: list(CUSTOMERS))
+
+def ids(results):
+    return [customer["customer_id"] for customer in results]
+
+def test_lazy_load_and_prefix_search():
+    """최초 검색 시 생성, 이름/성을 뺀 이름 앞글자 검색"""
+    index = build()
+    assert len(index) == 0
+
+    assert ids(index.search("홍길")) == [1, 2]
+    assert len(index) == 3
+    assert ids(index.search("길순")) == [2]
+    assert index.search("") == []
+
+def test_phone_search():
+    """전화번호 앞자리/뒷자리 검색 (구분자 무시, 중복 제거)"""
+    index = build()
+
+    assert ids(index.search("010-2222")) == [2]
+    assert ids(index.search("5678")) == [1]
+    assert ids(index.search("9999")) == [3]
+
+def test_limit():
+    """최대 결과 수 제한"""
+    assert len(build().search("010", limit=2)) == 2
+
+def test_incremental_updates():
+    """등록/수정/삭제 시 해당 고객 키만 갱신"""
+    index = build()
+    index.search("홍")
+
+    index.add({"customer_id": 4, "name": "홍두깨", "phone": None})
+    assert ids(index.search("홍두")) == [4]
+
+    index.add({"customer_id": 1, "name": "고길동", "phone": "010-1111-5678"})
+    assert ids(index.search("홍길")) == [2]
+    assert ids(index.search("고길")) == [1]
+
+    index.remove(2)
+    assert index.search("홍길") == []
+    assert len(index) == 3
+
+def test_add_before_load_is_ignored():
+    """생성 전 변경은 무시하고 생성 시 DB 기준으로 읽음"""
+    index = build()
+    index.add({"customer_id": 9, "name": "임꺽정", "phone": None})
+
+    assert index.search("임꺽") == []
+    assert len(index) == 3
+
+class BlockingLoader:
+    """호출되면 release() 까지 대기하는 로더 (재생성 중 상태 재현)"""
+
+    def __init__(self, customers):
+        self.customers = customers
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.released.wait(5)
+        return list(self.customers)
+
+    def release(self):
+        self.released.set()
+
+def start_rebuild(index, loader):
+    thread = threading.Thread(target=index.search, args=("홍",))
+    thread.start()
+    assert loader.started.wait(5)
+    return thread
+
+def test_search_during_rebuild_serves_previous_index():
+    """재생성 중 다른 검색은 기다리지 않고 이전 색인, 최초 생성 중이면 대체 검색 사용"""
+    loader = BlockingLoader(CUSTOMERS)
+    index = CustomerPrefixIndex(loader=loader, fallback=lambda prefix, limit: [{"customer_id": 0}])
+
+    thread = start_rebuild(index, loader)
+    assert ids(index.search("홍길")) == [0]
+    loader.release()
+    thread.join()
+    assert ids(index.search("홍길")) == [1, 2]
+
+    loader.started.clear()
+    loader.released.clear()
+    loader.customers = CUSTOMERS[:1]
+    index.invalidate()
+
+    thread = start_rebuild(index, loader)
+    assert ids(index.search("홍길")) == [1, 2]
+    loader.release()
+    thread.join()
+    assert ids(index.search("홍길")) == [1]
+
+def test_changes_during_rebuild_are_reapplied():
+    """재생성 중 등록/삭제는 새 색인으로 교체한 뒤 다시 적용"""
+    loader = BlockingLoader(CUSTOMERS)
+    index = CustomerPrefixIndex(loader=loader)
+
+    thread = start_rebuild(index, loader)
+    index.add({"customer_id": 4, "name": "홍두깨", "phone": None})
+    index.remove(2)
+    loader.release()
+    thread.join()
+
+    assert ids(index.search("홍")) == [1, 4]
+
+def test_invalidate_during_rebuild_discards_result():
+    """읽는 중 전체 무효화되면 그 결과는 버리고 다음 검색에서 다시 생성"""
+    loader = BlockingLoader(CUSTOMERS)
+    index = CustomerPrefixIndex(loader=loader)
+
+    thread = start_rebuild(index, loader)
+    index.invalidate()
+    loader.customers = CUSTOMERS[2:]
+    loader.release()
+    thread.join()
+    assert len(index) == 0
+
+    assert ids(index.search("김")) == [3]
+    assert len(index) == 1
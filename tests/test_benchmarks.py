@@ -0,0 +1,50 @@
+"""
+벤치마크 데이터 생성기 / 벤치마크 모음 테스트 (DB 서버 불필요)
+"""
+
+from benchmarks import datagen, suite
+
+def test_datagen_is_deterministic_and_chunk_independent():
+    """같은 시드면 같은 데이터, 시작 순번을 나눠 생성해도 결과가 같은지 테스트"""
+    first = list(datagen.generate(30, seed=1))
+
+    assert first == list(datagen.generate(30, seed=1))
+    assert first != list(datagen.generate(30, seed=2))
+    assert first[10:] == list(datagen.generate(20, seed=1, start_index=10))
+    assert len({customer["phone"] for customer, _ in first}) == 30
+
+def test_datagen_distribution():
+    """방문 없는 고객, 단골 편중, 기준일 이전 방문, 결제 수단 분포 테스트"""
+    records = list(datagen.generate(2000, seed=datagen.DEFAULT_SEED))
+    visit_counts = sorted((len(visits) for _, visits in records), reverse=True)
+    visits = [visit for _, customer_visits in records for visit in customer_visits]
+    payments = [payment for _, payments in visits for payment in payments]
+
+    assert 0.1 < visit_counts.count(0) / len(records) < 0.2
+    # 상위 10% 고객이 방문의 40% 이상
+    assert sum(visit_counts[:200]) > 0.4 * len(visits)
+    assert all(visited_at.date() < datagen.DEFAULT_END for visited_at, _ in visits)
+    assert {payment["payment_method_code"] for payment in payments} == set(datagen.PAYMENT_METHODS)
+    assert sum(payment["payment_method_code"] == "CARD" for payment in payments) > len(payments) / 2
+
+    rows = len(records) + len(visits) + len(payments)
+    assert abs(rows / len(records) - datagen.ROWS_PER_CUSTOMER) < 1
+
+def test_parse_rows():
+    assert datagen.parse_rows("1k") == 1000
+    assert datagen.parse_rows("10M") == 10_000_000
+    assert datagen.parse_rows("2500") == 2500
+    assert datagen.customers_for_rows(1000) == round(1000 / datagen.ROWS_PER_CUSTOMER)
+
+def test_suite_covers_every_public_function():
+    """customer/visit/payment/stats 의 모든 공개 함수에 벤치마크 항목이 있는지 테스트"""
+    assert suite.missing_cases() == []
+    assert set(suite.FUNCTION_CASES) == set(suite.discover())
+
+def test_measure_reports_latency_and_errors():
+    """측정 결과 형식과 실패 횟수 집계 테스트"""
+    result = suite.measure("sample", "function", lambda i: i % 2 == 0, iterations=10, warmup=1)
+
+    assert result["iterations"] == 10
+    assert result["errors"] == 5
+    assert result["min_ms"] <= result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"] <= result["max_ms"]
@@ -0,0 +1,139 @@
+"""
+기준 데이터 캐시 테스트 (DB 서버 없이 loader 대체)
+"""
+
+import threading
+from app import cache
+from app.cache import ReferenceCache
+
+def make_cache(values, ttl=60):
+    calls = []
+    reference = ReferenceCache(ttl)
+
+    def loader():
+        calls.append(1)
+        return values[min(len(calls), len(values)) - 1]
+
+    reference.register("methods", loader)
+    return reference, calls
+
+def test_cache_hit_and_invalidate():
+    """TTL 안에서는 한 번만 읽고, 무효화하면 다시 읽는지 테스트"""
+    reference, calls = make_cache([["CASH"], ["CASH", "CARD"]])
+
+    assert reference.get("methods") == ["CASH"]
+    assert reference.get("methods") == ["CASH"]
+    assert len(calls) == 1
+
+    reference.invalidate("methods")
+    assert reference.get("methods") == ["CASH", "CARD"]
+    assert reference.stats()["hits"] == 1
+    assert reference.stats()["misses"] == 2
+
+def test_cache_expires(monkeypatch):
+    """TTL 만료 후 다시 읽는지 테스트"""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    reference, calls = make_cache([["CASH"]], ttl=10)
+
+    reference.get("methods")
+    now[0] += 11
+    reference.get("methods")
+
+    assert len(calls) == 2
+
+def test_empty_result_not_cached():
+    """빈 결과(DB 연결 실패 등)는 보관하지 않음"""
+    reference, calls = make_cache([[], ["CASH"]])
+
+    assert reference.get("methods") == []
+    assert reference.get("methods") == ["CASH"]
+    assert reference.stats()["entries"] == ["methods"]
+
+def test_warm_up():
+    """미리 읽기 테스트"""
+    reference, calls = make_cache([["CASH"]])
+    reference.warm_up()
+
+    assert len(calls) == 1
+    assert reference.get("methods") == ["CASH"]
+    assert len(calls) == 1
+
+def test_slow_load_does_not_block_other_entries():
+    """한 항목을 읽는 동안에도 다른 항목 조회, 무효화, 통계가 기다리지 않는지 테스트"""
+    reference = ReferenceCache(60)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return ["CASH"]
+
+    reference.register("methods", slow_loader)
+    reference.register("codes", lambda: ["A"])
+    reference.get("codes")
+
+    loading = threading.Thread(target=reference.get, args=("methods",))
+    loading.start()
+    assert started.wait(5)
+
+    try:
+        finished = threading.Event()
+
+        def others():
+            reference.get("codes")
+            reference.invalidate("codes")
+            reference.stats()
+            finished.set()
+
+        threading.Thread(target=others).start()
+        assert finished.wait(1)
+    finally:
+        release.set()
+        loading.join()
+
+def test_concurrent_misses_load_once():
+    """같은 항목을 동시에 조회해도 loader 는 한 번만 실행되는지 테스트"""
+    calls, release = [], threading.Event()
+    reference = ReferenceCache(60)
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return ["CASH"]
+
+    reference.register("methods", loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(reference.get("methods"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["CASH"]] * 5
+    assert len(calls) == 1
+
+def test_loader_can_read_other_entries():
+    """loader 안에서 다른 항목을 조회해도 교착 상태가 되지 않는지 테스트"""
+    reference = ReferenceCache(60)
+    reference.register("codes", lambda: ["CASH"])
+    reference.register("names", lambda: {code: code.lower() for code in reference.get("codes")})
+
+    assert reference.get("names") == {"CASH": "cash"}
+
+def test_invalidate_during_load_discards_result():
+    """읽는 중 무효화되면 이전 데이터로 읽은 결과는 보관하지 않는지 테스트"""
+    reference, calls = make_cache([["CASH"], ["CASH", "CARD"]])
+    loader = reference._loaders["methods"][0]
+
+    def invalidating_loader():
+        value = loader()
+        reference.invalidate("methods")
+        return value
+
+    reference.register("methods", invalidating_loader)
+    assert reference.get("methods") == ["CASH"]
+
+    reference.register("methods", loader)
+    assert reference.get("methods") == ["CASH", "CARD"]
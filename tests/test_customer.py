@@ -3,7 +3,10 @@
 """
 
 import pytest
-from app.customer import create_customer, get_all_customers, search_customers, update_customer, delete_customer
+from datetime import date
+from app import customer as customer_module
+from app.customer import get_upcoming_birthdays
+from app.customer import create_customer, get_all_customers, search_customers, update_customer, delete_customer, create_customers_bulk, get_customers_page
 from tests.conftest import create_test_customer, cleanup_test_data
 
 def test_create_customer():
@@ -72,3 +75,65 @@ def test_delete_customer():
     # 확인
     customers = search_customers("삭제테스트")
     assert len(customers) == 0
+
+def test_create_customers_bulk():
+    """고객 일괄 등록 테스트"""
+    customers = [
+        {"name": "일괄고객1", "phone": "010-1000-0001", "birth_date": "1990-02-03", "gender": "F", "memo": ""},
+        {"name": "", "phone": "010-1000-0002", "birth_date": "1990-02-03", "gender": "M", "memo": ""},
+        {"name": "일괄고객3", "phone": "010-1000-0003", "birth_date": "잘못된날짜", "gender": "M", "memo": ""},
+        {"name": "일괄고객4", "phone": "010-1000-0004", "birth_date": None, "gender": None, "memo": None}
+    ]
+
+    result = create_customers_bulk(customers)
+    assert [error["index"] for error in result["errors"]] == [1, 2]
+    assert result["ids"][0] is not None
+    assert result["ids"][3] == result["ids"][0] + 1
+
+    # 정리
+    for customer_id in result["ids"]:
+        if customer_id:
+            delete_customer(customer_id)
+
+def test_get_customers_page():
+    """고객 목록 페이지 조회 테스트"""
+    page = get_customers_page(limit=10)
+    assert isinstance(page["items"], list)
+    assert len(page["items"]) <= 10
+    assert page["prev_cursor"] is None
+
+def test_get_upcoming_birthdays_wraparound(monkeypatch):
+    """연말을 넘어가는 다가오는 생일 조회 테스트 (DB 결과 대체)"""
+    calls = {}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        calls["query"], calls["params"] = query, params
+        return [
+            {"customer_id": 1, "name": "연초", "birth_date": date(1990, 1, 3)},
+            {"customer_id": 2, "name": "연말", "birth_date": date(1985, 12, 30)},
+            {"customer_id": 3, "name": "지난생일", "birth_date": date(1985, 12, 1)}
+        ]
+
+    monkeypatch.setattr(customer_module, "execute_query", fake_execute_query)
+    result = get_upcoming_birthdays(10, today=date(2023, 12, 28))
+
+    assert calls["params"] == (1228, 1231, 101, 107)
+    assert "MONTH(" not in calls["query"]
+    assert [row["name"] for row in result] == ["연말", "연초"]
+    assert result[0]["days_until"] == 2
+    assert result[1]["next_birthday"] == date(2024, 1, 3)
+
+def test_get_upcoming_birthdays_leap_day(monkeypatch):
+    """평년에는 2월 29일생을 3월 1일 생일로 조회"""
+    calls = {}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        calls["params"] = params
+        return [{"customer_id": 1, "name": "윤년생", "birth_date": date(2000, 2, 29)}]
+
+    monkeypatch.setattr(customer_module, "execute_query", fake_execute_query)
+    result = get_upcoming_birthdays(0, today=date(2023, 3, 1))
+
+    assert calls["params"] == (229, 301)
+    assert result[0]["next_birthday"] == date(2023, 3, 1)
+    assert result[0]["days_until"] == 0
@@ -0,0 +1,372 @@
+"""
+데이터베이스 계층 테스트 (DB 서버 없이 가짜 연결 사용)
+"""
+
+import threading
+import pytest
+from app import database
+from app.query_cache import QueryCache
+from app.database import ConnectionPool, PoolTimeoutError, execute_query, iter_query, transaction, bulk_insert, after_commit
+
+class FakeCursor:
+    """테스트용 가짜 커서"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=()):
+        if "FAIL" in query:
+            raise database.get_backend().Error("syntax error")
+        self.connection.executed.append(query)
+
+    def executemany(self, query, seq_params):
+        if any("FAIL" in str(params) for params in seq_params):
+            raise database.get_backend().IntegrityError("foreign key")
+        self.connection.executed.append(query)
+        self.rowcount = len(seq_params)
+        self.lastrowid = self.connection.next_id
+        self.connection.next_id += len(seq_params)
+
+    def fetchone(self):
+        return {"value": 1}
+
+    def fetchall(self):
+        return [{"value": 1}]
+
+    def fetchmany(self, size):
+        batch = self.connection.stream[:size]
+        del self.connection.stream[:size]
+        self.connection.fetches.append(len(batch))
+        return batch
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    """테스트용 가짜 연결"""
+
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+        self.executed = []
+        self.events = []
+        self.next_id = 1
+        self.stream = []
+        self.fetches = []
+
+    def is_connected(self):
+        return self.alive
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+    def start_transaction(self):
+        self.events.append("begin")
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.closed = True
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    options = {"size": 2, "max_overflow": 1, "timeout": 0.1, "idle_timeout": 300, "pre_ping": True}
+    options.update(kwargs)
+    return ConnectionPool(connect, **options), created
+
+def test_pool_reuses_connection():
+    """반납한 연결 재사용 테스트"""
+    pool, created = make_pool()
+
+    conn = pool.acquire()
+    conn.close()
+    conn = pool.acquire()
+    conn.close()
+
+    assert len(created) == 1
+    assert not created[0].closed
+
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+def test_pool_overflow_and_timeout():
+    """풀 크기 + overflow 초과 시 대기 후 타임아웃 테스트"""
+    pool, created = make_pool()
+
+    conns = [pool.acquire() for _ in range(3)]
+    assert pool.stats()["in_use"] == 3
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    for conn in conns:
+        conn.close()
+
+    # overflow 연결은 반납 시 닫힘
+    stats = pool.stats()
+    assert stats["idle"] == 2
+    assert stats["timeouts"] == 1
+    assert sum(1 for conn in created if conn.closed) == 1
+
+def test_pool_waiter_gets_released_connection():
+    """대기 중인 요청이 반납된 연결을 받는지 테스트"""
+    pool, created = make_pool(size=1, max_overflow=0, timeout=2)
+
+    conn = pool.acquire()
+    acquired = []
+
+    def worker():
+        acquired.append(pool.acquire())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    conn.close()
+    thread.join()
+
+    assert len(acquired) == 1
+    assert len(created) == 1
+    acquired[0].close()
+
+def test_pool_pre_ping_replaces_dead_connection():
+    """끊어진 유휴 연결 교체 테스트"""
+    pool, created = make_pool()
+
+    conn = pool.acquire()
+    conn.close()
+    created[0].alive = False
+
+    conn = pool.acquire()
+    conn.close()
+
+    assert len(created) == 2
+    assert created[0].closed
+    assert pool.stats()["discarded"] == 1
+
+def test_pool_idle_timeout():
+    """유휴 시간 초과 연결 교체 테스트"""
+    pool, created = make_pool(idle_timeout=0.01, pre_ping=False)
+
+    conn = pool.acquire()
+    conn.close()
+    threading.Event().wait(0.05)
+
+    pool.acquire().close()
+    assert len(created) == 2
+
+def test_pool_invalidate():
+    """폐기한 연결은 풀에 반납되지 않는지 테스트"""
+    pool, created = make_pool()
+
+    conn = pool.acquire()
+    conn.invalidate()
+
+    assert created[0].closed
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["in_use"] == 0
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """모듈 공용 풀을 가짜 연결 풀로 교체"""
+    pool, created = make_pool(size=2, max_overflow=0)
+    monkeypatch.setattr(database, "_pool", pool)
+    yield pool, created
+
+def test_transaction_shares_one_connection(fake_pool):
+    """작업 단위 안의 쿼리가 연결 하나와 커밋 한 번을 공유하는지 테스트"""
+    pool, created = fake_pool
+
+    with transaction():
+        execute_query("SELECT 1", fetch_one=True)
+        execute_query("UPDATE customer SET memo = ''")
+        execute_query("SELECT 2", fetch_all=True)
+
+    assert len(created) == 1
+    assert created[0].executed == ["SELECT 1", "UPDATE customer SET memo = ''", "SELECT 2"]
+    assert created[0].events == ["begin", "commit"]
+    assert pool.stats()["in_use"] == 0
+
+def test_transaction_rolls_back_on_exception(fake_pool):
+    """예외 발생 시 롤백 테스트"""
+    pool, created = fake_pool
+
+    with pytest.raises(RuntimeError):
+        with transaction():
+            execute_query("INSERT INTO visit VALUES ()")
+            raise RuntimeError("중단")
+
+    assert created[0].events == ["begin", "rollback"]
+    assert pool.stats()["in_use"] == 0
+
+def test_transaction_rolls_back_on_query_error(fake_pool):
+    """쿼리 오류 발생 시 작업 단위 전체 롤백 테스트"""
+    pool, created = fake_pool
+
+    with transaction():
+        execute_query("INSERT INTO visit VALUES ()")
+        execute_query("FAIL")
+
+    assert created[0].events == ["begin", "rollback"]
+
+def test_nested_transaction_joins_outer(fake_pool):
+    """중첩된 작업 단위는 바깥 트랜잭션에 참여하는지 테스트"""
+    pool, created = fake_pool
+
+    with transaction() as outer:
+        with transaction() as inner:
+            assert inner is outer
+            execute_query("SELECT 1", fetch_one=True)
+        execute_query("SELECT 2", fetch_one=True)
+
+    assert created[0].events == ["begin", "commit"]
+
+def test_transaction_without_queries_skips_connection(fake_pool):
+    """쿼리가 없으면 연결을 빌리지 않는지 테스트"""
+    pool, created = fake_pool
+
+    with transaction():
+        pass
+
+    assert created == []
+
+def test_after_commit_runs_only_on_commit(fake_pool):
+    """after_commit 콜백은 커밋 후에만 실행되는지 테스트"""
+    pool, created = fake_pool
+    calls = []
+
+    with transaction():
+        execute_query("INSERT INTO visit VALUES ()")
+        after_commit(lambda: calls.append("committed"))
+        assert calls == []
+
+    assert calls == ["committed"]
+
+    with transaction():
+        execute_query("FAIL")
+        after_commit(lambda: calls.append("rolled back"))
+
+    assert calls == ["committed"]
+
+    # 작업 단위 밖에서는 즉시 실행
+    after_commit(lambda: calls.append("now"))
+    assert calls == ["committed", "now"]
+
+@pytest.fixture
+def query_cache(monkeypatch):
+    """빈 쿼리 결과 캐시로 교체"""
+    cache = QueryCache(max_bytes=10 ** 6, ttl=60)
+    monkeypatch.setattr(database, "_query_cache", cache)
+    monkeypatch.setattr(database.Config, "QUERY_CACHE_ENABLED", True)
+    return cache
+
+def test_query_cache_hit_and_write_invalidation(fake_pool, query_cache):
+    """cache=True 조회는 재사용되고, 변경 문장은 해당 테이블 결과를 무효화"""
+    pool, created = fake_pool
+    query = "SELECT COUNT(*) AS total FROM visit"
+
+    execute_query(query, fetch_one=True, cache=True)
+    execute_query(query, fetch_one=True, cache=True)
+    assert created[0].executed.count(query) == 1
+
+    execute_query("DELETE FROM customer WHERE customer_id = %s", (1,))
+    execute_query(query, fetch_one=True, cache=True)
+    assert created[0].executed.count(query) == 2
+    assert query_cache.stats()["hits"] == 1
+
+def test_query_cache_bypassed_after_pending_write(fake_pool, query_cache):
+    """작업 단위에서 변경한 테이블을 읽으면 커밋 전까지 캐시를 우회"""
+    pool, created = fake_pool
+    query = "SELECT * FROM visit"
+
+    execute_query(query, fetch_all=True, cache=True)
+
+    with transaction():
+        execute_query(query, fetch_all=True, cache=True)
+        execute_query("INSERT INTO visit (customer_id) VALUES (1)")
+        execute_query(query, fetch_all=True, cache=True)
+        execute_query(query, fetch_all=True, cache=True)
+        assert query_cache.stats()["entries"] == 0
+
+    assert sum(conn.executed.count(query) for conn in created) == 3
+
+def test_query_cache_skips_failed_query(fake_pool, query_cache):
+    """오류로 반환된 기본값은 캐시하지 않음"""
+    execute_query("SELECT FAIL FROM visit", fetch_all=True, cache=True)
+    assert query_cache.stats()["entries"] == 0
+
+def test_bulk_insert_chunks_and_reports_errors(fake_pool):
+    """일괄 등록 시 청크 분할, ID 반환, 행/청크 단위 오류 보고 테스트"""
+    pool, created = fake_pool
+
+    def to_values(record):
+        if not record.get("name"):
+            raise ValueError("name 값이 비어 있습니다.")
+        return (record["name"],)
+
+    records = [{"name": "a"}, {"name": ""}, {"name": "b"}, {"name": "FAIL"}, {"name": "c"}, {}]
+    result = bulk_insert("INSERT INTO customer (name) VALUES (%s)", records, to_values, chunk_size=2)
+
+    # 청크: [a, b] 성공, [FAIL, c] 롤백
+    assert result["ids"] == [1, None, 2, None, None, None]
+    assert [error["index"] for error in result["errors"]] == [1, 3, 4, 5]
+    assert created[0].events == ["begin", "commit", "begin", "rollback"]
+
+def test_bulk_insert_on_chunk_runs_in_chunk_transaction(fake_pool):
+    """청크 후처리(집계 갱신 등)가 실패하면 그 청크도 롤백되고 오류로 보고"""
+    pool, created = fake_pool
+    seen = []
+
+    def on_chunk(ids):
+        seen.append(ids)
+        if len(seen) == 2:
+            raise RuntimeError("집계 갱신 실패")
+
+    records = [{"name": name} for name in "abcd"]
+    result = bulk_insert("INSERT INTO customer (name) VALUES (%s)", records, lambda record: (record["name"],),
+                         chunk_size=2, on_chunk=on_chunk)
+
+    assert seen == [[1, 2], [3, 4]]
+    assert result["ids"] == [1, 2, None, None]
+    assert [error["error"] for error in result["errors"]] == ["일괄 등록 후처리 실패 (청크 롤백)"] * 2
+    assert created[0].events == ["begin", "commit", "begin", "rollback"]
+
+def test_iter_query_streams_in_batches(fake_pool):
+    """스트리밍 조회 시 fetchmany 배치 단위로 읽고 연결을 반납하는지 테스트"""
+    pool, created = fake_pool
+
+    # 첫 연결 생성 후 스트리밍할 결과 지정
+    pool.acquire().close()
+    created[0].stream = [{"id": i} for i in range(5)]
+
+    rows = list(iter_query("SELECT id FROM customer", batch_size=2))
+
+    assert [row["id"] for row in rows] == [0, 1, 2, 3, 4]
+    assert created[0].fetches == [2, 2, 1, 0]
+    assert pool.stats()["idle"] == 1
+    assert not created[0].closed
+
+def test_iter_query_early_stop_discards_connection(fake_pool):
+    """소비자가 중간에 멈추면 연결을 폐기하는지 테스트"""
+    pool, created = fake_pool
+
+    pool.acquire().close()
+    created[0].stream = [{"id": i} for i in range(10)]
+
+    rows = iter_query("SELECT id FROM customer", batch_size=2)
+    assert next(rows)["id"] == 0
+    rows.close()
+
+    assert created[0].closed
+    assert pool.stats()["in_use"] == 0
+    assert pool.stats()["idle"] == 0
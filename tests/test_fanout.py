@@ -0,0 +1,64 @@
+"""
+독립 조회 병렬 실행(fan-out) 테스트 (DB 서버 없이 함수 대체)
+"""
+
+import threading
+import time
+from app.database import capture_queries, transaction, get_current_unit_of_work
+from app.fanout import Call, fan_out
+
+def test_calls_run_concurrently():
+    """조회들이 동시에 실행되어 전체 시간이 가장 느린 조회 시간에 가까운지 테스트"""
+    barrier = threading.Barrier(3, timeout=2)
+
+    def wait_for_others(value):
+        barrier.wait()  # 세 조회가 동시에 실행 중이어야 통과
+        return value
+
+    started = time.monotonic()
+    results = fan_out({name: Call(wait_for_others, name) for name in ("a", "b", "c")})
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert time.monotonic() - started < 1
+
+def test_errors_are_isolated():
+    """한 조회의 예외가 다른 조회 결과에 영향을 주지 않고 기본값으로 대체되는지 테스트"""
+    def fail():
+        raise RuntimeError("boom")
+
+    results = fan_out({
+        "ok": Call(lambda: [1, 2]),
+        "failed": Call(fail, default=[])
+    })
+
+    assert results == {"ok": [1, 2], "failed": []}
+
+def test_timeout_uses_default():
+    """제한 시간 안에 끝나지 않은 조회는 기본값을 사용하고 나머지는 기다리지 않는지 테스트"""
+    release = threading.Event()
+
+    started = time.monotonic()
+    results = fan_out({
+        "slow": Call(release.wait, 5, default="timeout", timeout=0.05),
+        "fast": Call(lambda: "done")
+    }, timeout=1)
+    release.set()
+
+    assert results == {"slow": "timeout", "fast": "done"}
+    assert time.monotonic() - started < 1
+
+def test_runs_inline_with_pending_writes():
+    """요청 트랜잭션에 커밋 전 변경이 있으면 현재 스레드에서 순서대로 실행하는지 테스트"""
+    def current_thread():
+        return threading.get_ident()
+
+    with transaction():
+        get_current_unit_of_work().written_tables.add("visit")
+        results = fan_out({"a": Call(current_thread), "b": Call(current_thread)})
+
+    assert results == {"a": threading.get_ident(), "b": threading.get_ident()}
+
+    with capture_queries():
+        results = fan_out({"a": Call(current_thread), "b": Call(current_thread)})
+
+    assert set(results.values()) == {threading.get_ident()}
@@ -0,0 +1,108 @@
+"""
+CSV 가져오기 테스트 (DB 서버 없이 일괄 등록 함수 대체)
+"""
+
+import io
+import datetime
+import pytest
+from app import importer
+from app.validators import normalize_phone, normalize_birth_date
+from app.visit import get_visits_by_customer
+from tests.conftest import create_test_customer, cleanup_test_data
+
+def test_normalize_phone():
+    """전화번호 정규화 테스트"""
+    assert normalize_phone("01012345678") == "010-1234-5678"
+    assert normalize_phone("010 1234 5678") == "010-1234-5678"
+    assert normalize_phone("+82 10-1234-5678") == "010-1234-5678"
+    assert normalize_phone("02-123-4567") == "02-123-4567"
+    assert normalize_phone("") is None
+
+    with pytest.raises(ValueError):
+        normalize_phone("12345")
+
+def test_normalize_birth_date():
+    """생년월일 정규화 테스트"""
+    expected = datetime.date(1990, 1, 2)
+    assert normalize_birth_date("1990-01-02") == expected
+    assert normalize_birth_date("1990.01.02.") == expected
+    assert normalize_birth_date("19900102") == expected
+    assert normalize_birth_date("") is None
+
+    with pytest.raises(ValueError):
+        normalize_birth_date("1990-13-40")
+
+def test_import_customers(monkeypatch):
+    """고객 CSV 가져오기 테스트 (배치 분할, 정규화, 거부 행 보고)"""
+    batches = []
+
+    def fake_bulk(records):
+        batches.append(records)
+        return {"ids": list(range(len(records))), "errors": []}
+
+    monkeypatch.setattr(importer, "create_customers_bulk", fake_bulk)
+
+    csv_text = (
+        "이름,연락처,생년월일,성별,메모\n"
+        "홍길동,01011112222,1990.01.02,남,\n"
+        "김영희,010-3333-4444,19910203,여성,VIP\n"
+        "이철수,123,1990-01-01,M,\n"
+        "박민수,01055556666,,,\n"
+    )
+
+    progress = []
+    report = importer.import_customers(io.StringIO(csv_text), batch_size=2, progress=progress.append)
+
+    assert report.total == 4
+    assert report.inserted == 3
+    assert report.rejected == 1
+    assert report.rejects[0]["line"] == 4
+    assert len(progress) == 2
+
+    first = batches[0][0]
+    assert first["phone"] == "010-1111-2222"
+    assert first["birth_date"] == datetime.date(1990, 1, 2)
+    assert first["gender"] == "M"
+    assert batches[0][1]["gender"] == "F"
+
+def test_import_visits_by_phone(monkeypatch):
+    """전화번호로 고객을 찾아 방문 기록을 가져오는지 테스트"""
+    inserted = []
+
+    monkeypatch.setattr(importer, "_find_customer_ids_by_phone",
+                        lambda phones: {"01011112222": 7})
+    monkeypatch.setattr(importer, "create_visits_bulk",
+                        lambda records: inserted.extend(records) or {"ids": [], "errors": []})
+
+    csv_text = (
+        "phone,visit_date,memo\n"
+        "010-1111-2222,2024-01-02 10:00,첫 방문\n"
+        "010-9999-9999,2024-01-03 10:00,미등록 고객\n"
+    )
+
+    report = importer.import_visits(io.StringIO(csv_text))
+
+    assert report.inserted == 1
+    assert report.rejected == 1
+    assert inserted[0]["customer_id"] == 7
+
+def test_import_visits_matches_unnormalized_phone():
+    """입력한 형식 그대로 저장된 전화번호의 고객도 찾는지 테스트 (phone_digits 로 비교)"""
+    customer_id = create_test_customer(name="가져오기고객", phone="01098765432")
+
+    csv_text = (
+        "phone,visit_date,memo\n"
+        "010-9876-5432,2024-01-02 10:00,정규화한 번호\n"
+        "01098765432,2024-01-03 10:00,저장된 형식 그대로\n"
+    )
+
+    try:
+        report = importer.import_visits(io.StringIO(csv_text))
+
+        assert report.rejected == 0, report.rejects
+        assert report.inserted == 2
+        assert len(get_visits_by_customer(customer_id)) == 2
+    finally:
+        for visit in get_visits_by_customer(customer_id) or []:
+            cleanup_test_data(visit_id=visit["visit_id"])
+        cleanup_test_data(customer_id=customer_id)
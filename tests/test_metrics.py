@@ -0,0 +1,97 @@
+"""
+메트릭 수집/내보내기 테스트 (DB 서버 불필요)
+"""
+
+import inspect
+import time
+import pytest
+from flask import Flask
+from app import metrics
+from app.metrics import Histogram, MetricsRegistry, timed
+
+def test_histogram_buckets_and_quantiles():
+    """히스토그램 누적 버킷 출력과 버킷 기준 분위수 추정 테스트"""
+    histogram = Histogram("test_seconds", "테스트", ("route",), buckets=(0.1, 1.0))
+    for value in [0.05] * 90 + [0.5] * 9 + [3.0]:
+        histogram.observe(value, "home")
+
+    samples = dict(histogram.samples())
+
+    assert samples['test_seconds_bucket{route="home",le="0.1"}'] == 90
+    assert samples['test_seconds_bucket{route="home",le="1.0"}'] == 99
+    assert samples['test_seconds_bucket{route="home",le="+Inf"}'] == 100
+    assert samples['test_seconds_count{route="home"}'] == 100
+    assert histogram.quantile(0.5, "home") == pytest.approx(0.1 * 50 / 90)
+    assert 0.1 < histogram.quantile(0.95, "home") < 1.0
+    assert histogram.quantile(0.999, "home") == 1.0
+    assert histogram.quantile(0.5, "other") is None
+
+def test_render_prometheus_text():
+    """HELP/TYPE 줄, 라벨 이스케이프, 분위수 게이지, 수집 함수 출력 테스트"""
+    registry = MetricsRegistry()
+    registry.counter("test_total", "요청 수", ("path",)).inc('/a"b')
+    registry.histogram("test_seconds", "시간").observe(0.002)
+    registry.collector(lambda: [("test_pool_in_use", "gauge", "사용 중", 3)])
+
+    text = registry.render()
+
+    assert "# TYPE test_total counter\n" in text
+    assert 'test_total{path="/a\\"b"} 1\n' in text
+    assert "# TYPE test_seconds histogram\n" in text
+    assert 'test_seconds_quantile{quantile="0.99"}' in text
+    assert "test_pool_in_use 3\n" in text
+
+def test_timed_records_calls_and_errors():
+    """@timed 가 함수별 호출 시간과 예외 수를 기록하는지 테스트"""
+    @timed
+    def lookup(fail=False):
+        if fail:
+            raise ValueError("잘못된 값")
+        return 1
+
+    label = f"{__name__.rpartition('.')[2]}.lookup"
+    before = metrics.function_duration.count(label)
+
+    assert lookup() == 1
+    with pytest.raises(ValueError):
+        lookup(fail=True)
+
+    assert lookup.__name__ == "lookup"
+    assert metrics.function_duration.count(label) - before == 2
+    assert metrics.function_errors.value(label) >= 1
+
+def test_timed_generator_records_iteration_time():
+    """제너레이터 함수는 생성이 아니라 소비 시간을 기록하는지 테스트"""
+    @timed
+    def stream(n):
+        for i in range(n):
+            time.sleep(0.01)
+            yield i
+
+    label = f"{__name__.rpartition('.')[2]}.stream"
+    before = metrics.function_duration.count(label)
+
+    rows = stream(3)
+    assert metrics.function_duration.count(label) == before
+    assert list(rows) == [0, 1, 2]
+    assert inspect.isgeneratorfunction(stream)
+    assert metrics.function_duration.count(label) - before == 1
+    assert metrics.function_duration.quantile(0.5, label) >= 0.025
+
+def test_request_hooks_record_endpoint_and_status():
+    """요청 훅이 라우트(endpoint)/상태 코드별 요청 수와 응답 시간을 기록하는지 테스트"""
+    app = Flask(__name__)
+    metrics.init_app(app)
+
+    @app.route("/ping")
+    def ping():
+        return "pong"
+
+    client = app.test_client()
+    before = metrics.http_request_duration.count("ping")
+    client.get("/ping")
+    client.get("/missing")
+
+    assert metrics.http_request_duration.count("ping") - before == 1
+    assert metrics.http_requests.value("ping", "GET", "200") >= 1
+    assert metrics.http_requests.value("unmatched", "GET", "404") >= 1
@@ -0,0 +1,50 @@
+"""
+스키마 마이그레이션 테스트 (DB 서버 없이 파일 탐색/문장 분리/쿼리 수집 확인)
+"""
+
+from app import migrate
+from app.database import capture_queries, execute_query, iter_query
+from app.customer import get_customer_by_customer
+
+def test_split_statements():
+    """주석 줄 제거 및 문장 분리 테스트"""
+    sql = (
+        "-- 인덱스 추가\n"
+        "CREATE INDEX idx_a ON a (x);\n"
+        "\n"
+        "CREATE INDEX idx_b\n"
+        "  ON b (y);\n"
+    )
+
+    assert migrate.split_statements(sql) == [
+        "CREATE INDEX idx_a ON a (x)",
+        "CREATE INDEX idx_b\n  ON b (y)"
+    ]
+
+def test_list_migrations(tmp_path):
+    """마이그레이션 파일을 버전 순으로 찾는지 테스트"""
+    (tmp_path / "0002_second.sql").write_text("SELECT 1;")
+    (tmp_path / "0001_first.sql").write_text("SELECT 1;")
+    (tmp_path / "notes.txt").write_text("")
+
+    migrations = migrate.list_migrations(str(tmp_path))
+
+    assert [(version, name) for version, name, _ in migrations] == [(1, "first"), (2, "second")]
+
+def test_bundled_migrations():
+    """저장소에 포함된 마이그레이션 파일 형식 확인"""
+    migrations = migrate.list_migrations()
+
+    assert migrations
+    assert [version for version, _, _ in migrations] == list(range(1, len(migrations) + 1))
+
+def test_capture_queries():
+    """쿼리 수집 모드에서는 DB에 접근하지 않고 SQL만 기록"""
+    with capture_queries() as captured:
+        assert execute_query("SELECT 1", fetch_all=True) == []
+        assert get_customer_by_customer(3) is None
+        assert list(iter_query("SELECT * FROM visit")) == []
+
+    assert captured[0] == ("SELECT 1", None)
+    assert captured[1][1] == (3,)
+    assert captured[2] == ("SELECT * FROM visit", None)
@@ -0,0 +1,77 @@
+"""
+키셋 페이지네이션 테스트 (DB 서버 없이 쿼리 결과 대체)
+"""
+
+import pytest
+from app import pagination
+from app.pagination import fetch_page, encode_cursor, decode_cursor, clamp_limit
+
+COLUMNS = [("name", "name"), ("customer_id", "customer_id")]
+
+@pytest.fixture
+def captured(monkeypatch):
+    """execute_query 호출 기록 및 결과 지정"""
+    calls = {"rows": []}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False):
+        calls["query"] = query
+        calls["params"] = params
+        return list(calls["rows"])
+
+    monkeypatch.setattr(pagination, "execute_query", fake_execute_query)
+    return calls
+
+def rows(*ids):
+    return [{"customer_id": i, "name": f"고객{i:02d}"} for i in ids]
+
+def test_cursor_round_trip():
+    """커서 인코딩/디코딩 테스트"""
+    cursor = encode_cursor(["홍길동", 3])
+    assert decode_cursor(cursor, 2) == ["홍길동", 3]
+    assert decode_cursor("잘못된커서", 2) is None
+    assert decode_cursor(cursor, 3) is None
+
+def test_clamp_limit():
+    """페이지 크기 보정 테스트"""
+    assert clamp_limit(None) == pagination.Config.PAGE_SIZE_DEFAULT
+    assert clamp_limit(10 ** 6) == pagination.Config.PAGE_SIZE_MAX
+
+def test_first_page(captured):
+    """첫 페이지 조회 테스트"""
+    captured["rows"] = rows(1, 2, 3)
+    page = fetch_page("SELECT * FROM customer", COLUMNS, limit=2)
+
+    assert "ORDER BY name ASC, customer_id ASC" in captured["query"]
+    assert captured["params"] == (3,)
+    assert [row["customer_id"] for row in page["items"]] == [1, 2]
+    assert decode_cursor(page["next_cursor"], 2) == ["고객02", 2]
+    assert page["prev_cursor"] is None
+
+def test_next_page(captured):
+    """다음 페이지 조회 테스트"""
+    captured["rows"] = rows(3, 4)
+    page = fetch_page("SELECT * FROM customer", COLUMNS, limit=2,
+                      after=encode_cursor(["고객02", 2]))
+
+    assert "(name > %s OR (name = %s AND customer_id > %s))" in captured["query"]
+    assert captured["params"] == ("고객02", "고객02", 2, 3)
+    assert page["next_cursor"] is None
+    assert decode_cursor(page["prev_cursor"], 2) == ["고객03", 3]
+
+def test_prev_page_descending(captured):
+    """내림차순 목록의 이전 페이지 조회 테스트"""
+    # 역순(오름차순)으로 조회된 결과가 원래 순서(내림차순)로 뒤집혀야 함
+    captured["rows"] = [{"visit_id": 11, "visit_date": "2024-01-02"},
+                        {"visit_id": 12, "visit_date": "2024-01-03"},
+                        {"visit_id": 13, "visit_date": "2024-01-04"}]
+    columns = [("v.visit_date", "visit_date"), ("v.visit_id", "visit_id")]
+    page = fetch_page("SELECT * FROM visit v", columns, descending=True, limit=2,
+                      before=encode_cursor(["2024-01-01", 10]),
+                      where=["v.customer_id = %s"], params=(7,))
+
+    assert "v.customer_id = %s AND (v.visit_date > %s" in captured["query"]
+    assert "ORDER BY v.visit_date ASC, v.visit_id ASC" in captured["query"]
+    assert captured["params"] == (7, "2024-01-01", "2024-01-01", 10, 3)
+    assert [row["visit_id"] for row in page["items"]] == [12, 11]
+    assert decode_cursor(page["next_cursor"], 2) == ["2024-01-02", 11]
+    assert decode_cursor(page["prev_cursor"], 2) == ["2024-01-03", 12]
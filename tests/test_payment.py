@@ -4,7 +4,8 @@
 
 import pytest
 import datetime
-from app.payment import create_payment, get_all_payments, get_payments_by_customer, update_payment, delete_payment, get_payment_methods
+from app import payment as payment_module
+from app.payment import create_payment, get_all_payments, get_payments_by_customer, update_payment, delete_payment, get_payment_methods, create_payments_bulk, get_payments_page
 from tests.conftest import create_test_customer, create_test_visit, create_test_payment, cleanup_test_data
 
 def test_create_payment(test_visit):
@@ -73,3 +74,39 @@ def test_get_payment_methods():
     methods = get_payment_methods()
     assert isinstance(methods, list)
     assert len(methods) > 0
+
+def test_create_payments_bulk(test_visit):
+    """결제 일괄 등록 테스트"""
+    customer_id, visit_id = test_visit
+
+    payments = [
+        {"visit_id": visit_id, "amount": 10000, "payment_method_code": "CASH", "payment_datetime": datetime.datetime.now()},
+        {"visit_id": visit_id, "amount": -1, "payment_method_code": "CASH", "payment_datetime": datetime.datetime.now()},
+        {"visit_id": visit_id, "amount": 20000, "payment_method_code": "CARD", "payment_datetime": "2024-01-02T10:30"}
+    ]
+
+    result = create_payments_bulk(payments)
+    assert [error["index"] for error in result["errors"]] == [1]
+    assert len(get_payments_by_customer(customer_id)) == 2
+
+def test_get_payments_page(test_payment):
+    """결제 기록 페이지 조회 테스트"""
+    page = get_payments_page(limit=1)
+    assert len(page["items"]) == 1
+    assert page["prev_cursor"] is None
+
+def test_method_names_from_cache(monkeypatch):
+    """결제 수단 이름은 캐시에서 매핑하고, 모르는 코드가 있으면 한 번 다시 읽는지 테스트 (DB 결과 대체)"""
+    loaded = [[{"method_code": "CASH", "method_name": "현금"}],
+              [{"method_code": "CASH", "method_name": "현금"}, {"method_code": "CARD", "method_name": "카드"}]]
+    reference_cache = payment_module.reference_cache
+    monkeypatch.setitem(reference_cache._loaders, "payment_methods", (lambda: loaded.pop(0), None))
+    reference_cache.invalidate("payment_methods")
+
+    payments = [{"payment_method_code": "CASH"}, {"payment_method_code": "CARD"}]
+    payment_module._with_method_names(payments)
+
+    assert [payment["method_name"] for payment in payments] == ["현금", "카드"]
+    assert loaded == []
+
+    reference_cache.invalidate("payment_methods")
@@ -0,0 +1,76 @@
+"""
+쿼리 결과 캐시 테스트
+"""
+
+from app import query_cache
+from app.query_cache import QueryCache, normalize_sql, statement_tables, affected_tables, is_write
+
+def test_sql_helpers():
+    """SQL 정규화, 테이블 추출, 변경 문장 판별 테스트"""
+    assert normalize_sql("SELECT *\n    FROM customer\n") == "SELECT * FROM customer"
+    assert statement_tables("""
+        SELECT v.*, c.name FROM visit v
+        JOIN customer c ON v.customer_id = c.customer_id
+        LEFT JOIN payment p ON v.visit_id = p.visit_id
+    """) == {"visit", "customer", "payment"}
+    assert statement_tables("INSERT INTO visit (customer_id) VALUES (%s)") == {"visit"}
+    assert affected_tables("DELETE FROM customer WHERE customer_id = %s") == {"customer", "visit", "payment", "customer_summary"}
+
+    assert is_write("  UPDATE customer SET memo = %s")
+    assert not is_write("\n SELECT 1")
+
+def test_hit_miss_and_copy():
+    """적중/미적중 집계 및 결과 복사 테스트"""
+    cache = QueryCache(max_bytes=10 ** 6, ttl=60)
+    key = QueryCache.make_key("SELECT * FROM customer", None, False)
+
+    assert cache.get(key) == (False, None)
+    cache.put(key, [{"name": "홍길동"}], {"customer"})
+
+    hit, rows = cache.get(key)
+    rows[0]["name"] = "변경"
+
+    assert hit
+    assert cache.get(key)[1] == [{"name": "홍길동"}]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+def test_invalidate_tables():
+    """테이블 태그 무효화 테스트"""
+    cache = QueryCache(max_bytes=10 ** 6, ttl=60)
+    cache.put("visits", [{"v": 1}], {"visit", "customer"})
+    cache.put("methods", [{"m": 1}], {"payment_method"})
+
+    cache.invalidate_tables({"customer"})
+
+    assert cache.get("visits") == (False, None)
+    assert cache.get("methods")[0]
+    assert cache.stats()["invalidations"] == 1
+
+def test_lru_memory_limit():
+    """크기 상한을 넘으면 가장 오래 사용하지 않은 결과부터 제거"""
+    row = [{"memo": "x" * 1000}]
+    size = query_cache.estimate_size(row)
+    cache = QueryCache(max_bytes=size * 2, ttl=60)
+
+    cache.put("a", row, {"customer"})
+    cache.put("b", row, {"customer"})
+    cache.get("a")
+    cache.put("c", row, {"customer"})
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a")[0] and cache.get("c")[0]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == size * 2
+
+def test_ttl(monkeypatch):
+    """TTL 만료 테스트"""
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(max_bytes=10 ** 6, ttl=5)
+
+    cache.put("a", {"total": 1}, {"visit"})
+    now[0] += 6
+
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,126 @@
+"""
+쿼리 실행 계측 테스트 (DB 서버 없이 가짜 연결 풀 사용)
+"""
+
+import asyncio
+import time
+import pytest
+from flask import Flask
+from app import database
+from app.database import execute_query, iter_query
+from app.query_stats import AsyncTimedCursor, QueryStats, QueryTiming, fingerprint
+from tests.test_database import FakeConnection, FakeCursor, make_pool
+
+def test_fingerprint_removes_values_and_list_lengths():
+    """값, 자리표시자, IN 목록 길이가 달라도 같은 지문인지 테스트"""
+    a = fingerprint("SELECT * FROM visit\n WHERE customer_id IN (%s, %s) AND memo = 'a' LIMIT 5")
+    b = fingerprint("SELECT * FROM visit WHERE customer_id IN (%s, %s, %s) AND memo = 'b' LIMIT 10")
+
+    assert a == b == "SELECT * FROM visit WHERE customer_id IN (?+) AND memo = ? LIMIT ?"
+    assert fingerprint("SELECT * FROM t1") == "SELECT * FROM t1"
+
+@pytest.fixture
+def query_stats(monkeypatch):
+    """가짜 연결 풀과 빈 통계로 교체 (느린 쿼리 기준 0.01초)"""
+    pool, created = make_pool(size=2, max_overflow=0)
+    stats = QueryStats(slow_seconds=0.01)
+    monkeypatch.setattr(database, "_pool", pool)
+    monkeypatch.setattr(database, "_query_stats", stats)
+    monkeypatch.setattr(database.Config, "QUERY_STATS_ENABLED", True)
+    monkeypatch.setattr(database.Config, "QUERY_CACHE_ENABLED", False)
+    return created
+
+def test_queries_are_timed_by_fingerprint(query_stats):
+    """쿼리마다 지문별 횟수/행 수가 누적되는지 테스트"""
+    execute_query("SELECT * FROM visit WHERE visit_id = %s", (1,), fetch_one=True)
+    execute_query("SELECT * FROM visit WHERE visit_id = %s", (2,), fetch_one=True)
+    execute_query("DELETE FROM visit WHERE visit_id = %s", (3,))
+
+    stats = database.get_query_stats()
+    by_fingerprint = {entry["fingerprint"]: entry for entry in stats["statements"]}
+
+    assert stats["queries"] == 3
+    assert by_fingerprint["SELECT * FROM visit WHERE visit_id = ?"]["count"] == 2
+    assert by_fingerprint["SELECT * FROM visit WHERE visit_id = ?"]["rows"] == 2
+    assert by_fingerprint["DELETE FROM visit WHERE visit_id = ?"]["count"] == 1
+
+    database.clear_query_stats()
+    assert database.get_query_stats()["queries"] == 0
+
+def test_iter_query_counts_streamed_rows(query_stats, monkeypatch):
+    """스트리밍 조회의 행 수가 배치마다 합산되는지 테스트"""
+    def connect():
+        conn = FakeConnection()
+        conn.stream = [{"id": i} for i in range(5)]
+        return conn
+
+    monkeypatch.setattr(database, "_pool", database.ConnectionPool(connect, size=1, max_overflow=0, timeout=0.1))
+
+    assert len(list(iter_query("SELECT id FROM visit", batch_size=2))) == 5
+    assert database.get_query_stats()["statements"][0]["rows"] == 5
+
+def test_slow_query_is_logged(query_stats, monkeypatch, capsys, tmp_path):
+    """기준 시간을 넘은 쿼리가 출력과 파일에 느린 쿼리로 기록되는지 테스트"""
+    log_path = tmp_path / "slow.log"
+    stats = QueryStats(slow_seconds=0.01, slow_log_path=str(log_path))
+    monkeypatch.setattr(database, "_query_stats", stats)
+
+    execute = FakeCursor.execute
+
+    def slow_execute(cursor, query, params=()):
+        if "SLEEP" in query:
+            time.sleep(0.02)
+        return execute(cursor, query, params)
+
+    monkeypatch.setattr(FakeCursor, "execute", slow_execute)
+
+    execute_query("SELECT SLEEP(%s)", (0.02,), fetch_one=True)
+    execute_query("SELECT 1", fetch_one=True)
+
+    assert stats.stats()["slow"] == 1
+    assert "[SLOW]" in capsys.readouterr().out
+    assert "SELECT SLEEP(?)" in log_path.read_text(encoding="utf-8")
+
+def test_request_headers_and_repeat_warning(query_stats, monkeypatch, capsys):
+    """요청별 쿼리 수/DB 시간 헤더와 같은 쿼리 반복(N+1) 경고 테스트"""
+    monkeypatch.setattr(database.Config, "QUERY_REPEAT_WARN", 3)
+    app = Flask(__name__)
+    app.secret_key = "test"
+    database.init_app(app)
+
+    @app.route("/visits")
+    def visits():
+        for visit_id in range(4):
+            execute_query("SELECT * FROM payment WHERE visit_id = %s", (visit_id,), fetch_all=True)
+        return "ok"
+
+    response = app.test_client().get("/visits")
+
+    assert response.headers["X-DB-Queries"] == "4"
+    assert float(response.headers["X-DB-Time"]) >= 0
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert "같은 쿼리 4회 반복" in capsys.readouterr().out
+
+def test_async_timed_cursor_times_awaited_calls():
+    """비동기 커서 래퍼가 코루틴 생성이 아니라 완료까지의 실행/읽기 시간과 행 수를 기록하는지 테스트"""
+    class FakeAsyncCursor:
+        rowcount = -1
+
+        async def execute(self, query, params):
+            await asyncio.sleep(0.02)
+
+        async def fetchall(self):
+            await asyncio.sleep(0.02)
+            return [{"n": 1}, {"n": 2}]
+
+    async def scenario(cursor):
+        await cursor.execute("SELECT n FROM t", ())
+        return await cursor.fetchall()
+
+    timing = QueryTiming()
+    rows = asyncio.run(scenario(AsyncTimedCursor(FakeAsyncCursor(), timing)))
+
+    assert len(rows) == 2
+    assert timing.query == "SELECT n FROM t"
+    assert timing.execute >= 0.015 and timing.fetch >= 0.015
+    assert timing.rows == 2
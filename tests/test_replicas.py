@@ -0,0 +1,118 @@
+"""
+읽기 복제본 선택/조회 분기 테스트 (DB 서버 없이 가짜 연결 풀 사용)
+"""
+
+import pytest
+import main
+from app import database
+from app.database import ConnectionPool, execute_query, iter_query, transaction, prefer_primary
+from app.replicas import ReplicaRouter
+from tests.test_database import make_pool
+
+def test_router_skips_lagging_replicas():
+    """복제 지연이 허용치를 넘거나 복제가 멈춘 복제본은 제외하고 돌아가며 선택"""
+    lags = {"a": 0.0, "b": 30.0, "c": None}
+    router = ReplicaRouter([(name, name) for name in lags], lambda pool: lags[pool], max_lag=5, check_interval=60)
+
+    assert {router.choose().name for _ in range(4)} == {"a"}
+
+    lags["b"] = 1.0
+    router.check()
+    assert {router.choose().name for _ in range(4)} == {"a", "b"}
+
+    lags.update(a=None, b=None)
+    router.check()
+    assert router.choose() is None
+    assert router.stats()["fallbacks"] == 1
+    assert [replica["healthy"] for replica in router.stats()["replicas"]] == [False, False, False]
+
+@pytest.fixture
+def replica(monkeypatch):
+    """기본 DB 와 복제본 1개를 가짜 연결 풀로 교체"""
+    primary, primary_created = make_pool(size=2, max_overflow=0)
+    replica_pool, replica_created = make_pool(size=2, max_overflow=0)
+    router = ReplicaRouter([("replica", replica_pool)], lambda pool: 0.0, max_lag=5, check_interval=60)
+
+    monkeypatch.setattr(database, "_pool", primary)
+    monkeypatch.setattr(database, "_router", router)
+    monkeypatch.setattr(database, "_router_loaded", True)
+    monkeypatch.setattr(database.Config, "QUERY_CACHE_ENABLED", False)
+    database._local.written_at = None
+
+    yield primary_created, replica_created, router
+
+    database._local.written_at = None
+    database._local.primary_until = 0.0
+
+def _executed(created):
+    return [query for conn in created for query in conn.executed]
+
+def test_reads_go_to_replica(replica):
+    """결과를 읽는 SELECT 와 스트리밍 조회는 복제본에서 실행"""
+    primary_created, replica_created, _ = replica
+
+    execute_query("SELECT * FROM visit", fetch_all=True)
+    list(iter_query("SELECT * FROM payment"))
+
+    assert _executed(replica_created) == ["SELECT * FROM visit", "SELECT * FROM payment"]
+    assert _executed(primary_created) == []
+
+def test_writes_and_read_your_writes_stay_on_primary(replica):
+    """변경, 명시적 트랜잭션 안의 조회, 변경 직후 조회, 잠금 조회는 기본 DB 에서 실행"""
+    primary_created, replica_created, _ = replica
+
+    with transaction():
+        execute_query("SELECT * FROM visit WHERE visit_id = %s", (1,), fetch_one=True)
+    execute_query("SELECT * FROM visit FOR UPDATE", fetch_all=True)
+    with prefer_primary():
+        execute_query("SELECT 1", fetch_one=True)
+
+    execute_query("DELETE FROM visit WHERE visit_id = %s", (1,))
+    execute_query("SELECT * FROM visit", fetch_all=True)
+
+    assert _executed(replica_created) == []
+    assert _executed(primary_created) == [
+        "SELECT * FROM visit WHERE visit_id = %s",
+        "SELECT * FROM visit FOR UPDATE",
+        "SELECT 1",
+        "DELETE FROM visit WHERE visit_id = %s",
+        "SELECT * FROM visit"
+    ]
+
+def test_falls_back_to_primary_when_replica_down(replica, monkeypatch):
+    """복제본 연결에 실패하면 복제본을 제외하고 기본 DB 에서 다시 조회"""
+    primary_created, _, router = replica
+
+    def refuse():
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(router.replicas[0], "pool", ConnectionPool(refuse, size=1, max_overflow=0, timeout=0.1))
+
+    assert execute_query("SELECT 1", fetch_one=True) == {"value": 1}
+    assert _executed(primary_created) == ["SELECT 1"]
+    assert router.stats()["replicas"][0]["healthy"] is False
+
+def test_read_your_writes_pin_survives_another_app_instance(replica, monkeypatch):
+    """SECRET_KEY 를 공유하면 다른 워커(앱 인스턴스)의 요청도 변경 직후 조회를 기본 DB 에서 실행"""
+    primary_created, replica_created, _ = replica
+    monkeypatch.setattr(database.Config, "SECRET_KEY", "shared-secret")
+    monkeypatch.setattr(database.Config, "REFERENCE_CACHE_WARM_UP", False)
+    writer, reader = main.create_app(), main.create_app()
+
+    @writer.route("/test/write")
+    def write():
+        execute_query("DELETE FROM visit WHERE visit_id = %s", (1,))
+        return "ok"
+
+    @reader.route("/test/read")
+    def read():
+        execute_query("SELECT * FROM visit", fetch_all=True)
+        return "ok"
+
+    writer_client, reader_client = writer.test_client(), reader.test_client()
+    writer_client.get("/test/write")
+    reader_client.set_cookie("session", writer_client.get_cookie("session").value)
+    reader_client.get("/test/read")
+
+    assert _executed(replica_created) == []
+    assert _executed(primary_created)[-1] == "SELECT * FROM visit"
@@ -0,0 +1,82 @@
+"""
+일별 집계(daily_stats) 테스트 (DB 서버 없이 쿼리 결과 대체)
+"""
+
+import datetime
+import pytest
+from app import rollup, stats
+
+@pytest.fixture
+def queries(monkeypatch):
+    """execute_query 호출 기록 및 쿼리별 결과 지정"""
+    calls = {"queries": [], "results": {}}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        calls["queries"].append((query, params))
+        for keyword, rows in calls["results"].items():
+            if keyword in query:
+                return list(rows)
+        return [] if fetch_all else None
+
+    monkeypatch.setattr(rollup, "execute_query", fake_execute_query)
+    monkeypatch.setattr(stats, "execute_query", fake_execute_query)
+    return calls
+
+def test_refresh_recomputes_only_changed_days(queries):
+    """변경된 날짜만 삭제 후 날짜별 [날짜, 다음 날) 범위로 다시 집계"""
+    rollup.refresh_daily_stats([datetime.datetime(2024, 3, 1, 15, 0), "2024-03-01", datetime.date(2024, 3, 5), None])
+
+    delete, first_insert = queries["queries"][:2]
+    assert delete == ("DELETE FROM daily_stats WHERE stat_date IN (%s, %s)",
+                      (datetime.date(2024, 3, 1), datetime.date(2024, 3, 5)))
+    assert first_insert[1] == (datetime.date(2024, 3, 1), datetime.date(2024, 3, 2),
+                               datetime.date(2024, 3, 5), datetime.date(2024, 3, 6))
+    assert len(queries["queries"]) == 3
+
+def test_refresh_many_days_in_chunks(queries):
+    """여러 해에 걸친 날짜도 기간 전체가 아니라 변경된 날짜만 청크 단위로 재계산"""
+    start = datetime.date(2020, 1, 1)
+    days = [start + datetime.timedelta(days=7 * n) for n in range(rollup.REFRESH_CHUNK_DAYS + 1)]
+    rollup.refresh_daily_stats(days)
+
+    deletes = [params for query, params in queries["queries"] if query.startswith("DELETE FROM daily_stats")]
+    assert [len(params) for params in deletes] == [rollup.REFRESH_CHUNK_DAYS, 1]
+    assert sum(deletes, ()) == tuple(days)
+    assert len(queries["queries"]) == 6
+
+def test_rebuild_all_without_range(queries):
+    """기간을 생략하면 조건 없이 전체 재계산"""
+    rollup.rebuild_daily_stats()
+
+    assert [query.split()[0] for query, _ in queries["queries"]] == ["DELETE", "INSERT", "INSERT"]
+    assert all("WHERE" not in query and params == () for query, params in queries["queries"])
+
+def test_monthly_series_from_daily_stats(queries):
+    """월별 통계는 일별 집계 합계와 방문 고객 수를 합쳐 빈 월은 0으로 채움"""
+    queries["results"] = {
+        "FROM daily_stats": [{"year": 2024, "month": 2, "total_visits": 3, "total_revenue": 90000, "avg_revenue_per_visit": 30000}],
+        "COUNT(DISTINCT customer_id)": [{"year": 2024, "month": 2, "unique_customers": 2}]
+    }
+
+    series = stats.get_monthly_series(datetime.date(2024, 1, 1), datetime.date(2024, 3, 1))
+
+    assert [(item["year"], item["month"]) for item in series] == [(2024, 1), (2024, 2)]
+    assert series[0]["stats"] == {"unique_customers": 0, "total_visits": 0, "total_revenue": 0, "avg_revenue_per_visit": 0}
+    assert series[1]["stats"] == {"unique_customers": 2, "total_visits": 3, "total_revenue": 90000, "avg_revenue_per_visit": 30000}
+
+def test_range_statistics_by_method(queries):
+    """기간 통계는 날짜별 합계 행과 결제 수단별 행을 나눠 합산"""
+    queries["results"] = {"FROM daily_stats": [
+        {"stat_date": datetime.date(2024, 3, 1), "payment_method_code": "", "visit_count": 2, "unique_customers": 2, "revenue_sum": 30000, "payment_count": 2},
+        {"stat_date": datetime.date(2024, 3, 1), "payment_method_code": "CARD", "visit_count": 1, "unique_customers": 1, "revenue_sum": 20000, "payment_count": 1},
+        {"stat_date": datetime.date(2024, 3, 1), "payment_method_code": "CASH", "visit_count": 1, "unique_customers": 1, "revenue_sum": 10000, "payment_count": 1},
+        {"stat_date": datetime.date(2024, 3, 2), "payment_method_code": "", "visit_count": 1, "unique_customers": 1, "revenue_sum": 5000, "payment_count": 1},
+        {"stat_date": datetime.date(2024, 3, 2), "payment_method_code": "CASH", "visit_count": 1, "unique_customers": 1, "revenue_sum": 5000, "payment_count": 1}
+    ]}
+
+    result = stats.get_range_statistics(datetime.date(2024, 3, 1), datetime.date(2024, 3, 2))
+
+    assert result["total_visits"] == 3
+    assert result["total_revenue"] == 35000
+    assert result["total_payments"] == 3
+    assert [(m["payment_method_code"], m["revenue_sum"]) for m in result["by_method"]] == [("CARD", 20000), ("CASH", 15000)]
@@ -0,0 +1,69 @@
+"""
+고객 검색 테스트 (DB 서버 없이 쿼리 결과 대체)
+"""
+
+import datetime
+import pytest
+from app import search
+
+@pytest.fixture
+def queries(monkeypatch):
+    """execute_query 호출 기록 및 쿼리별 결과 지정"""
+    calls = {"queries": [], "results": {}}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False):
+        calls["queries"].append((query, params))
+        for keyword, rows in calls["results"].items():
+            if keyword in query:
+                return list(rows)
+        return []
+
+    monkeypatch.setattr(search, "execute_query", fake_execute_query)
+    return calls
+
+def test_name_search_uses_fulltext(queries):
+    """두 글자 이상 이름은 ngram FULLTEXT 구문 검색"""
+    search.search_customers("길동", limit=10)
+
+    query, params = queries["queries"][0]
+    assert "MATCH(name) AGAINST" in query
+    assert "LIKE %s OR" not in query
+    assert params == ("길동", "길동%", '"길동"', '"길동"', 10)
+
+def test_short_name_uses_prefix(queries):
+    """한 글자 이름 검색은 이름 인덱스 앞부분 일치 (LIKE 특수문자 이스케이프)"""
+    search.search_customers("%")
+
+    query, params = queries["queries"][0]
+    assert "WHERE name LIKE %s" in query
+    assert params[1] == "\\%%"
+
+def test_phone_search(queries):
+    """전화번호는 숫자만 남겨 앞부분/뒷자리 일치로 검색"""
+    search.search_customers("010-1234")
+    assert [params[-2] for _, params in queries["queries"]] == ["0101234%", "4321010%"]
+
+    queries["queries"].clear()
+    search.search_customers("12")
+    assert queries["queries"] == []
+
+def test_birth_date_search(queries):
+    """생년월일 형식 검색어는 birth_date 일치 조회 포함"""
+    search.search_customers("1990.01.02")
+
+    query, params = queries["queries"][0]
+    assert "WHERE birth_date = %s" in query
+    assert params[0] == datetime.date(1990, 1, 2)
+
+def test_results_ranked_and_deduplicated(queries):
+    """여러 조회 결과를 합쳐 순위순으로 정렬하고 중복 제거"""
+    queries["results"] = {
+        "phone_digits_rev": [{"customer_id": 1, "name": "나", "search_rank": 1, "search_score": 0},
+                             {"customer_id": 2, "name": "가", "search_rank": 1, "search_score": 0}],
+        "phone_digits LIKE": [{"customer_id": 1, "name": "나", "search_rank": 0, "search_score": 0}]
+    }
+
+    results = search.search_customers("01012345678", limit=1)
+
+    assert [row["customer_id"] for row in results] == [1]
+    assert results[0]["search_rank"] == 0
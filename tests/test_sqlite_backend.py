@@ -0,0 +1,140 @@
+"""
+내장 SQLite 백엔드 테스트 (SQL 변환, 값 변환, 스키마 생성, mysql.connector 호환 동작)
+"""
+
+import sqlite3
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from app import migrate, sqlite_backend
+from app.backends import get_backend
+from app.sqlite_backend import translate, to_sqlite
+
+@pytest.fixture
+def connection(tmp_path):
+    """스키마가 생성된 새 SQLite 파일 DB 연결"""
+    conn = sqlite_backend.connect(str(tmp_path / "crm.sqlite3"))
+    yield conn
+    conn.close()
+
+def test_translate_dml():
+    """파라미터 표시, FULLTEXT 검색, LIKE 이스케이프, 나눗셈, 잠금 읽기 변환 테스트"""
+    (query,) = translate("SELECT *, MATCH(name) AGAINST (%s IN BOOLEAN MODE) AS score FROM customer "
+                         "WHERE name LIKE %s AND total / count > %s FOR UPDATE")
+
+    assert query == ("SELECT *, MATCH_AGAINST(name, ?) AS score FROM customer "
+                     "WHERE name LIKE ? ESCAPE '\\' AND total * 1.0 / count > ?")
+
+def test_translate_ddl():
+    """AUTO_INCREMENT, 여러 컬럼 ALTER TABLE, 저장 생성 컬럼, FULLTEXT 인덱스 변환 테스트"""
+    (create,) = translate("CREATE TABLE t (id INT PRIMARY KEY AUTO_INCREMENT, name VARCHAR(20))")
+    alters = translate("ALTER TABLE t\n  ADD COLUMN a INT GENERATED ALWAYS AS (id * 2) STORED,\n"
+                       "  ADD COLUMN b INT GENERATED ALWAYS AS (a + 1) STORED")
+
+    assert "id INTEGER PRIMARY KEY AUTOINCREMENT" in create
+    assert alters == ("ALTER TABLE t ADD COLUMN a INT GENERATED ALWAYS AS (id * 2) VIRTUAL",
+                      "ALTER TABLE t ADD COLUMN b INT GENERATED ALWAYS AS (a + 1) VIRTUAL")
+    assert translate("CREATE FULLTEXT INDEX ft ON customer (name) WITH PARSER ngram") == ()
+
+def test_value_conversion():
+    """파라미터는 MySQL 저장 형식으로 변환하고, 문자열은 형식과 관계없이 그대로 전달"""
+    assert to_sqlite(datetime(2024, 3, 1, 9, 30, 15, 500)) == "2024-03-01 09:30:15"
+    assert to_sqlite(date(2024, 3, 1)) == "2024-03-01"
+    assert to_sqlite(Decimal("1500")) == 1500
+    assert to_sqlite("2024-03-01T09:30") == "2024-03-01T09:30"
+    assert to_sqlite("010-1234-5678") == "010-1234-5678"
+
+def test_result_conversion_by_declared_type(connection):
+    """DATE/DATETIME 컬럼만 date/datetime 으로 반환하고, 날짜 형식의 메모는 문자열 그대로 반환"""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("INSERT INTO customer (name, birth_date, memo) VALUES (%s, %s, %s)",
+                   ("홍길동", date(1990, 3, 15), "2024-01-01"))
+    customer_id = cursor.lastrowid
+    cursor.execute("INSERT INTO visit (customer_id, visit_date, memo) VALUES (%s, %s, %s)",
+                   (customer_id, datetime(2024, 3, 1, 9, 30), "2024-03-01 09:30:00"))
+
+    cursor.execute("SELECT birth_date, memo FROM customer WHERE customer_id = %s", (customer_id,))
+    assert cursor.fetchone() == {"birth_date": date(1990, 3, 15), "memo": "2024-01-01"}
+
+    cursor.execute("SELECT v.visit_date, v.memo, MAX(v.visit_date) AS last_visit_date FROM visit v "
+                   "WHERE v.customer_id = %s", (customer_id,))
+    assert cursor.fetchone() == {"visit_date": datetime(2024, 3, 1, 9, 30), "memo": "2024-03-01 09:30:00",
+                                 "last_visit_date": "2024-03-01 09:30:00"}
+
+def test_schema_and_mysql_functions(connection):
+    """스키마/마이그레이션 적용, 생성 컬럼, MySQL 함수(YEAR, MONTH, IF) 동작 테스트"""
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("SELECT COUNT(*) AS n FROM schema_version")
+    assert cursor.fetchone()["n"] == len(migrate.list_migrations())
+
+    cursor.execute("INSERT INTO customer (name, phone, birth_date) VALUES (%s, %s, %s)",
+                   ("홍길동", "010-1234-5678", date(1990, 3, 15)))
+    cursor.execute("""
+    SELECT birth_mmdd, phone_digits, phone_digits_rev, YEAR(birth_date) AS y, MONTH(birth_date) AS m,
+           IF(name = %s, 0, 1) AS search_rank, MATCH(name) AGAINST (%s IN BOOLEAN MODE) AS search_score
+    FROM customer WHERE customer_id = %s
+    """, ("홍길동", '"길동"', cursor.lastrowid))
+
+    assert cursor.fetchone() == {
+        "birth_mmdd": 315, "phone_digits": "01012345678", "phone_digits_rev": "87654321010",
+        "y": 1990, "m": 3, "search_rank": 0, "search_score": 1.0
+    }
+
+def test_executemany_returns_first_id_and_is_atomic(connection):
+    """executemany 는 첫 번째 생성 ID 를 반환하고, 한 행이라도 실패하면 전체 취소"""
+    cursor = connection.cursor()
+    query = "INSERT INTO customer (name, phone) VALUES (%s, %s)"
+
+    cursor.executemany(query, [("가", "1"), ("나", "2"), ("다", "3")])
+    first = cursor.lastrowid
+    cursor.execute("SELECT customer_id FROM customer ORDER BY customer_id")
+
+    assert [row[0] for row in cursor.fetchall()] == [first, first + 1, first + 2]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        cursor.executemany(query, [("라", "4"), (None, "5")])
+
+    cursor.execute("SELECT COUNT(*) FROM customer")
+    assert cursor.fetchone()[0] == 3
+
+def test_transaction_rollback_and_foreign_keys(connection):
+    """start_transaction 후 rollback 취소, 외래 키 위반은 IntegrityError"""
+    cursor = connection.cursor()
+
+    connection.start_transaction()
+    cursor.execute("INSERT INTO customer (name) VALUES (%s)", ("롤백",))
+    connection.rollback()
+
+    cursor.execute("SELECT COUNT(*) FROM customer")
+    assert cursor.fetchone()[0] == 0
+
+    with pytest.raises(get_backend("sqlite").IntegrityError):
+        cursor.execute("INSERT INTO visit (customer_id, visit_date) VALUES (%s, %s)", (999, datetime(2024, 1, 1)))
+
+def test_transaction_takes_write_lock_on_first_write(tmp_path):
+    """조회만 한 트랜잭션은 다른 연결의 쓰기를 막지 않고, 첫 변경부터 쓰기 잠금을 가짐"""
+    path = str(tmp_path / "crm.sqlite3")
+    first = sqlite_backend.connect(path)
+    second = sqlite_backend.connect(path, timeout=0)
+    try:
+        first.start_transaction()
+        first.cursor().execute("SELECT COUNT(*) FROM customer")
+        second.cursor().execute("INSERT INTO customer (name) VALUES (%s)", ("다른 연결",))
+
+        first.cursor().execute("INSERT INTO customer (name) VALUES (%s)", ("작업 단위",))
+        with pytest.raises(sqlite3.OperationalError):
+            second.cursor().execute("INSERT INTO customer (name) VALUES (%s)", ("대기",))
+
+        first.commit()
+        second.cursor().execute("INSERT INTO customer (name) VALUES (%s)", ("커밋 후",))
+    finally:
+        first.close()
+        second.close()
+
+def test_backend_selection():
+    """백엔드 이름 선택과 알 수 없는 이름 오류"""
+    assert get_backend("sqlite").name == "sqlite"
+    assert not get_backend("sqlite").supports_replicas
+
+    with pytest.raises(ValueError):
+        get_backend("oracle")
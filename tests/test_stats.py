@@ -4,7 +4,7 @@
 
 import pytest
 import datetime
-from app.stats import get_total_visits_by_customer, get_total_payment_by_customer, get_customer_statistics, get_overall_statistics, get_monthly_statistics
+from app.stats import get_total_visits_by_customer, get_total_payment_by_customer, get_customer_statistics, get_overall_statistics, get_monthly_statistics, get_all_customer_statistics, get_monthly_series, get_recent_monthly_series, get_top_customers
 from app.customer import create_customer, search_customers, delete_customer
 from app.visit import create_visit, get_visits_by_customer, delete_visit
 from app.payment import create_payment, get_payments_by_customer, delete_payment
@@ -61,7 +61,7 @@ def test_get_total_payment_by_customer(sample_data):
     """고객별 총 결제 금액 조회 테스트"""
     customer_id, visit_id = sample_data
     total_payment = get_total_payment_by_customer(customer_id)
-    assert total_payment >= 75000
+    assert total_payment == 50000
 
 def test_get_customer_statistics(sample_data):
     """고객별 통계 정보 조회 테스트"""
@@ -72,6 +72,28 @@ def test_get_customer_statistics(sample_data):
     assert "total_visits" in stats
     assert "total_payment" in stats
 
+def test_get_top_customers(sample_data):
+    """기준별 상위 고객 조회 테스트 (전체 고객 통계의 내림차순 첫 행과 같은 값)"""
+    top = get_top_customers(1)
+
+    assert set(top) == {"total_payment", "total_visits", "avg_payment"}
+    for metric, rows in top.items():
+        assert len(rows) == 1
+        expected = get_all_customer_statistics(limit=1, sort=metric, order="desc")["items"][0]
+        assert rows[0][metric] == expected[metric]
+
+def test_get_all_customer_statistics(sample_data):
+    """전체 고객 통계 조회 테스트"""
+    customer_id, visit_id = sample_data
+    result = get_all_customer_statistics(limit=1, sort="total_payment", order="desc")
+    assert result["total"] >= 1
+    assert len(result["items"]) == 1
+    assert result["items"][0]["total_payment"] >= 50000
+
+    # 잘못된 정렬 기준은 이름순으로 대체
+    result = get_all_customer_statistics(sort="DROP TABLE customer")
+    assert result["sort"] == "name"
+
 def test_get_overall_statistics():
     """전체 통계 정보 조회 테스트"""
     stats = get_overall_statistics()
@@ -86,6 +108,20 @@ def test_get_monthly_statistics():
     assert stats is not None
     assert isinstance(stats, dict)
 
+def test_get_monthly_series(sample_data):
+    """기간별 월 통계 조회 테스트"""
+    now = datetime.datetime.now()
+    series = get_monthly_series(datetime.date(now.year, 1, 1), datetime.date(now.year + 1, 1, 1))
+    assert [item["month"] for item in series] == list(range(1, 13))
+
+    current = series[now.month - 1]["stats"]
+    assert current == get_monthly_statistics(now.year, now.month)
+
+def test_get_recent_monthly_series():
+    """최근 N개월 통계 조회 테스트 (연도 경계)"""
+    series = get_recent_monthly_series(3, today=datetime.date(2024, 2, 15))
+    assert [(item["year"], item["month"]) for item in series] == [(2024, 2), (2024, 1), (2023, 12)]
+
 def test_zero_data():
     """데이터가 없는 경우 테스트"""
     # 존재하지 않는 고객 ID로 테스트
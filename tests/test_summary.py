@@ -0,0 +1,65 @@
+"""
+고객 요약(customer_summary) 테스트 (DB 서버 없이 쿼리 결과 대체)
+"""
+
+import datetime
+import pytest
+from app import summary
+
+@pytest.fixture
+def queries(monkeypatch):
+    """execute_query 호출 기록 및 쿼리별 결과 지정"""
+    calls = {"queries": [], "results": {}}
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        calls["queries"].append((query, params))
+        for keyword, rows in calls["results"].items():
+            if keyword in query:
+                return list(rows)
+        return [] if fetch_all else None
+
+    monkeypatch.setattr(summary, "execute_query", fake_execute_query)
+    return calls
+
+def test_refresh_selected_customers(queries):
+    """지정한 고객만 요약 행을 삭제 후 원본에서 다시 계산"""
+    summary.refresh_customer_summary([3, 1, 3, None])
+
+    (delete, delete_params), (insert, insert_params) = queries["queries"]
+    assert delete.startswith("DELETE FROM customer_summary WHERE customer_id IN (%s, %s)")
+    assert delete_params == (1, 3)
+    assert insert.startswith("INSERT INTO customer_summary")
+    assert insert.count("IN (%s, %s)") == 3
+    assert insert_params == (1, 3) * 3
+
+def test_refresh_without_customers(queries):
+    """변경된 고객이 없으면 쿼리를 실행하지 않음"""
+    summary.refresh_customer_summary([])
+    assert summary.customers_of_visits([]) == set()
+    assert summary.customers_of_payments([]) == set()
+    assert queries["queries"] == []
+
+def test_check_reports_differences(queries):
+    """다시 계산한 값과 저장된 요약의 차이를 컬럼 단위로 보고"""
+    visit_date = datetime.datetime(2024, 3, 1, 10, 0)
+    expected = [
+        {"customer_id": 1, "visit_count": 2, "payment_total": 30000, "payment_count": 2,
+         "first_visit_date": visit_date, "last_visit_date": visit_date, "last_payment_datetime": visit_date},
+        {"customer_id": 2, "visit_count": 0, "payment_total": 0, "payment_count": 0,
+         "first_visit_date": None, "last_visit_date": None, "last_payment_datetime": None}
+    ]
+    stored = [
+        {"customer_id": 1, "visit_count": 2, "payment_total": 20000, "payment_count": 2,
+         "first_visit_date": visit_date, "last_visit_date": visit_date, "last_payment_datetime": visit_date},
+        {"customer_id": 9, "visit_count": 1, "payment_total": 0, "payment_count": 0,
+         "first_visit_date": None, "last_visit_date": None, "last_payment_datetime": None}
+    ]
+    queries["results"] = {"FROM customer_summary": stored, "FROM customer c": expected}
+
+    mismatches = summary.check_customer_summary()
+
+    # 요약 행이 없는 고객 2는 방문/결제가 없으므로 일치
+    assert mismatches == [
+        {"customer_id": 1, "column": "payment_total", "stored": 20000, "expected": 30000},
+        {"customer_id": 9, "column": "customer_id", "stored": 9, "expected": None}
+    ]
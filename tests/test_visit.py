@@ -4,7 +4,8 @@
 
 import pytest
 import datetime
-from app.visit import create_visit, get_visits, get_visits_by_customer, update_visit, delete_visit
+from app import visit as visit_module
+from app.visit import create_visit, get_visits, get_visits_by_customer, get_visit_by_visit_id, update_visit, delete_visit, create_visits_bulk, get_visits_page, get_recent_visits
 from tests.conftest import create_test_customer, create_test_visit, cleanup_test_data
 
 def test_create_visit(test_customer):
@@ -39,8 +40,13 @@ def test_get_visits_by_customer(test_visit):
 def test_update_visit(test_visit):
     """방문 수정 테스트"""
     customer_id, visit_id = test_visit
-    result = update_visit(visit_id, "수정된 메모")
+    visit_data = {
+        "visit_date": datetime.datetime.now(),
+        "memo": "수정된 메모"
+    }
+    result = update_visit(visit_id, visit_data)
     assert result is True
+    assert get_visit_by_visit_id(visit_id)["memo"] == "수정된 메모"
 
 def test_delete_visit():
     """방문 삭제 테스트"""
@@ -57,3 +63,45 @@ def test_delete_visit():
     # 확인
     visits = get_visits_by_customer(customer_id)
     assert len(visits) == 0
+
+def test_create_visits_bulk(test_customer):
+    """방문 일괄 등록 테스트"""
+    customer_id = test_customer
+
+    visits = [
+        {"customer_id": customer_id, "visit_date": datetime.datetime.now(), "memo": "일괄 방문1"},
+        {"customer_id": customer_id, "visit_date": "", "memo": "날짜 없음"},
+        {"customer_id": customer_id, "visit_date": "2024-01-02 10:30", "memo": "일괄 방문2"}
+    ]
+
+    result = create_visits_bulk(visits)
+    assert [error["index"] for error in result["errors"]] == [1]
+    assert len(get_visits_by_customer(customer_id)) == 2
+
+def test_get_visits_page(test_visit):
+    """방문 기록 페이지 조회 테스트"""
+    page = get_visits_page(limit=1)
+    assert len(page["items"]) == 1
+
+    if page["next_cursor"]:
+        next_page = get_visits_page(limit=1, after=page["next_cursor"])
+        assert next_page["items"][0]["visit_id"] != page["items"][0]["visit_id"]
+
+def test_get_recent_visits_query(monkeypatch):
+    """최근 방문 조회는 전체를 읽지 않고 LIMIT 으로 최신 N건만 조회하는지 테스트 (DB 결과 대체)"""
+    calls = []
+
+    def fake_execute_query(query, params=None, fetch_one=False, fetch_all=False, cache=False):
+        calls.append((query, params))
+        return []
+
+    monkeypatch.setattr(visit_module, "execute_query", fake_execute_query)
+
+    assert get_recent_visits(5) == []
+    get_recent_visits(5, before=datetime.datetime(2024, 1, 1))
+
+    (latest, latest_params), (older, older_params) = calls
+    assert "ORDER BY v.visit_date DESC, v.visit_id DESC LIMIT %s" in latest
+    assert "WHERE" not in latest and latest_params == (5,)
+    assert "WHERE v.visit_date < %s" in older
+    assert older_params == (datetime.datetime(2024, 1, 1), 5)